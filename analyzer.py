@@ -94,6 +94,66 @@ class ProsodyAnalysis:
         }
 
 
+@dataclass
+class IntensityContour:
+    """Intensity sampled on a regular time grid, as parallel arrays."""
+    times: np.ndarray  # Sample times in seconds (undefined frames dropped)
+    values: np.ndarray  # Intensity in dB at each time
+    start_time: float
+    end_time: float
+
+
+# Sampling step for the syllable and pause contours
+CONTOUR_TIME_STEP = 0.01  # 10ms
+
+
+def to_intensity(sound: parselmouth.Sound) -> parselmouth.Intensity:
+    """Compute the intensity object shared by the volume/tempo/rhythm/pause analyses."""
+    return call(sound, "To Intensity", 75, 0.0, "yes")
+
+
+def sample_intensity(
+    intensity: parselmouth.Intensity,
+    time_step: Optional[float] = None
+) -> IntensityContour:
+    """
+    Sample an intensity object with cubic interpolation every time_step seconds.
+
+    Args:
+        intensity: Praat Intensity object
+        time_step: Sampling step in seconds (defaults to the object's frame step)
+
+    Returns:
+        IntensityContour holding the defined samples
+    """
+    if time_step is None:
+        time_step = intensity.dx
+    start_time = intensity.xmin
+    end_time = intensity.xmax
+
+    # Same accumulated grid as stepping t += time_step, so sample times are
+    # bit-identical to sampling point by point
+    grid = []
+    t = start_time
+    while t <= end_time:
+        grid.append(t)
+        t += time_step
+
+    times = np.array(grid, dtype=np.float64)
+    values = np.empty(len(grid), dtype=np.float64)
+    get_value = intensity.get_value
+    for i, t in enumerate(grid):
+        values[i] = get_value(t, "CUBIC")
+
+    defined = ~np.isnan(values)
+    return IntensityContour(
+        times=times[defined],
+        values=values[defined],
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+
 def analyze_prosody(audio_data: np.ndarray, sample_rate: int) -> ProsodyAnalysis:
     """
     Perform complete prosody analysis on audio data.
@@ -109,12 +169,18 @@ def analyze_prosody(audio_data: np.ndarray, sample_rate: int) -> ProsodyAnalysis
     sound = parselmouth.Sound(audio_data, sampling_frequency=sample_rate)
     duration = sound.get_total_duration()
 
+    # Intensity is computed once; volume samples it at its own frame step,
+    # the syllable and pause analyses share one 10ms contour
+    intensity = to_intensity(sound)
+    frame_contour = sample_intensity(intensity)
+    contour = sample_intensity(intensity, CONTOUR_TIME_STEP)
+
     # Run all analyses
     pitch_result = analyze_pitch(sound)
-    volume_result = analyze_volume(sound)
-    tempo_result = analyze_tempo(sound)
-    rhythm_result = analyze_rhythm(sound)
-    pause_result = analyze_pauses(sound)
+    volume_result = analyze_volume(sound, frame_contour)
+    tempo_result = analyze_tempo(sound, contour)
+    rhythm_result = analyze_rhythm(sound, contour)
+    pause_result = analyze_pauses(sound, contour)
 
     # Calculate overall score (weighted average)
     overall = (
@@ -138,8 +204,9 @@ def analyze_prosody(audio_data: np.ndarray, sample_rate: int) -> ProsodyAnalysis
 
 def analyze_pitch(sound: parselmouth.Sound) -> PitchAnalysis:
     """Analyze pitch (F0) characteristics."""
-    # Extract pitch using autocorrelation method
-    pitch = call(sound, "To Pitch", 0.0, 75, 500)
+    # Extract pitch using Praat's autocorrelation method (already compiled C;
+    # called directly rather than through the Praat command interpreter)
+    pitch = sound.to_pitch(pitch_floor=75, pitch_ceiling=500)
 
     # Get pitch values (excluding unvoiced frames)
     pitch_values = pitch.selected_array["frequency"]
@@ -197,22 +264,15 @@ def analyze_pitch(sound: parselmouth.Sound) -> PitchAnalysis:
     )
 
 
-def analyze_volume(sound: parselmouth.Sound) -> VolumeAnalysis:
+def analyze_volume(
+    sound: parselmouth.Sound,
+    contour: Optional[IntensityContour] = None
+) -> VolumeAnalysis:
     """Analyze volume/intensity characteristics."""
-    intensity = call(sound, "To Intensity", 75, 0.0, "yes")
-
-    # Get intensity values
-    intensity_values = []
-    time_step = call(intensity, "Get time step")
-    start_time = call(intensity, "Get start time")
-    end_time = call(intensity, "Get end time")
-
-    t = start_time
-    while t <= end_time:
-        value = call(intensity, "Get value at time", t, "cubic")
-        if value is not None and not np.isnan(value):
-            intensity_values.append(value)
-        t += time_step
+    # Intensity sampled at its own frame step
+    if contour is None:
+        contour = sample_intensity(to_intensity(sound))
+    intensity_values = contour.values
 
     if len(intensity_values) == 0:
         return VolumeAnalysis(
@@ -225,8 +285,6 @@ def analyze_volume(sound: parselmouth.Sound) -> VolumeAnalysis:
             feedback="No intensity data detected."
         )
 
-    intensity_values = np.array(intensity_values)
-
     # Filter out silence/noise (values below 40 dB are typically background)
     speech_values = intensity_values[intensity_values > 40]
     if len(speech_values) < 10:
@@ -280,26 +338,18 @@ def analyze_volume(sound: parselmouth.Sound) -> VolumeAnalysis:
     )
 
 
-def analyze_tempo(sound: parselmouth.Sound) -> TempoAnalysis:
+def analyze_tempo(
+    sound: parselmouth.Sound,
+    contour: Optional[IntensityContour] = None
+) -> TempoAnalysis:
     """Analyze speaking tempo/rate."""
     # Use intensity to detect syllable nuclei (peaks)
-    intensity = call(sound, "To Intensity", 75, 0.0, "yes")
-
-    # Find peaks in intensity (approximate syllable count)
-    time_step = 0.01  # 10ms
-    start_time = call(intensity, "Get start time")
-    end_time = call(intensity, "Get end time")
-    duration = end_time - start_time
-
-    intensity_values = []
-    times = []
-    t = start_time
-    while t <= end_time:
-        value = call(intensity, "Get value at time", t, "cubic")
-        if value is not None and not np.isnan(value):
-            intensity_values.append(value)
-            times.append(t)
-        t += time_step
+    time_step = CONTOUR_TIME_STEP
+    if contour is None:
+        contour = sample_intensity(to_intensity(sound), time_step)
+    duration = contour.end_time - contour.start_time
+    intensity_values = contour.values
+    times = contour.times
 
     if len(intensity_values) < 10:
         return TempoAnalysis(
@@ -310,9 +360,6 @@ def analyze_tempo(sound: parselmouth.Sound) -> TempoAnalysis:
             feedback="Audio too short for tempo analysis."
         )
 
-    intensity_values = np.array(intensity_values)
-    times = np.array(times)
-
     # Find peaks (syllable nuclei) using scipy for better detection
     from scipy.signal import find_peaks
 
@@ -421,7 +468,25 @@ def analyze_tempo(sound: parselmouth.Sound) -> TempoAnalysis:
     )
 
 
-def analyze_rhythm(sound: parselmouth.Sound) -> RhythmAnalysis:
+def compute_npvi(durations: np.ndarray) -> float:
+    """
+    Compute the normalized Pairwise Variability Index of consecutive durations.
+
+    Vectorized over the whole array, so there is no per-pair Python loop.
+    Returns 0 when fewer than two durations are given.
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    if len(durations) < 2:
+        return 0.0
+    d1 = durations[:-1]
+    d2 = durations[1:]
+    return float(np.mean(np.abs(d1 - d2) / ((d1 + d2) / 2)) * 100)
+
+
+def analyze_rhythm(
+    sound: parselmouth.Sound,
+    contour: Optional[IntensityContour] = None
+) -> RhythmAnalysis:
     """
     Analyze speech rhythm using normalized Pairwise Variability Index (nPVI).
 
@@ -436,22 +501,12 @@ def analyze_rhythm(sound: parselmouth.Sound) -> RhythmAnalysis:
     """
     from scipy.signal import find_peaks
 
-    # Extract intensity for syllable detection
-    intensity = call(sound, "To Intensity", 75, 0.0, "yes")
-
-    time_step = 0.01
-    start_time = call(intensity, "Get start time")
-    end_time = call(intensity, "Get end time")
-
-    intensity_values = []
-    times = []
-    t = start_time
-    while t <= end_time:
-        value = call(intensity, "Get value at time", t, "cubic")
-        if value is not None and not np.isnan(value):
-            intensity_values.append(value)
-            times.append(t)
-        t += time_step
+    # Intensity contour for syllable detection
+    time_step = CONTOUR_TIME_STEP
+    if contour is None:
+        contour = sample_intensity(to_intensity(sound), time_step)
+    intensity_values = contour.values
+    times = contour.times
 
     if len(intensity_values) < 20:
         return RhythmAnalysis(
@@ -461,9 +516,6 @@ def analyze_rhythm(sound: parselmouth.Sound) -> RhythmAnalysis:
             feedback="Audio too short for rhythm analysis."
         )
 
-    intensity_values = np.array(intensity_values)
-    times = np.array(times)
-
     # Find syllable nuclei using scipy.signal.find_peaks
     # Minimum 100ms between syllables (10 samples at 10ms step)
     min_syllable_gap = int(0.1 / time_step)
@@ -485,11 +537,8 @@ def analyze_rhythm(sound: parselmouth.Sound) -> RhythmAnalysis:
         )
 
     # Calculate inter-syllable intervals
-    intervals = []
-    for i in range(len(peaks) - 1):
-        interval = times[peaks[i+1]] - times[peaks[i]]
-        if 0.05 < interval < 1.0:  # Filter outliers
-            intervals.append(interval)
+    intervals = np.diff(times[peak_indices])
+    intervals = intervals[(intervals > 0.05) & (intervals < 1.0)]  # Filter outliers
 
     if len(intervals) < 2:
         return RhythmAnalysis(
@@ -500,12 +549,7 @@ def analyze_rhythm(sound: parselmouth.Sound) -> RhythmAnalysis:
         )
 
     # Calculate normalized Pairwise Variability Index (nPVI)
-    pvi_sum = 0
-    for i in range(len(intervals) - 1):
-        d1, d2 = intervals[i], intervals[i+1]
-        pvi_sum += abs(d1 - d2) / ((d1 + d2) / 2)
-
-    pvi = (pvi_sum / (len(intervals) - 1)) * 100 if len(intervals) > 1 else 0
+    pvi = compute_npvi(intervals)
 
     # Determine if syllable-timed
     config = RHYTHM_CONFIG
@@ -543,24 +587,40 @@ def analyze_rhythm(sound: parselmouth.Sound) -> RhythmAnalysis:
     )
 
 
-def analyze_pauses(sound: parselmouth.Sound) -> PauseAnalysis:
+def find_pauses(
+    times: np.ndarray,
+    intensity_values: np.ndarray,
+    threshold: float,
+    min_pause: float
+) -> List[Tuple[float, float]]:
+    """
+    Find (start, end) times of runs below threshold lasting min_pause or more.
+
+    A pause starts at its first quiet frame and ends at the next loud frame
+    (or the last frame, for a pause that runs to the end). Runs are found by
+    edge detection on the quiet mask, without a per-frame Python loop.
+    """
+    quiet = np.concatenate(([0], (intensity_values < threshold).astype(np.int8), [0]))
+    edges = np.diff(quiet)
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.minimum(np.flatnonzero(edges == -1), len(times) - 1)
+    starts = times[run_starts]
+    ends = times[run_ends]
+    keep = ends - starts >= min_pause
+    return list(zip(starts[keep], ends[keep]))
+
+
+def analyze_pauses(
+    sound: parselmouth.Sound,
+    contour: Optional[IntensityContour] = None
+) -> PauseAnalysis:
     """Analyze pause patterns in speech."""
-    intensity = call(sound, "To Intensity", 75, 0.0, "yes")
     duration = sound.get_total_duration()
 
-    time_step = 0.01
-    start_time = call(intensity, "Get start time")
-    end_time = call(intensity, "Get end time")
-
-    intensity_values = []
-    times = []
-    t = start_time
-    while t <= end_time:
-        value = call(intensity, "Get value at time", t, "cubic")
-        if value is not None and not np.isnan(value):
-            intensity_values.append(value)
-            times.append(t)
-        t += time_step
+    if contour is None:
+        contour = sample_intensity(to_intensity(sound), CONTOUR_TIME_STEP)
+    intensity_values = contour.values
+    times = contour.times
 
     if len(intensity_values) < 10:
         return PauseAnalysis(
@@ -573,35 +633,12 @@ def analyze_pauses(sound: parselmouth.Sound) -> PauseAnalysis:
             feedback="Audio too short for pause analysis."
         )
 
-    intensity_values = np.array(intensity_values)
-    times = np.array(times)
-
     # Detect pauses (low intensity regions)
     threshold = np.percentile(intensity_values, 25)
     config = PAUSE_CONFIG
     min_pause = config["min_pause_duration"]
 
-    pauses = []
-    in_pause = False
-    pause_start = 0
-
-    for i, (t, val) in enumerate(zip(times, intensity_values)):
-        if val < threshold:
-            if not in_pause:
-                in_pause = True
-                pause_start = t
-        else:
-            if in_pause:
-                pause_duration = t - pause_start
-                if pause_duration >= min_pause:
-                    pauses.append((pause_start, t))
-                in_pause = False
-
-    # Handle pause at end
-    if in_pause:
-        pause_duration = times[-1] - pause_start
-        if pause_duration >= min_pause:
-            pauses.append((pause_start, times[-1]))
+    pauses = find_pauses(times, intensity_values, threshold, min_pause)
 
     pause_count = len(pauses)
     total_pause_duration = sum(p[1] - p[0] for p in pauses)
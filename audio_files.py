@@ -0,0 +1,53 @@
+"""Audio file loading, kept free of sounddevice so worker processes skip PortAudio."""
+
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+import soundfile as sf
+
+from config import SAMPLE_RATE
+
+# Read size for load_audio_resampled (~1 MB of float32 samples per block)
+_LOAD_BLOCK_BYTES = 1 << 20
+
+
+def load_audio_resampled(
+    filepath: Path,
+    target_sr: int = SAMPLE_RATE
+) -> Tuple[np.ndarray, int]:
+    """
+    Load audio as mono at target_sr, reading the file in blocks.
+
+    Channels are averaged block by block into a pre-sized mono buffer, so a
+    long stereo file never has its full multi-channel array in memory. The
+    result is resampled once with a polyphase filter; files already at
+    target_sr are returned as-is.
+
+    Args:
+        filepath: Path to audio file
+        target_sr: Output sample rate in Hz (defaults to the recording rate)
+
+    Returns:
+        Tuple of (audio_data as numpy array, sample_rate)
+    """
+    from math import gcd
+    from scipy.signal import resample_poly
+
+    with sf.SoundFile(filepath) as f:
+        source_sr = f.samplerate
+        block_frames = max(1, _LOAD_BLOCK_BYTES // (4 * f.channels))
+        audio_data = np.empty(f.frames, dtype=np.float32)
+        pos = 0
+        for block in f.blocks(blocksize=block_frames, dtype='float32', always_2d=True):
+            n = len(block)
+            audio_data[pos:pos + n] = block.mean(axis=1)
+            pos += n
+        audio_data = audio_data[:pos]
+
+    if source_sr == target_sr:
+        return audio_data, source_sr
+
+    g = gcd(source_sr, target_sr)
+    resampled = resample_poly(audio_data, target_sr // g, source_sr // g)
+    return resampled.astype(np.float32, copy=False), target_sr
@@ -0,0 +1,92 @@
+"""Static text for the `info` and `tips` commands.
+
+Kept free of typer, storage and analysis imports so main.py can serve these
+commands before loading the rest of the CLI.
+"""
+
+from rich.console import Console
+from rich.panel import Panel
+
+INFO_TEXT = """
+[bold cyan]1. Pitch[/bold cyan] (Intonation)
+   The highness or lowness of your voice. English uses wide pitch
+   variation to convey meaning and emotion.
+   [dim]Target: 100-150 Hz variation range[/dim]
+
+[bold cyan]2. Volume[/bold cyan] (Stress)
+   Loudness variation between stressed and unstressed syllables.
+   English emphasizes important words by making them louder.
+   [dim]Target: 6-10 dB contrast between stressed/unstressed[/dim]
+
+[bold cyan]3. Tempo[/bold cyan] (Speed)
+   Speaking rate and its variation. Good speakers vary speed for emphasis.
+   [dim]Target: 130-160 WPM with 15-25% variation[/dim]
+
+[bold cyan]4. Rhythm[/bold cyan] (Timing Pattern)
+   The timing between syllables. Spanish is syllable-timed (equal length),
+   English is stress-timed (stressed syllables longer).
+   [dim]Target: PVI of 55-65 (higher = more English-like)[/dim]
+
+[bold cyan]5. Pauses[/bold cyan] (Strategic Silence)
+   Deliberate breaks in speech for emphasis and breathing.
+   [dim]Target: 3-5 pauses per 30 seconds, 0.5-1.5s each[/dim]
+"""
+
+TIPS_TEXT = """
+[bold yellow]Common Patterns to Avoid:[/bold yellow]
+
+[bold]1. Monotone Speech[/bold]
+   Spanish speakers often use flatter pitch in English.
+   [green]Fix:[/green] Exaggerate pitch changes at first. Go higher on
+   stressed words, lower at sentence ends.
+
+[bold]2. Equal Syllable Length[/bold]
+   Spanish gives equal time to each syllable. English doesn't.
+   [green]Fix:[/green] Stretch stressed syllables, rush through unstressed ones.
+   "COMfortable" not "com-for-ta-ble"
+
+[bold]3. Missing Reductions[/bold]
+   Unstressed vowels in English become "schwa" (uh).
+   [green]Fix:[/green] "to" -> "tuh", "for" -> "fer", "can" -> "cun"
+
+[bold]4. No Strategic Pauses[/bold]
+   Spanish speakers often speak in continuous streams.
+   [green]Fix:[/green] Pause before important information to create anticipation.
+
+[bold]5. Harsh Intonation[/bold]
+   Falling pitch throughout can sound angry in English.
+   [green]Fix:[/green] Rise slightly on positive statements, only fall on negatives.
+
+[bold yellow]Practice Sentences:[/bold yellow]
+
+Try these with exaggerated prosody:
+
+  "I THINK we should WAIT until TOMORROW."
+  (Stress caps, reduce others, pause after "think")
+
+  "That's INteresting! Tell me MORE about it."
+  (Rise on "interesting", fall on "more")
+
+  "I NEver said she STOLE my MOney."
+  (Each word can be stressed for different meanings)
+"""
+
+
+# Panels are built once at import; the markup is left for the caller's
+# console to render, so no Console (and terminal probe) is created here
+_INFO_PANEL = Panel("[bold]The 5 Components of Prosody[/bold]", border_style="blue")
+_TIPS_PANEL = Panel("[bold]Tips for Spanish Speakers[/bold]", border_style="green")
+
+
+def show_info(console: Console) -> None:
+    """Print the prosody components overview."""
+    console.print()
+    console.print(_INFO_PANEL)
+    console.print(INFO_TEXT)
+
+
+def show_tips(console: Console) -> None:
+    """Print tips for Spanish speakers."""
+    console.print()
+    console.print(_TIPS_PANEL)
+    console.print(TIPS_TEXT)
@@ -1,21 +1,96 @@
 """AI coaching module using Gemini Flash for transcription and feedback."""
 
+import asyncio
+import atexit
+import io
 import os
+import hashlib
+import json
 import re
-import base64
 import tempfile
-from pathlib import Path
-from dataclasses import dataclass
+import time
+import base64
+from dataclasses import dataclass, replace
 from typing import Optional
 import numpy as np
 import soundfile as sf
 
 from google import genai
 from google.genai import types
-
-from config import GEMINI_API_KEY, GEMINI_MODEL, RHYTHM_LEVEL_CONFIG
+from rich.console import Group
+from rich.panel import Panel
+from rich.table import Table
+from rich import box
+
+from config import (
+    COACHING_CACHE_DIR,
+    GEMINI_API_KEY,
+    GEMINI_MODEL,
+    GEMINI_RETRY_ATTEMPTS,
+    GEMINI_TIMEOUT,
+    RHYTHM_LEVEL_CONFIG,
+    _LEVEL_TECHNIQUES_JOINED,
+)
 from analyzer import ProsodyAnalysis
 
+# Patterns used by the response parsers, compiled once at import
+_DIGITS_RE = re.compile(r'\d+')
+_WORD_DIGITS_RE = re.compile(r'\b(\d+)\b')
+_FLOAT_RE = re.compile(r'\b(\d+(?:\.\d+)?)\b')
+_IPA_RE = re.compile(r'/([^/]+)/')
+
+_RHYTHM_SECTION_RE = re.compile(
+    r'^(TRANSCRIPT|RHYTHM_SCORE|TIMING_FEEDBACK|STRESS_CORRECT|FUNCTION_REDUCTION|'
+    r'WORD_STRESS_ISSUES|LEVEL_PASS|TECHNIQUE_TIP|ENCOURAGEMENT|NPVI_ESTIMATE|'
+    r'CONNECTED_SPEECH):\s*(.*)$'
+)
+
+
+def _compile_section_re(names: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a pattern capturing each "NAME:" section and its body.
+
+    Group 1 is the section name, group 2 everything up to the next header
+    (or the end of the text). Headers must start a line.
+    """
+    alternation = "|".join(names)
+    return re.compile(
+        rf'^\s*({alternation}):(.*?)(?=^\s*(?:{alternation}):|\Z)',
+        re.MULTILINE | re.DOTALL,
+    )
+
+
+_DRILL_SECTION_RE = _compile_section_re(
+    ("TEXT", "IPA", "PATTERN", "FOCUS", "TIP", "TECHNIQUE")
+)
+
+# Section headers of the coaching response, in prompt order
+_COACHING_KEYS = (
+    "TRANSCRIPT:",
+    "GRAMMAR_ISSUES:",
+    "SUGGESTED_REVISION:",
+    "COACHING_TIPS:",
+    "VOCAL_CONFIDENCE:",
+    "FILLER_WORDS:",
+    "PRONUNCIATION_ISSUES:",
+    "FLUENCY:",
+    "AI_PROSODY:",
+    "OVERALL:",
+)
+
+_VALID_RECS = frozenset({"advance", "practice_more", "review_basics"})
+
+_HEADER_INITIALS = frozenset("TtKk")
+_HEADER_STRIP_RE = re.compile(r'(?i)(?:TEXT|KEY[_ ]SOUNDS)\s*:')
+
+_SENT_END_CHARS = frozenset(".!?")
+_BULLET_CHARS = frozenset("-•*")
+
+# Last sentence-ending punctuation mark in a string
+_LAST_SENT_END_RE = re.compile(r'[.!?](?=[^.!?]*$)')
+
+_PROSODY_CATEGORIES = ("PITCH", "VOLUME", "TEMPO", "RHYTHM", "PAUSES", "NATURALNESS")
+
 
 @dataclass
 class RhythmCoachingResult:
@@ -39,7 +114,7 @@ class RhythmCoachingResult:
     linked_ipa: str = ""  # IPA for the connected speech version
 
 
-@dataclass
+@dataclass(slots=True)
 class CoachingResult:
     """Results from AI coaching analysis."""
     transcript: str
@@ -58,8 +133,21 @@ class CoachingResult:
     ai_prosody: dict = None  # {"pitch": {"score": 7, "feedback": "..."}, "rhythm": {...}, ...}
 
 
-def get_client() -> genai.Client:
-    """Get Gemini client with API key."""
+# Shared sync client, so repeat requests reuse its pooled HTTPS connection
+# instead of paying DNS/TCP/TLS setup each time
+_client: genai.Client | None = None
+_client_api_key = ""
+
+# Bound every request so a stalled call fails (after one retry) instead of
+# hanging the CLI; the SDK retries timeouts, connect errors and 429/5xx
+_HTTP_OPTIONS = types.HttpOptions(
+    timeout=GEMINI_TIMEOUT * 1000,  # milliseconds
+    retry_options=types.HttpRetryOptions(attempts=GEMINI_RETRY_ATTEMPTS),
+)
+
+
+def _new_client() -> genai.Client:
+    """Create a Gemini client with API key."""
     api_key = os.environ.get("GEMINI_API_KEY") or GEMINI_API_KEY
     if not api_key:
         raise ValueError(
@@ -67,7 +155,25 @@ def get_client() -> genai.Client:
             "  1. Set environment variable: export GEMINI_API_KEY=your_key\n"
             "  2. Or update config.py with your key"
         )
-    return genai.Client(api_key=api_key)
+    return genai.Client(api_key=api_key, http_options=_HTTP_OPTIONS)
+
+
+def get_client() -> genai.Client:
+    """Get the shared Gemini client, creating it on first use or key change."""
+    global _client, _client_api_key
+    api_key = os.environ.get("GEMINI_API_KEY") or GEMINI_API_KEY
+    if _client is None or api_key != _client_api_key:
+        if _client is not None:
+            _client.close()
+        _client = _new_client()
+        _client_api_key = api_key
+    return _client
+
+
+@atexit.register
+def _close_client() -> None:
+    if _client is not None:
+        _client.close()
 
 
 def extract_text_from_response(response) -> str:
@@ -86,7 +192,6 @@ def extract_text_from_response(response) -> str:
 
     # Fallback: suppress stdout/stderr and use .text
     import sys
-    import io
     old_stdout, old_stderr = sys.stdout, sys.stderr
     sys.stdout = sys.stderr = io.StringIO()
     try:
@@ -97,9 +202,9 @@ def extract_text_from_response(response) -> str:
         sys.stdout, sys.stderr = old_stdout, old_stderr
 
 
-def audio_to_base64(audio_data: np.ndarray, sample_rate: int, trim: bool = True) -> str:
+def audio_to_flac_bytes(audio_data: np.ndarray, sample_rate: int, trim: bool = True) -> bytes:
     """
-    Convert audio numpy array to base64-encoded FLAC (compressed, lossless).
+    Convert audio numpy array to FLAC bytes (compressed, lossless).
 
     Args:
         audio_data: Audio samples as numpy array
@@ -107,7 +212,7 @@ def audio_to_base64(audio_data: np.ndarray, sample_rate: int, trim: bool = True)
         trim: If True, trim silence from start/end before encoding
 
     Returns:
-        Base64-encoded FLAC audio string
+        FLAC-encoded audio bytes
     """
     from recorder import trim_silence
 
@@ -115,108 +220,199 @@ def audio_to_base64(audio_data: np.ndarray, sample_rate: int, trim: bool = True)
     if trim:
         audio_data = trim_silence(audio_data, sample_rate)
 
-    with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
-        temp_path = f.name
-        # Save as FLAC (50-60% smaller than WAV, lossless quality)
-        sf.write(temp_path, audio_data, sample_rate, format='flac')
-
-        with open(temp_path, "rb") as audio_file:
-            audio_bytes = audio_file.read()
-
-        # Clean up temp file
-        Path(temp_path).unlink()
-
-    return base64.b64encode(audio_bytes).decode("utf-8")
+    # Encode in memory as FLAC (50-60% smaller than WAV, lossless quality)
+    buffer = io.BytesIO()
+    sf.write(buffer, audio_data, sample_rate, format='flac')
+    return buffer.getvalue()
 
 
-def analyze_with_coach(
-    audio_data: np.ndarray,
-    sample_rate: int,
-    prosody: ProsodyAnalysis
-) -> CoachingResult:
+def audio_to_base64(audio_data: np.ndarray, sample_rate: int, trim: bool = True) -> str:
     """
-    Send audio and prosody analysis to Gemini for coaching feedback.
+    Convert audio numpy array to base64-encoded FLAC (compressed, lossless).
 
     Args:
         audio_data: Audio samples as numpy array
         sample_rate: Sample rate in Hz
-        prosody: Results from prosody analysis
+        trim: If True, trim silence from start/end before encoding
 
     Returns:
-        CoachingResult with transcription, grammar, and coaching tips
+        Base64-encoded FLAC audio string
     """
-    client = get_client()
+    return base64.b64encode(audio_to_flac_bytes(audio_data, sample_rate, trim)).decode("utf-8")
 
-    # Convert audio to base64
-    audio_b64 = audio_to_base64(audio_data, sample_rate)
 
-    # Build the prompt with prosody context
-    prompt = build_coaching_prompt(prosody)
+# Shared generation config for audio coaching calls, built once at import
+_COACHING_CONFIG = types.GenerateContentConfig(
+    temperature=0.3,  # Lower temperature for more consistent analysis
+    max_output_tokens=8192,
+)
 
-    # Create the content with audio
-    contents = [
-        types.Content(
-            role="user",
-            parts=[
-                types.Part.from_bytes(
-                    data=base64.b64decode(audio_b64),
-                    mime_type="audio/flac"
-                ),
-                types.Part.from_text(text=prompt),
-            ],
-        ),
-    ]
+_RHYTHM_COACHING_CONFIG = types.GenerateContentConfig(
+    temperature=0.3,
+    max_output_tokens=4096,
+)
 
-    # Configure generation
-    generate_config = types.GenerateContentConfig(
-        temperature=0.3,  # Lower temperature for more consistent analysis
-        max_output_tokens=8192,
-    )
 
-    # Call Gemini
-    response = client.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=contents,
-        config=generate_config,
-    )
+# Most coaching responses kept on disk; least recently used go first
+_COACHING_CACHE_MAX_ENTRIES = 256
 
-    # Parse the response
-    return parse_coaching_response(extract_text_from_response(response))
 
+def _coaching_cache_key(prompt: str, audio_bytes: bytes, config: types.GenerateContentConfig) -> str:
+    """Digest of everything that determines a coaching response."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (GEMINI_MODEL, config.model_dump_json(exclude_none=True), prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(audio_bytes)
+    return digest.hexdigest()
 
-def analyze_with_coach_streaming(
-    audio_data: np.ndarray,
-    sample_rate: int,
-    prosody: ProsodyAnalysis,
-    on_chunk: callable = None
-) -> CoachingResult:
+
+def _invoke_gemini(
+    prompt: str,
+    audio_bytes: bytes,
+    *,
+    stream: bool = False,
+    on_chunk: callable = None,
+    config: types.GenerateContentConfig = _COACHING_CONFIG,
+    use_cache: bool = False,
+) -> str:
     """
-    Send audio to Gemini with streaming response for faster perceived feedback.
+    Send a prompt plus FLAC audio to Gemini and return the response text.
+
+    With use_cache, responses are kept on disk by a digest of model, config,
+    prompt and audio, so re-sending the same file with the same prompt
+    (e.g. re-running `analyze --file --coach`) is answered without a
+    request. Live takes never repeat, so callers leave it off for them.
 
     Args:
-        audio_data: Audio samples as numpy array
-        sample_rate: Sample rate in Hz
-        prosody: Results from prosody analysis
-        on_chunk: Optional callback called with each text chunk as it arrives
+        prompt: Prompt text to send after the audio
+        audio_bytes: FLAC-encoded audio bytes
+        stream: If True, use the streaming API
+        on_chunk: Optional callback called with each text chunk (streaming only);
+            a cache hit calls it once with the whole response
+        config: Generation config to use
+        use_cache: Look up and store the response in the coaching cache
 
     Returns:
-        CoachingResult with transcription, grammar, and coaching tips
+        Full response text (thinking parts filtered out)
     """
-    client = get_client()
+    cache_path = _coaching_cache_path(prompt, audio_bytes, config) if use_cache else None
+    if cache_path and (text := _read_cached_response(cache_path)) is not None:
+        if stream and on_chunk:
+            on_chunk(text, text)
+        return text
+
+    text = _request_gemini(prompt, audio_bytes, stream, on_chunk, config)
+
+    if cache_path and text:
+        _write_cached_response(cache_path, text)
+    return text
+
+
+async def _invoke_gemini_async(
+    prompt: str,
+    audio_bytes: bytes,
+    *,
+    on_chunk: callable = None,
+    config: types.GenerateContentConfig = _COACHING_CONFIG,
+    use_cache: bool = False,
+) -> str:
+    """
+    Streaming _invoke_gemini on the aio client, for use inside an event loop.
+
+    Chunks are read with `async for`, so the loop is free for other tasks
+    between them. Shares _invoke_gemini's response cache.
+    """
+    cache_path = _coaching_cache_path(prompt, audio_bytes, config) if use_cache else None
+    if cache_path and (text := _read_cached_response(cache_path)) is not None:
+        if on_chunk:
+            on_chunk(text, text)
+        return text
 
-    # Convert audio to base64 (with silence trimming)
-    audio_b64 = audio_to_base64(audio_data, sample_rate)
+    # Not the shared client: its aio connections would outlive the event
+    # loop that the caller's asyncio.run tears down
+    client = _new_client()
+    accumulated_text = ""
+    try:
+        async for chunk in await client.aio.models.generate_content_stream(
+            model=GEMINI_MODEL,
+            contents=_audio_prompt_contents(prompt, audio_bytes),
+            config=config,
+        ):
+            chunk_text = extract_text_from_response(chunk)
+            if chunk_text:
+                accumulated_text += chunk_text
+                if on_chunk:
+                    on_chunk(chunk_text, accumulated_text)
+    finally:
+        await client.aio.aclose()
+        client.close()
 
-    # Build the prompt with prosody context
-    prompt = build_coaching_prompt(prosody)
+    if cache_path and accumulated_text:
+        _write_cached_response(cache_path, accumulated_text)
+    return accumulated_text
 
-    # Create the content with audio
-    contents = [
+
+def _coaching_cache_path(prompt: str, audio_bytes: bytes, config: types.GenerateContentConfig):
+    """Cache file for a coaching request."""
+    return COACHING_CACHE_DIR / f"{_coaching_cache_key(prompt, audio_bytes, config)}.txt"
+
+
+def _read_cached_response(cache_path) -> str | None:
+    """Return a cached response, or None on a miss or unreadable entry."""
+    try:
+        text = cache_path.read_text(encoding="utf-8")
+        os.utime(cache_path)  # Mark as recently used for LRU pruning
+    except OSError:
+        return None
+    return text
+
+
+def _write_cached_response(cache_path, text: str) -> None:
+    """Store a response atomically, then prune to the LRU cap; best-effort."""
+    try:
+        COACHING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write beside the entry and rename, so an interrupted write can
+        # never leave a truncated response that later reads as a hit
+        fd, tmp_path = tempfile.mkstemp(dir=COACHING_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        _prune_coaching_cache()
+    except OSError:
+        pass
+
+
+def _prune_coaching_cache() -> None:
+    """Drop the least recently used entries beyond _COACHING_CACHE_MAX_ENTRIES."""
+    entries = []
+    for path in COACHING_CACHE_DIR.glob("*.txt"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            pass  # Removed concurrently
+    if len(entries) <= _COACHING_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - _COACHING_CACHE_MAX_ENTRIES]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _audio_prompt_contents(prompt: str, audio_bytes: bytes) -> list:
+    """Request contents: the FLAC audio followed by the prompt text."""
+    return [
         types.Content(
             role="user",
             parts=[
                 types.Part.from_bytes(
-                    data=base64.b64decode(audio_b64),
+                    data=audio_bytes,
                     mime_type="audio/flac"
                 ),
                 types.Part.from_text(text=prompt),
@@ -224,71 +420,110 @@ def analyze_with_coach_streaming(
         ),
     ]
 
-    # Configure generation
-    generate_config = types.GenerateContentConfig(
-        temperature=0.3,
-        max_output_tokens=8192,
-    )
+
+def _request_gemini(
+    prompt: str,
+    audio_bytes: bytes,
+    stream: bool,
+    on_chunk: callable,
+    config: types.GenerateContentConfig,
+) -> str:
+    """Make the Gemini request behind _invoke_gemini."""
+    client = get_client()
+    contents = _audio_prompt_contents(prompt, audio_bytes)
+
+    if not stream:
+        response = client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=contents,
+            config=config,
+        )
+        return extract_text_from_response(response)
 
     # Use streaming for faster perceived response
     accumulated_text = ""
     for chunk in client.models.generate_content_stream(
         model=GEMINI_MODEL,
         contents=contents,
-        config=generate_config,
+        config=config,
     ):
         chunk_text = extract_text_from_response(chunk)
         if chunk_text:
             accumulated_text += chunk_text
             if on_chunk:
                 on_chunk(chunk_text, accumulated_text)
+    return accumulated_text
+
+
+def analyze_with_coach(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    prosody: ProsodyAnalysis
+) -> CoachingResult:
+    """
+    Send audio and prosody analysis to Gemini for coaching feedback.
+
+    Args:
+        audio_data: Audio samples as numpy array
+        sample_rate: Sample rate in Hz
+        prosody: Results from prosody analysis
+
+    Returns:
+        CoachingResult with transcription, grammar, and coaching tips
+    """
+    audio_bytes = audio_to_flac_bytes(audio_data, sample_rate)
+    prompt = build_coaching_prompt(prosody)
+    return parse_coaching_response(_invoke_gemini(prompt, audio_bytes))
+
+
+def analyze_with_coach_streaming(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    prosody: ProsodyAnalysis,
+    on_chunk: callable = None
+) -> CoachingResult:
+    """
+    Send audio to Gemini with streaming response for faster perceived feedback.
+
+    Args:
+        audio_data: Audio samples as numpy array
+        sample_rate: Sample rate in Hz
+        prosody: Results from prosody analysis
+        on_chunk: Optional callback called with each text chunk as it arrives
 
-    # Parse the complete response
-    return parse_coaching_response(accumulated_text)
+    Returns:
+        CoachingResult with transcription, grammar, and coaching tips
+    """
+    audio_bytes = audio_to_flac_bytes(audio_data, sample_rate)
+    prompt = build_coaching_prompt(prosody)
+    return parse_coaching_response(
+        _invoke_gemini(prompt, audio_bytes, stream=True, on_chunk=on_chunk)
+    )
 
 
 def analyze_with_coach_practice(
     audio_data: np.ndarray,
     sample_rate: int,
     prosody: ProsodyAnalysis,
-    expected_text: str
+    expected_text: str,
+    audio_bytes: bytes | None = None,
+    on_chunk: callable = None,
 ) -> CoachingResult:
     """
     Analyze audio against expected text for practice mode.
 
     Compares pronunciation and evaluates how well the user read the given text.
+    Pass audio_bytes when the FLAC encoding was already done (e.g. alongside
+    prosody analysis) to skip re-encoding. Passing on_chunk streams the
+    response and calls it with each text chunk as it arrives.
     """
-    client = get_client()
-    audio_b64 = audio_to_base64(audio_data, sample_rate)
-
+    if audio_bytes is None:
+        audio_bytes = audio_to_flac_bytes(audio_data, sample_rate)
     prompt = build_practice_prompt(prosody, expected_text)
-
-    contents = [
-        types.Content(
-            role="user",
-            parts=[
-                types.Part.from_bytes(
-                    data=base64.b64decode(audio_b64),
-                    mime_type="audio/flac"
-                ),
-                types.Part.from_text(text=prompt),
-            ],
-        ),
-    ]
-
-    generate_config = types.GenerateContentConfig(
-        temperature=0.3,
-        max_output_tokens=8192,
-    )
-
-    response = client.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=contents,
-        config=generate_config,
+    return parse_coaching_response(
+        _invoke_gemini(prompt, audio_bytes, stream=on_chunk is not None, on_chunk=on_chunk)
     )
 
-    return parse_coaching_response(extract_text_from_response(response))
-
 
 def build_practice_prompt(prosody: ProsodyAnalysis, expected_text: str) -> str:
     """Build prompt for practice mode with expected text comparison."""
@@ -524,7 +759,8 @@ OVERALL:
 def analyze_parallel(
     audio_data: np.ndarray,
     sample_rate: int,
-    on_chunk: callable = None
+    on_chunk: callable = None,
+    use_cache: bool = False,
 ) -> tuple:
     """
     Run prosody analysis and Gemini coaching in parallel for faster results.
@@ -533,6 +769,7 @@ def analyze_parallel(
         audio_data: Audio samples as numpy array
         sample_rate: Sample rate in Hz
         on_chunk: Optional callback for streaming chunks
+        use_cache: Use the coaching response cache (for file inputs)
 
     Returns:
         Tuple of (ProsodyAnalysis, CoachingResult)
@@ -541,51 +778,15 @@ def analyze_parallel(
     from analyzer import analyze_prosody
 
     # Prepare audio for Gemini (with trimming)
-    audio_b64 = audio_to_base64(audio_data, sample_rate)
+    audio_bytes = audio_to_flac_bytes(audio_data, sample_rate)
 
     def run_gemini():
-        client = get_client()
         prompt = build_coaching_prompt_standalone()
-
-        contents = [
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part.from_bytes(
-                        data=base64.b64decode(audio_b64),
-                        mime_type="audio/flac"
-                    ),
-                    types.Part.from_text(text=prompt),
-                ],
-            ),
-        ]
-
-        generate_config = types.GenerateContentConfig(
-            temperature=0.3,
-            max_output_tokens=8192,
-        )
-
-        if on_chunk:
-            # Streaming mode
-            accumulated_text = ""
-            for chunk in client.models.generate_content_stream(
-                model=GEMINI_MODEL,
-                contents=contents,
-                config=generate_config,
-            ):
-                chunk_text = extract_text_from_response(chunk)
-                if chunk_text:
-                    accumulated_text += chunk_text
-                    on_chunk(chunk_text, accumulated_text)
-            return parse_coaching_response(accumulated_text)
-        else:
-            # Non-streaming mode
-            response = client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=contents,
-                config=generate_config,
+        return parse_coaching_response(
+            _invoke_gemini(
+                prompt, audio_bytes, stream=on_chunk is not None, on_chunk=on_chunk, use_cache=use_cache
             )
-            return parse_coaching_response(extract_text_from_response(response))
+        )
 
     def run_prosody():
         return analyze_prosody(audio_data, sample_rate)
@@ -602,40 +803,62 @@ def analyze_parallel(
     return prosody, coaching
 
 
+async def analyze_parallel_async(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    on_chunk: callable = None,
+    use_cache: bool = False,
+) -> tuple:
+    """
+    Async analyze_parallel: stream Gemini coaching while prosody runs.
+
+    Prosody analysis and FLAC encoding run on worker threads; the Gemini
+    response is read natively with the aio client on the event loop.
+
+    Args:
+        audio_data: Audio samples as numpy array
+        sample_rate: Sample rate in Hz
+        on_chunk: Optional callback called with each text chunk
+        use_cache: Use the coaching response cache (for file inputs)
+
+    Returns:
+        Tuple of (ProsodyAnalysis, CoachingResult)
+    """
+    from analyzer import analyze_prosody
+
+    prosody_task = asyncio.create_task(asyncio.to_thread(analyze_prosody, audio_data, sample_rate))
+    audio_bytes = await asyncio.to_thread(audio_to_flac_bytes, audio_data, sample_rate)
+
+    response_text = await _invoke_gemini_async(
+        build_coaching_prompt_standalone(), audio_bytes, on_chunk=on_chunk, use_cache=use_cache
+    )
+    coaching = parse_coaching_response(response_text)
+
+    return await prosody_task, coaching
+
+
 def parse_coaching_response(response_text: str) -> CoachingResult:
     """Parse Gemini's response into structured CoachingResult."""
-    sections = {
-        "TRANSCRIPT:": "",
-        "GRAMMAR_ISSUES:": "",
-        "SUGGESTED_REVISION:": "",
-        "COACHING_TIPS:": "",
-        "VOCAL_CONFIDENCE:": "",
-        "FILLER_WORDS:": "",
-        "PRONUNCIATION_ISSUES:": "",
-        "FLUENCY:": "",
-        "AI_PROSODY:": "",
-        "OVERALL:": "",
-    }
+    sections = dict.fromkeys(_COACHING_KEYS, "")
 
     current_section = None
-    lines = response_text.strip().split("\n")
+    lines = response_text.splitlines()
 
     for line in lines:
         line_stripped = line.strip()
 
-        # Check if this line starts a new section
-        for section_key in sections.keys():
-            if line_stripped.startswith(section_key):
-                current_section = section_key
-                # Get any content on the same line after the section header
-                remaining = line_stripped[len(section_key):].strip()
-                if remaining:
-                    sections[current_section] = remaining + "\n"
-                break
-        else:
+        # Check if this line starts a new section (one C-level test for all keys)
+        if line_stripped.startswith(_COACHING_KEYS):
+            current_section = next(
+                key for key in _COACHING_KEYS if line_stripped.startswith(key)
+            )
+            # Get any content on the same line after the section header
+            remaining = line_stripped[len(current_section):].strip()
+            if remaining:
+                sections[current_section] = remaining + "\n"
+        elif current_section:
             # Not a section header, add to current section
-            if current_section:
-                sections[current_section] += line + "\n"
+            sections[current_section] += line + "\n"
 
     # Parse grammar issues
     grammar_issues = []
@@ -667,12 +890,14 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
     coaching_tips = []
     tips_text = sections["COACHING_TIPS:"].strip()
     for line in tips_text.split("\n"):
+        if len(coaching_tips) >= 5:  # Limit to 5 tips
+            break
         line = line.strip()
         if line and not line.startswith("["):
             # Remove bullet points, numbers, etc.
             if line[0].isdigit() and (line[1] == "." or line[1] == ")"):
                 line = line[2:].strip()
-            elif line[0] in "-•*":
+            elif line[0] in _BULLET_CHARS:
                 line = line[1:].strip()
             if line:
                 coaching_tips.append(line)
@@ -690,13 +915,13 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
                 confidence_feedback = parts[1].strip()
             except ValueError:
                 # Try to extract number from the first part
-                numbers = re.findall(r'\d+', parts[0])
+                numbers = _DIGITS_RE.findall(parts[0])
                 if numbers:
                     confidence_score = min(10, max(1, int(numbers[0])))
                 confidence_feedback = parts[1].strip() if len(parts) > 1 else ""
         else:
             # Try to extract score from text
-            numbers = re.findall(r'\b(\d+)\b', confidence_text)
+            numbers = _WORD_DIGITS_RE.findall(confidence_text)
             if numbers:
                 confidence_score = min(10, max(1, int(numbers[0])))
             confidence_feedback = confidence_text
@@ -711,12 +936,12 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
             try:
                 filler_word_count = int(parts[0].strip())
             except ValueError:
-                numbers = re.findall(r'\d+', parts[0])
+                numbers = _DIGITS_RE.findall(parts[0])
                 if numbers:
                     filler_word_count = int(numbers[0])
             filler_words_detail = parts[1].strip() if len(parts) > 1 else ""
         else:
-            numbers = re.findall(r'\b(\d+)\b', filler_text)
+            numbers = _WORD_DIGITS_RE.findall(filler_text)
             if numbers:
                 filler_word_count = int(numbers[0])
             filler_words_detail = filler_text
@@ -737,7 +962,7 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
                     tip = parts[2].strip() if len(parts) > 2 else ""
                     # Extract IPA from example if present
                     ipa = ""
-                    ipa_match = re.search(r'/([^/]+)/', example)
+                    ipa_match = _IPA_RE.search(example)
                     if ipa_match:
                         ipa = ipa_match.group(1)
                     pronunciation_issues.append({
@@ -757,12 +982,12 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
             try:
                 fluency_score = int(parts[0].strip())
             except ValueError:
-                numbers = re.findall(r'\d+', parts[0])
+                numbers = _DIGITS_RE.findall(parts[0])
                 if numbers:
                     fluency_score = min(10, max(1, int(numbers[0])))
             fluency_feedback = parts[1].strip() if len(parts) > 1 else ""
         else:
-            numbers = re.findall(r'\b(\d+)\b', fluency_text)
+            numbers = _WORD_DIGITS_RE.findall(fluency_text)
             if numbers:
                 fluency_score = min(10, max(1, int(numbers[0])))
             fluency_feedback = fluency_text
@@ -771,7 +996,6 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
     ai_prosody = {}
     ai_prosody_text = sections["AI_PROSODY:"].strip()
     if ai_prosody_text:
-        prosody_categories = ["PITCH", "VOLUME", "TEMPO", "RHYTHM", "PAUSES", "NATURALNESS"]
         for line in ai_prosody_text.split("\n"):
             line = line.strip()
             if not line or line.startswith("["):
@@ -779,37 +1003,37 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
             # Remove leading dash/bullet
             if line.startswith("-"):
                 line = line[1:].strip()
-            # Check for each category
-            for category in prosody_categories:
-                if line.upper().startswith(category):
-                    # Format: "CATEGORY: SCORE | feedback" or "CATEGORY: SCORE/10 | feedback"
-                    rest = line[len(category):].strip()
-                    if rest.startswith(":"):
-                        rest = rest[1:].strip()
-                    score = 0
-                    feedback = rest
-                    if "|" in rest:
-                        score_part, feedback = rest.split("|", 1)
-                        feedback = feedback.strip()
-                        # Extract number from score part
-                        numbers = re.findall(r'\d+', score_part)
-                        if numbers:
-                            score = min(10, max(1, int(numbers[0])))
-                    else:
-                        numbers = re.findall(r'\b(\d+)\b', rest)
-                        if numbers:
-                            score = min(10, max(1, int(numbers[0])))
-                    ai_prosody[category.lower()] = {
-                        "score": score,
-                        "feedback": feedback
-                    }
-                    break
+            # Format: "CATEGORY: SCORE | feedback" or "CATEGORY: SCORE/10 | feedback"
+            upper = line.upper()
+            category = next((c for c in _PROSODY_CATEGORIES if upper.startswith(c)), None)
+            if category is None:
+                continue
+            rest = line[len(category):].strip()
+            if rest.startswith(":"):
+                rest = rest[1:].strip()
+            score = 0
+            feedback = rest
+            if "|" in rest:
+                score_part, feedback = rest.split("|", 1)
+                feedback = feedback.strip()
+                # Extract number from score part
+                numbers = _DIGITS_RE.findall(score_part)
+                if numbers:
+                    score = min(10, max(1, int(numbers[0])))
+            else:
+                numbers = _WORD_DIGITS_RE.findall(rest)
+                if numbers:
+                    score = min(10, max(1, int(numbers[0])))
+            ai_prosody[category.lower()] = {
+                "score": score,
+                "feedback": feedback
+            }
 
     return CoachingResult(
         transcript=sections["TRANSCRIPT:"].strip(),
         grammar_issues=grammar_issues,
         suggested_revision=sections["SUGGESTED_REVISION:"].strip(),
-        coaching_tips=coaching_tips[:5],  # Limit to 5 tips
+        coaching_tips=coaching_tips,
         overall_feedback=sections["OVERALL:"].strip(),
         confidence_score=confidence_score,
         confidence_feedback=confidence_feedback,
@@ -822,15 +1046,60 @@ def parse_coaching_response(response_text: str) -> CoachingResult:
     )
 
 
+# Score (0-10) -> display style lookups for the coaching panels
+_CONFIDENCE_STYLE = tuple(
+    ("red", "Needs Work") if s < 4 else ("yellow", "Moderate") if s < 7 else ("green", "Confident")
+    for s in range(11)
+)
+_FLUENCY_STYLE = tuple(
+    ("red", "Choppy") if s < 4 else ("yellow", "Moderate") if s < 7 else ("green", "Fluent")
+    for s in range(11)
+)
+_PROSODY_SCORE_COLOR = tuple(
+    "red" if s < 5 else "yellow" if s < 7 else "green"
+    for s in range(11)
+)
+
+# Display order and row labels for the AI prosody table
+_PROSODY_DISPLAY_ORDER = ("pitch", "volume", "tempo", "rhythm", "pauses", "naturalness")
+_PROSODY_CATEGORY_DISPLAY = {
+    "pitch": "Pitch",
+    "volume": "Volume",
+    "tempo": "Tempo",
+    "rhythm": "Rhythm",
+    "pauses": "Pauses",
+    "naturalness": "[bold]Naturalness[/bold]",
+}
+
+# (header, style, width, justify) for the AI prosody table columns
+_PROSODY_COLUMNS = (
+    ("Aspect", "cyan", 12, "left"),
+    ("Score", None, 8, "center"),
+    ("AI Observation", "dim", None, "left"),
+)
+
+
+def _new_prosody_table() -> Table:
+    """Create an empty AI prosody table with its columns configured."""
+    table = Table(
+        title="[bold cyan]AI PROSODY ANALYSIS[/bold cyan] [dim](perceived from audio)[/dim]",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold",
+    )
+    for header, style, width, justify in _PROSODY_COLUMNS:
+        table.add_column(header, style=style, width=width, justify=justify)
+    return table
+
+
 def display_coaching(result: CoachingResult, console) -> None:
     """Display coaching results using rich console."""
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich import box
+    # Collect everything and render it with a single print
+    parts = []
 
     # Transcript section
-    console.print()
-    console.print(Panel(
+    parts.append("")
+    parts.append(Panel(
         f"[italic]{result.transcript}[/italic]",
         title="[bold blue]TRANSCRIPT[/bold blue]",
         border_style="blue",
@@ -838,24 +1107,24 @@ def display_coaching(result: CoachingResult, console) -> None:
 
     # Grammar issues
     if result.grammar_issues:
-        console.print()
-        console.print("[bold cyan]GRAMMAR ISSUES[/bold cyan]")
-        console.print()
+        parts.append("")
+        parts.append("[bold cyan]GRAMMAR ISSUES[/bold cyan]")
+        parts.append("")
 
         for issue in result.grammar_issues:
-            console.print(f"  [red]✗[/red] \"{issue['original']}\"")
-            console.print(f"  [green]✓[/green] \"{issue['corrected']}\"")
+            parts.append(f"  [red]✗[/red] \"{issue['original']}\"")
+            parts.append(f"  [green]✓[/green] \"{issue['corrected']}\"")
             if issue['explanation']:
-                console.print(f"    [dim]{issue['explanation']}[/dim]")
-            console.print()
+                parts.append(f"    [dim]{issue['explanation']}[/dim]")
+            parts.append("")
     else:
-        console.print()
-        console.print("[green]No grammar issues detected.[/green]")
+        parts.append("")
+        parts.append("[green]No grammar issues detected.[/green]")
 
     # Suggested revision
     if result.suggested_revision:
-        console.print()
-        console.print(Panel(
+        parts.append("")
+        parts.append(Panel(
             f"[green]{result.suggested_revision}[/green]",
             title="[bold green]SUGGESTED REVISION[/bold green]",
             border_style="green",
@@ -863,27 +1132,18 @@ def display_coaching(result: CoachingResult, console) -> None:
 
     # Coaching tips
     if result.coaching_tips:
-        console.print()
-        console.print("[bold yellow]COACHING TIPS[/bold yellow]")
-        console.print()
+        parts.append("")
+        parts.append("[bold yellow]COACHING TIPS[/bold yellow]")
+        parts.append("")
         for i, tip in enumerate(result.coaching_tips, 1):
-            console.print(f"  [yellow]{i}.[/yellow] {tip}")
+            parts.append(f"  [yellow]{i}.[/yellow] {tip}")
 
     # Vocal confidence
     if result.confidence_score > 0:
-        console.print()
-        # Color based on score
-        if result.confidence_score >= 7:
-            color = "green"
-            label = "Confident"
-        elif result.confidence_score >= 4:
-            color = "yellow"
-            label = "Moderate"
-        else:
-            color = "red"
-            label = "Needs Work"
+        parts.append("")
+        color, label = _CONFIDENCE_STYLE[min(result.confidence_score, 10)]
 
-        console.print(Panel(
+        parts.append(Panel(
             f"[bold {color}]{result.confidence_score}/10[/bold {color}] - {label}\n\n{result.confidence_feedback}",
             title="[bold magenta]VOCAL CONFIDENCE[/bold magenta]",
             border_style="magenta",
@@ -891,18 +1151,10 @@ def display_coaching(result: CoachingResult, console) -> None:
 
     # Fluency score
     if result.fluency_score > 0:
-        console.print()
-        if result.fluency_score >= 7:
-            color = "green"
-            label = "Fluent"
-        elif result.fluency_score >= 4:
-            color = "yellow"
-            label = "Moderate"
-        else:
-            color = "red"
-            label = "Choppy"
+        parts.append("")
+        color, label = _FLUENCY_STYLE[min(result.fluency_score, 10)]
 
-        console.print(Panel(
+        parts.append(Panel(
             f"[bold {color}]{result.fluency_score}/10[/bold {color}] - {label}\n\n{result.fluency_feedback}",
             title="[bold blue]FLUENCY[/bold blue]",
             border_style="blue",
@@ -910,7 +1162,7 @@ def display_coaching(result: CoachingResult, console) -> None:
 
     # Filler words
     if result.filler_word_count > 0:
-        console.print()
+        parts.append("")
         if result.filler_word_count <= 2:
             color = "green"
         elif result.filler_word_count <= 5:
@@ -918,7 +1170,7 @@ def display_coaching(result: CoachingResult, console) -> None:
         else:
             color = "red"
 
-        console.print(Panel(
+        parts.append(Panel(
             f"[bold {color}]{result.filler_word_count} filler words[/bold {color}]\n\n{result.filler_words_detail}",
             title="[bold]FILLER WORDS[/bold]",
             border_style="dim",
@@ -926,64 +1178,52 @@ def display_coaching(result: CoachingResult, console) -> None:
 
     # Pronunciation issues
     if result.pronunciation_issues:
-        console.print()
-        console.print("[bold red]PRONUNCIATION ISSUES[/bold red]")
-        console.print()
+        parts.append("")
+        parts.append("[bold red]PRONUNCIATION ISSUES[/bold red]")
+        parts.append("")
         for issue in result.pronunciation_issues:
             sound = issue.get("sound", "")
             example = issue.get("example", "")
             ipa = issue.get("ipa", "")
             tip = issue.get("tip", "")
             ipa_display = f" /{ipa}/" if ipa else ""
-            console.print(f"  [red]•[/red] [bold]{sound}[/bold]: {example}{ipa_display}")
+            parts.append(f"  [red]•[/red] [bold]{sound}[/bold]: {example}{ipa_display}")
             if tip:
-                console.print(f"    [dim]{tip}[/dim]")
+                parts.append(f"    [dim]{tip}[/dim]")
 
     # AI Prosody Analysis (perceived from audio)
     if result.ai_prosody:
-        console.print()
-        table = Table(
-            title="[bold cyan]AI PROSODY ANALYSIS[/bold cyan] [dim](perceived from audio)[/dim]",
-            box=box.ROUNDED,
-            show_header=True,
-            header_style="bold",
-        )
-        table.add_column("Aspect", style="cyan", width=12)
-        table.add_column("Score", justify="center", width=8)
-        table.add_column("AI Observation", style="dim")
-
-        # Order for display
-        display_order = ["pitch", "volume", "tempo", "rhythm", "pauses", "naturalness"]
-        for category in display_order:
-            if category in result.ai_prosody:
-                data = result.ai_prosody[category]
-                score = data.get("score", 0)
-                feedback = data.get("feedback", "")
-                # Color based on score
-                if score >= 7:
-                    score_display = f"[green]{score}/10[/green]"
-                elif score >= 5:
-                    score_display = f"[yellow]{score}/10[/yellow]"
-                else:
-                    score_display = f"[red]{score}/10[/red]"
-                # Capitalize category name
-                cat_display = category.capitalize()
-                if category == "naturalness":
-                    cat_display = "[bold]Naturalness[/bold]"
-                table.add_row(cat_display, score_display, feedback)
-
-        console.print(table)
+        parts.append("")
+        table = _new_prosody_table()
+
+        rows = [
+            (category, result.ai_prosody[category])
+            for category in _PROSODY_DISPLAY_ORDER
+            if category in result.ai_prosody
+        ]
+        for category, data in rows:
+            score = data.get("score", 0)
+            color = _PROSODY_SCORE_COLOR[score]
+            table.add_row(
+                _PROSODY_CATEGORY_DISPLAY[category],
+                f"[{color}]{score}/10[/{color}]",
+                data.get("feedback", ""),
+            )
+
+        parts.append(table)
 
     # Overall feedback
     if result.overall_feedback:
-        console.print()
-        console.print(Panel(
+        parts.append("")
+        parts.append(Panel(
             result.overall_feedback,
             title="[bold]SUMMARY[/bold]",
             border_style="cyan",
         ))
 
-    console.print()
+    parts.append("")
+
+    console.print(Group(*parts))
 
 
 def generate_tailored_prompt(weaknesses: dict, due_sounds: list[dict] = None, due_words: list[dict] = None) -> dict:
@@ -1004,11 +1244,18 @@ def generate_tailored_prompt(weaknesses: dict, due_sounds: list[dict] = None, du
     difficulty = weaknesses.get("difficulty", "intermediate")
     recurring_sounds = weaknesses.get("recurring_sounds", [])
 
+    # Group focus areas by type in a single pass
+    focus_by_type = {"prosody": [], "pronunciation": [], "confidence": [], "fluency": [], "filler_words": []}
+    for f in focus_areas:
+        bucket = focus_by_type.get(f["type"])
+        if bucket is not None:
+            bucket.append(f)
+
     # Build focus description for the prompt
     focus_descriptions = []
 
     # Prosody focuses
-    prosody_focuses = [f["area"] for f in focus_areas if f["type"] == "prosody"]
+    prosody_focuses = [f["area"] for f in focus_by_type["prosody"]]
     if prosody_focuses:
         focus_descriptions.append(f"Prosody: {', '.join(prosody_focuses)}")
 
@@ -1035,7 +1282,7 @@ def generate_tailored_prompt(weaknesses: dict, due_sounds: list[dict] = None, du
         focus_descriptions.insert(0 if not target_words else 1, f"PRIORITY SOUNDS: {', '.join(due_sound_names)}")
 
     # Priority 3: Pronunciation focuses from weaknesses analysis
-    pron_sounds = [f["sound"] for f in focus_areas if f["type"] == "pronunciation"]
+    pron_sounds = [f["sound"] for f in focus_by_type["pronunciation"]]
     if not pron_sounds and recurring_sounds:
         pron_sounds = [s[0] for s in recurring_sounds[:3]]
 
@@ -1049,11 +1296,11 @@ def generate_tailored_prompt(weaknesses: dict, due_sounds: list[dict] = None, du
         focus_descriptions.append(f"Sounds: {', '.join(pron_sounds)}")
 
     # Other focuses
-    if any(f["type"] == "confidence" for f in focus_areas):
+    if focus_by_type["confidence"]:
         focus_descriptions.append("Build confidence (strong, declarative sentences)")
-    if any(f["type"] == "fluency" for f in focus_areas):
+    if focus_by_type["fluency"]:
         focus_descriptions.append("Improve fluency (flowing, connected speech)")
-    if any(f["type"] == "filler_words" for f in focus_areas):
+    if focus_by_type["filler_words"]:
         focus_descriptions.append("Reduce fillers (clear, direct statements)")
 
     focus_text = "\n".join(f"- {d}" for d in focus_descriptions) if focus_descriptions else "- General practice"
@@ -1118,7 +1365,7 @@ think /θɪŋk/, weather /ˈweðər/, rather /ˈræðər/, throughout /θruːˈa
     key_sounds = ""
 
     # Try to parse structured response - case insensitive search
-    lines = response_text.split("\n")
+    lines = response_text.splitlines()
     in_text_section = False
     in_key_section = False
     text_lines = []
@@ -1126,7 +1373,8 @@ think /θɪŋk/, weather /ˈweðər/, rather /ˈræðər/, throughout /θruːˈa
 
     for line in lines:
         line_stripped = line.strip()
-        line_upper = line_stripped.upper()
+        # Headers start with T or K, so body lines can skip the upper() copy
+        line_upper = line_stripped.upper() if line_stripped[:1] in _HEADER_INITIALS else ""
 
         # Check for section headers
         if line_upper.startswith("TEXT:"):
@@ -1164,13 +1412,13 @@ think /θɪŋk/, weather /ˈweðər/, rather /ˈræðər/, throughout /θruːˈa
         key_sounds = ", ".join(key_lines)
 
     # Clean up text - remove any remaining section headers
-    for header in ["TEXT:", "text:", "Text:", "KEY_SOUNDS:", "KEY SOUNDS:", "key_sounds:", "key sounds:"]:
-        text = text.replace(header, "").strip()
+    text = _HEADER_STRIP_RE.sub("", text).strip()
 
     # Validate text ends with proper punctuation (not cut off mid-sentence)
-    if text and text[-1] not in ".!?":
+    if text and text[-1] not in _SENT_END_CHARS:
         # Text was likely truncated - try to find the last complete sentence
-        last_period = max(text.rfind("."), text.rfind("!"), text.rfind("?"))
+        match = _LAST_SENT_END_RE.search(text)
+        last_period = match.start() if match else -1
         if last_period > len(text) // 2:  # Only trim if we have at least half the content
             text = text[:last_period + 1]
 
@@ -1189,32 +1437,7 @@ think /θɪŋk/, weather /ˈweðər/, rather /ˈræðər/, throughout /θruːˈa
 # Rhythm Training AI Analysis
 # =============================================================================
 
-def build_rhythm_coaching_prompt(
-    prosody: ProsodyAnalysis,
-    expected_text: str,
-    level: int,
-    drill_focus: str,
-    drill_technique: str
-) -> str:
-    """
-    Build prompt for rhythm-specific coaching analysis.
-
-    Args:
-        prosody: Results from prosody analysis
-        expected_text: The text the user was asked to read
-        level: Current rhythm training level (1-6)
-        drill_focus: The specific focus of this drill
-        drill_technique: The technique being practiced
-
-    Returns:
-        Prompt string for Gemini
-    """
-    level_config = RHYTHM_LEVEL_CONFIG.get(level, RHYTHM_LEVEL_CONFIG[1])
-    level_name = level_config["name"]
-    npvi_target = level_config["npvi_target"]
-    min_rhythm_score = level_config["min_rhythm_score"]
-
-    return f"""You are an expert English rhythm and prosody coach specializing in helping Spanish speakers develop stress-timed speech patterns.
+_RHYTHM_PROMPT_TEMPLATE = """You are an expert English rhythm and prosody coach specializing in helping Spanish speakers develop stress-timed speech patterns.
 
 TASK: Analyze the audio for RHYTHM QUALITY specifically at Level {level}: {level_name}
 
@@ -1229,9 +1452,9 @@ EXPECTED TEXT:
 "{expected_text}"
 
 PROSODY ANALYSIS (measured):
-- Rhythm Score: {prosody.rhythm.score}/10
-- Pitch Variation: {prosody.pitch.range_hz:.0f} Hz
-- Tempo: {prosody.tempo.estimated_wpm:.0f} WPM
+- Rhythm Score: {rhythm_score}/10
+- Pitch Variation: {range_hz:.0f} Hz
+- Tempo: {estimated_wpm:.0f} WPM
 (Note: nPVI is measured separately - provide YOUR independent estimate based on listening)
 
 CONTEXT:
@@ -1286,6 +1509,41 @@ CONNECTED_SPEECH:
 """
 
 
+def build_rhythm_coaching_prompt(
+    prosody: ProsodyAnalysis,
+    expected_text: str,
+    level: int,
+    drill_focus: str,
+    drill_technique: str
+) -> str:
+    """
+    Build prompt for rhythm-specific coaching analysis.
+
+    Args:
+        prosody: Results from prosody analysis
+        expected_text: The text the user was asked to read
+        level: Current rhythm training level (1-6)
+        drill_focus: The specific focus of this drill
+        drill_technique: The technique being practiced
+
+    Returns:
+        Prompt string for Gemini
+    """
+    level_config = RHYTHM_LEVEL_CONFIG.get(level, RHYTHM_LEVEL_CONFIG[1])
+    return _RHYTHM_PROMPT_TEMPLATE.format(
+        level=level,
+        level_name=level_config.name,
+        npvi_target=level_config.npvi_target,
+        min_rhythm_score=level_config.min_rhythm_score,
+        drill_focus=drill_focus,
+        drill_technique=drill_technique,
+        expected_text=expected_text,
+        rhythm_score=prosody.rhythm.score,
+        range_hz=prosody.pitch.range_hz,
+        estimated_wpm=prosody.tempo.estimated_wpm,
+    )
+
+
 def analyze_rhythm_with_coach(
     audio_data: np.ndarray,
     sample_rate: int,
@@ -1310,39 +1568,16 @@ def analyze_rhythm_with_coach(
     Returns:
         RhythmCoachingResult with rhythm-specific feedback
     """
-    client = get_client()
-    audio_b64 = audio_to_base64(audio_data, sample_rate)
+    audio_bytes = audio_to_flac_bytes(audio_data, sample_rate)
 
     prompt = build_rhythm_coaching_prompt(
         prosody, expected_text, level, drill_focus, drill_technique
     )
 
-    contents = [
-        types.Content(
-            role="user",
-            parts=[
-                types.Part.from_bytes(
-                    data=base64.b64decode(audio_b64),
-                    mime_type="audio/flac"
-                ),
-                types.Part.from_text(text=prompt),
-            ],
-        ),
-    ]
-
-    generate_config = types.GenerateContentConfig(
-        temperature=0.3,
-        max_output_tokens=4096,
+    return parse_rhythm_coaching_response(
+        _invoke_gemini(prompt, audio_bytes, config=_RHYTHM_COACHING_CONFIG)
     )
 
-    response = client.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=contents,
-        config=generate_config,
-    )
-
-    return parse_rhythm_coaching_response(extract_text_from_response(response))
-
 
 def parse_rhythm_coaching_response(response_text: str) -> RhythmCoachingResult:
     """Parse Gemini's response into structured RhythmCoachingResult."""
@@ -1361,36 +1596,34 @@ def parse_rhythm_coaching_response(response_text: str) -> RhythmCoachingResult:
     }
 
     current_section = None
-    lines = response_text.strip().split("\n")
+    lines = response_text.splitlines()
 
     for line in lines:
         line_stripped = line.strip()
 
-        for section_key in sections.keys():
-            if line_stripped.startswith(section_key):
-                current_section = section_key
-                remaining = line_stripped[len(section_key):].strip()
-                if remaining:
-                    sections[current_section] = remaining + "\n"
-                break
-        else:
-            if current_section:
-                sections[current_section] += line + "\n"
+        match = _RHYTHM_SECTION_RE.match(line_stripped)
+        if match:
+            current_section = match.group(1) + ":"
+            remaining = match.group(2)
+            if remaining:
+                sections[current_section] = remaining + "\n"
+        elif current_section:
+            sections[current_section] += line + "\n"
 
     # Parse rhythm score
     rhythm_score = 5
     rhythm_text = sections["RHYTHM_SCORE:"].strip()
     if rhythm_text:
-        if "|" in rhythm_text:
-            parts = rhythm_text.split("|", 1)
+        score_part, sep, _ = rhythm_text.partition("|")
+        if sep:
             try:
-                rhythm_score = int(parts[0].strip())
+                rhythm_score = int(score_part.strip())
             except ValueError:
-                numbers = re.findall(r'\d+', parts[0])
+                numbers = _DIGITS_RE.findall(score_part)
                 if numbers:
                     rhythm_score = min(10, max(1, int(numbers[0])))
         else:
-            numbers = re.findall(r'\b(\d+)\b', rhythm_text)
+            numbers = _WORD_DIGITS_RE.findall(rhythm_text)
             if numbers:
                 rhythm_score = min(10, max(1, int(numbers[0])))
 
@@ -1399,32 +1632,24 @@ def parse_rhythm_coaching_response(response_text: str) -> RhythmCoachingResult:
     stress_feedback = ""
     stress_text = sections["STRESS_CORRECT:"].strip()
     if stress_text:
-        if "|" in stress_text:
-            parts = stress_text.split("|", 1)
-            stress_correct = "YES" in parts[0].upper()
-            stress_feedback = parts[1].strip() if len(parts) > 1 else ""
-        else:
-            stress_correct = "YES" in stress_text.upper()
-            stress_feedback = stress_text
+        verdict, sep, explanation = stress_text.partition("|")
+        stress_correct = "YES" in verdict.upper()
+        stress_feedback = explanation.strip() if sep else stress_text
 
     # Parse function reduction
     function_reduction = False
     reduction_feedback = ""
     reduction_text = sections["FUNCTION_REDUCTION:"].strip()
     if reduction_text:
-        if "|" in reduction_text:
-            parts = reduction_text.split("|", 1)
-            function_reduction = "YES" in parts[0].upper()
-            reduction_feedback = parts[1].strip() if len(parts) > 1 else ""
-        else:
-            function_reduction = "YES" in reduction_text.upper()
-            reduction_feedback = reduction_text
+        verdict, sep, explanation = reduction_text.partition("|")
+        function_reduction = "YES" in verdict.upper()
+        reduction_feedback = explanation.strip() if sep else reduction_text
 
     # Parse level pass
     level_passed = False
     level_text = sections["LEVEL_PASS:"].strip()
     if level_text:
-        level_passed = "YES" in level_text.split("|")[0].upper() if "|" in level_text else "YES" in level_text.upper()
+        level_passed = "YES" in level_text.partition("|")[0].upper()
 
     # Parse word stress issues
     word_stress_issues = []
@@ -1448,7 +1673,7 @@ def parse_rhythm_coaching_response(response_text: str) -> RhythmCoachingResult:
     npvi_estimate = 45.0
     npvi_text = sections["NPVI_ESTIMATE:"].strip()
     if npvi_text:
-        numbers = re.findall(r'\b(\d+(?:\.\d+)?)\b', npvi_text)
+        numbers = _FLOAT_RE.findall(npvi_text)
         if numbers:
             npvi_estimate = float(numbers[0])
             # Clamp to reasonable range
@@ -1462,11 +1687,13 @@ def parse_rhythm_coaching_response(response_text: str) -> RhythmCoachingResult:
     if connected_text:
         for line in connected_text.split("\n"):
             line = line.strip()
-            if line.upper().startswith("PATTERN:"):
+            # Only the 8-char prefix is needed to identify the label
+            prefix = line[:8].upper()
+            if prefix.startswith("PATTERN:"):
                 stress_pattern = line[8:].strip()
-            elif line.upper().startswith("LINKED:"):
+            elif prefix.startswith("LINKED:"):
                 linked = line[7:].strip().strip('"')
-            elif line.upper().startswith("IPA:"):
+            elif prefix.startswith("IPA:"):
                 linked_ipa = line[4:].strip().strip('/')
                 if linked_ipa:
                     linked_ipa = f"/{linked_ipa}/"
@@ -1504,67 +1731,145 @@ class MasteryEvaluationResult:
     confidence: float  # AI's confidence in the recommendation (0-1)
 
 
+# Static evaluation scaffolding, sent once as a fixed system instruction;
+# only the learner data below varies per call. (Too short for caches.create(),
+# which needs a much larger minimum prefix.)
+_MASTERY_SYSTEM_INSTRUCTION = """You are evaluating whether a learner has MASTERED a level of English rhythm training.
+
+EVALUATION CRITERIA:
+1. FUNDAMENTALS: Are the core patterns of this level solid? (metrics meeting targets)
+2. COVERAGE: Has the learner practiced enough variety? (unique drills)
+3. ISSUES: Are there recurring problems that need resolution?
+4. CONSISTENCY: Is performance consistent, not just occasional passes?
+
+Respond with a JSON evaluation:
+- recommendation: advance, practice_more or review_basics
+- fundamentals_solid: whether the core patterns are solid
+- reasoning: 2-3 sentences explaining your decision
+- focus_areas: specific areas to work on (empty if advancing)
+- confidence: 0.0-1.0 how confident you are in this recommendation
+
+Be strict but fair. A learner should demonstrate CONSISTENT mastery, not just occasional success.
+If there are unresolved issues with high-frequency words or patterns, recommend more practice.
+Only recommend "advance" if fundamentals are truly solid."""
+
+_MASTERY_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "recommendation": {
+            "type": "string",
+            "enum": ["advance", "practice_more", "review_basics"],
+        },
+        "fundamentals_solid": {"type": "boolean"},
+        "reasoning": {"type": "string"},
+        "focus_areas": {"type": "array", "items": {"type": "string"}},
+        "confidence": {"type": "number"},
+    },
+    "required": ["recommendation", "confidence"],
+}
+
+_MASTERY_CONFIG = types.GenerateContentConfig(
+    system_instruction=_MASTERY_SYSTEM_INSTRUCTION,
+    temperature=0.2,  # Lower temperature for more consistent evaluation
+    max_output_tokens=200,  # Five short JSON fields
+    response_mime_type="application/json",
+    response_schema=_MASTERY_RESPONSE_SCHEMA,
+)
+
+# A response cut off at max_output_tokens is retried once with this much
+# more room before the evaluation is reported as failed
+_MASTERY_RETRY_TOKEN_FACTOR = 4
+
+
+def _hit_token_cap(response) -> bool:
+    """Whether Gemini stopped a response at max_output_tokens."""
+    candidates = getattr(response, "candidates", None)
+    return bool(candidates) and candidates[0].finish_reason == types.FinishReason.MAX_TOKENS
+
+_MASTERY_PROMPT_TEMPLATE = """Evaluate whether this learner has MASTERED Level {level}.
+
+LEVEL {level} REQUIREMENTS:
+- nPVI target: {npvi_target}+ (learner average: {avg_npvi})
+- Rhythm score target: {min_rhythm_score}+/10 (learner average: {avg_rhythm_score})
+- Minimum unique drills: {min_unique_drills} (learner passed: {unique_drills_passed})
+
+LEARNER PROGRESS:
+- Total attempts at this level: {total_attempts}
+- Consecutive passes: {consecutive_passes}
+- Issues resolved: {resolved_issues_count}
+
+{issues_text}
+
+DRILLS PASSED: {drills_passed}"""
+
+
 def build_mastery_evaluation_prompt(mastery_data: dict) -> str:
     """Build prompt for AI mastery evaluation."""
 
-    issues_text = ""
     if mastery_data["unresolved_issues"]:
-        issues_text = "UNRESOLVED ISSUES:\n"
+        parts = ["UNRESOLVED ISSUES:\n"]
         for issue in mastery_data["unresolved_issues"][:5]:  # Top 5 issues
-            issues_text += f"- {issue.get('issue_type', 'unknown')}: "
+            parts.append(f"- {issue.get('issue_type', 'unknown')}: ")
             if issue.get('word'):
-                issues_text += f"'{issue['word']}' "
+                parts.append(f"'{issue['word']}' ")
             if issue.get('expected') and issue.get('heard'):
-                issues_text += f"(expected: {issue['expected']}, heard: {issue['heard']})"
-            issues_text += f" - encountered {issue.get('times_encountered', 1)} times\n"
+                parts.append(f"(expected: {issue['expected']}, heard: {issue['heard']})")
+            parts.append(f" - encountered {issue.get('times_encountered', 1)} times\n")
+        issues_text = "".join(parts)
     else:
         issues_text = "UNRESOLVED ISSUES: None\n"
 
-    return f"""You are evaluating whether a learner has MASTERED Level {mastery_data['level']} of English rhythm training.
-
-LEVEL {mastery_data['level']} REQUIREMENTS:
-- nPVI target: {mastery_data['npvi_target']}+ (learner average: {mastery_data['avg_npvi']})
-- Rhythm score target: {mastery_data['min_rhythm_score']}+/10 (learner average: {mastery_data['avg_rhythm_score']})
-- Minimum unique drills: {mastery_data['min_unique_drills']} (learner passed: {mastery_data['unique_drills_passed']})
-
-LEARNER PROGRESS:
-- Total attempts at this level: {mastery_data['total_attempts']}
-- Consecutive passes: {mastery_data['consecutive_passes']}
-- Issues resolved: {mastery_data['resolved_issues_count']}
-
-{issues_text}
-
-DRILLS PASSED: {', '.join(mastery_data['priority_1_drills_passed']) if mastery_data['priority_1_drills_passed'] else 'None yet'}
+    drills_passed = mastery_data['priority_1_drills_passed']
+    return _MASTERY_PROMPT_TEMPLATE.format_map({
+        **mastery_data,
+        "issues_text": issues_text,
+        "drills_passed": ', '.join(drills_passed) if drills_passed else 'None yet',
+    })
 
-EVALUATION CRITERIA:
-1. FUNDAMENTALS: Are the core patterns of this level solid? (metrics meeting targets)
-2. COVERAGE: Has the learner practiced enough variety? (unique drills)
-3. ISSUES: Are there recurring problems that need resolution?
-4. CONSISTENCY: Is performance consistent, not just occasional passes?
 
-Provide your evaluation in this exact format:
+# Recent mastery evaluations keyed by a fingerprint of their input, so
+# repeated checks on unchanged progress skip the Gemini round-trip
+_MASTERY_CACHE_TTL = 600  # seconds
+_mastery_cache: dict[bytes, tuple[float, MasteryEvaluationResult]] = {}
 
-RECOMMENDATION: [advance|practice_more|review_basics]
-FUNDAMENTALS_SOLID: [YES|NO]
-REASONING: [2-3 sentences explaining your decision]
-FOCUS_AREAS: [comma-separated list of specific areas to work on, or "None" if advancing]
-CONFIDENCE: [0.0-1.0 how confident you are in this recommendation]
 
-Be strict but fair. A learner should demonstrate CONSISTENT mastery, not just occasional success.
-If there are unresolved issues with high-frequency words or patterns, recommend more practice.
-Only recommend "advance" if fundamentals are truly solid."""
+def _mastery_fingerprint(mastery_data: dict) -> bytes:
+    """Stable digest of mastery data, independent of key order."""
+    payload = json.dumps(mastery_data, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
 
 
-def evaluate_mastery_with_ai(mastery_data: dict) -> MasteryEvaluationResult:
+def evaluate_mastery_with_ai(
+    mastery_data: dict,
+    on_chunk: callable = None,
+) -> MasteryEvaluationResult:
     """
     Use AI to evaluate if learner should advance to next level.
 
+    The response is streamed and reading stops as soon as the accumulated
+    text is a complete JSON object. A response that is cut off at the token
+    cap or isn't valid JSON is retried once with a larger cap. Evaluations
+    are cached for _MASTERY_CACHE_TTL seconds per distinct mastery_data, so
+    identical requests return a copy of the previous evaluation.
+
     Args:
         mastery_data: Dictionary from get_level_mastery_data()
+        on_chunk: Optional callback called with each text chunk and the
+            accumulated text so far
 
     Returns:
         MasteryEvaluationResult with recommendation and reasoning
+
+    Raises:
+        ValueError: If the retried response still isn't a complete JSON object
     """
+    key = _mastery_fingerprint(mastery_data)
+    now = time.monotonic()
+    cached = _mastery_cache.get(key)
+    if cached is not None and now - cached[0] < _MASTERY_CACHE_TTL:
+        # Copy so callers can't mutate the cached entry's focus_areas
+        return replace(cached[1], focus_areas=list(cached[1].focus_areas))
+
     client = get_client()
 
     prompt = build_mastery_evaluation_prompt(mastery_data)
@@ -1576,107 +1881,209 @@ def evaluate_mastery_with_ai(mastery_data: dict) -> MasteryEvaluationResult:
         ),
     ]
 
-    generate_config = types.GenerateContentConfig(
-        temperature=0.2,  # Lower temperature for more consistent evaluation
-        max_output_tokens=1024,
-    )
+    retry_config = _MASTERY_CONFIG.model_copy(update={
+        "max_output_tokens": _MASTERY_CONFIG.max_output_tokens * _MASTERY_RETRY_TOKEN_FACTOR,
+    })
+    for config in (_MASTERY_CONFIG, retry_config):
+        text_parts = []
+        truncated = False
+        for chunk in client.models.generate_content_stream(
+            model=GEMINI_MODEL,
+            contents=contents,
+            config=config,
+        ):
+            truncated = _hit_token_cap(chunk)
+            chunk_text = extract_text_from_response(chunk)
+            if not chunk_text:
+                continue
+            text_parts.append(chunk_text)
+            if on_chunk:
+                on_chunk(chunk_text, "".join(text_parts))
+            # Stop reading once the closing brace completes the JSON object
+            if "}" in chunk_text:
+                try:
+                    json.loads("".join(text_parts))
+                    break
+                except json.JSONDecodeError:
+                    pass
 
-    response = client.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=contents,
-        config=generate_config,
-    )
+        fields = _decode_mastery_fields("".join(text_parts))
+        if fields is not None and not truncated:
+            break
+    else:
+        raise ValueError("Gemini returned an incomplete mastery evaluation")
 
-    return parse_mastery_evaluation_response(extract_text_from_response(response))
+    result = _mastery_result_from_fields(fields)
 
+    # Drop expired entries before storing so the cache can't grow unbounded
+    for stale in [k for k, (ts, _) in _mastery_cache.items() if now - ts >= _MASTERY_CACHE_TTL]:
+        del _mastery_cache[stale]
+    _mastery_cache[key] = (now, replace(result, focus_areas=list(result.focus_areas)))
+    return result
 
-def parse_mastery_evaluation_response(response_text: str) -> MasteryEvaluationResult:
-    """Parse AI mastery evaluation response."""
 
-    sections = {
-        "RECOMMENDATION:": "",
-        "FUNDAMENTALS_SOLID:": "",
-        "REASONING:": "",
-        "FOCUS_AREAS:": "",
-        "CONFIDENCE:": "",
-    }
+_MASTERY_BATCH_INSTRUCTIONS = """Evaluate each of the {count} learners below independently.
 
-    current_section = None
-    lines = response_text.strip().split("\n")
+Respond with a JSON array holding one evaluation per learner, in learner
+order."""
 
-    for line in lines:
-        line_stripped = line.strip()
 
-        for section_key in sections.keys():
-            if line_stripped.startswith(section_key):
-                current_section = section_key
-                remaining = line_stripped[len(section_key):].strip()
-                if remaining:
-                    sections[current_section] = remaining + "\n"
-                break
-        else:
-            if current_section:
-                sections[current_section] += line + "\n"
+def evaluate_mastery_with_ai_batch(
+    mastery_data_list: list[dict],
+) -> list[MasteryEvaluationResult]:
+    """
+    Evaluate several learners' mastery in a single Gemini request.
 
-    # Parse recommendation
-    recommendation = sections["RECOMMENDATION:"].strip().lower()
-    if recommendation not in ["advance", "practice_more", "review_basics"]:
-        recommendation = "practice_more"  # Default to cautious
+    Amortizes the request round-trip over many learners (e.g. for nightly
+    re-evaluation). A cut-off or unparseable array is retried once with a
+    larger cap; learners the model skipped are evaluated individually.
+
+    Args:
+        mastery_data_list: Dictionaries from get_level_mastery_data()
+
+    Returns:
+        One MasteryEvaluationResult per input, in the same order
+
+    Raises:
+        ValueError: If the retried response still isn't a complete JSON array
+    """
+    if not mastery_data_list:
+        return []
+    if len(mastery_data_list) == 1:
+        return [evaluate_mastery_with_ai(mastery_data_list[0])]
 
-    # Parse fundamentals
-    fundamentals_text = sections["FUNDAMENTALS_SOLID:"].strip().upper()
-    fundamentals_solid = fundamentals_text.startswith("YES")
+    client = get_client()
+
+    count = len(mastery_data_list)
+    parts = [_MASTERY_BATCH_INSTRUCTIONS.format(count=count)]
+    for k, mastery_data in enumerate(mastery_data_list, 1):
+        parts.append(f"=== LEARNER {k} ===\n{build_mastery_evaluation_prompt(mastery_data)}")
+    prompt = "\n\n".join(parts)
+
+    contents = [
+        types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=prompt)],
+        ),
+    ]
+
+    for factor in (1, _MASTERY_RETRY_TOKEN_FACTOR):
+        response = client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=contents,
+            config=_MASTERY_CONFIG.model_copy(update={
+                "max_output_tokens": _MASTERY_CONFIG.max_output_tokens * count * factor,
+                "response_schema": {"type": "array", "items": _MASTERY_RESPONSE_SCHEMA},
+            }),
+        )
+        try:
+            evaluations = json.loads(extract_text_from_response(response))
+        except json.JSONDecodeError:
+            continue
+        if isinstance(evaluations, list) and not _hit_token_cap(response):
+            break
+    else:
+        raise ValueError("Gemini returned an incomplete batch mastery evaluation")
+
+    evaluations = evaluations[:count] + [None] * (count - len(evaluations))
+    return [
+        _mastery_result_from_fields(fields) if isinstance(fields, dict)
+        else evaluate_mastery_with_ai(mastery_data)
+        for fields, mastery_data in zip(evaluations, mastery_data_list)
+    ]
+
+
+def _mastery_result_from_fields(fields) -> MasteryEvaluationResult:
+    """Build a MasteryEvaluationResult from decoded JSON, with cautious defaults."""
+    if not isinstance(fields, dict):
+        fields = {}
+
+    recommendation = str(fields.get("recommendation") or "").strip().lower()
+    if recommendation not in _VALID_RECS:
+        recommendation = "practice_more"  # Default to cautious
 
-    # Parse reasoning
-    reasoning = sections["REASONING:"].strip()
+    reasoning = str(fields.get("reasoning") or "").strip()
     if not reasoning:
         reasoning = "Evaluation based on performance metrics."
 
-    # Parse focus areas
-    focus_text = sections["FOCUS_AREAS:"].strip()
-    if focus_text.lower() == "none" or not focus_text:
+    focus_areas = fields.get("focus_areas") or []
+    if isinstance(focus_areas, str):
+        focus_areas = focus_areas.split(",")
+    focus_areas = [str(area).strip() for area in focus_areas if str(area).strip()]
+    if [area.lower() for area in focus_areas] == ["none"]:
         focus_areas = []
-    else:
-        focus_areas = [area.strip() for area in focus_text.split(",") if area.strip()]
 
-    # Parse confidence
-    confidence = 0.7  # Default
-    confidence_text = sections["CONFIDENCE:"].strip()
-    if confidence_text:
-        numbers = re.findall(r'(\d+\.?\d*)', confidence_text)
-        if numbers:
-            confidence = min(1.0, max(0.0, float(numbers[0])))
+    try:
+        confidence = min(1.0, max(0.0, float(fields.get("confidence", 0.7))))
+    except (TypeError, ValueError):
+        confidence = 0.7  # Default
 
     return MasteryEvaluationResult(
         recommendation=recommendation,
-        fundamentals_solid=fundamentals_solid,
+        fundamentals_solid=fields.get("fundamentals_solid") is True,
         reasoning=reasoning,
         focus_areas=focus_areas,
         confidence=confidence,
     )
 
 
-def generate_targeted_drill(
-    level: int,
-    issues: list[dict],
-    existing_drills: list[str]
-) -> dict | None:
-    """
-    Use AI to generate a drill targeting specific problem areas.
+def _decode_mastery_fields(response_text: str) -> dict | None:
+    """Decode a mastery response's JSON object, or None if it isn't one."""
+    try:
+        fields = json.loads(response_text)
+    except json.JSONDecodeError:
+        return None
+    return fields if isinstance(fields, dict) else None
 
-    Args:
-        level: Current level
-        issues: List of unresolved rhythm issues
-        existing_drills: IDs of drills already attempted
 
-    Returns:
-        Generated drill dictionary or None if generation fails
-    """
-    if not issues:
-        return None
+def parse_mastery_evaluation_response(response_text: str) -> MasteryEvaluationResult:
+    """Parse AI mastery evaluation response (JSON per _MASTERY_RESPONSE_SCHEMA)."""
+    return _mastery_result_from_fields(_decode_mastery_fields(response_text))
 
-    client = get_client()
 
+# Static drill-format scaffolding shared by every targeted drill request,
+# kept in a fixed system instruction like _MASTERY_SYSTEM_INSTRUCTION.
+_DRILL_SYSTEM_INSTRUCTION = """You generate English rhythm drills that target a learner's specific problem areas.
+
+Generate a drill in this EXACT format:
+
+TEXT: [The practice text - complete sentences for Level 2+]
+IPA: [Complete IPA transcription of the text]
+PATTERN: [Stress pattern like oO, Oo, oOo, etc.]
+FOCUS: [Brief description of what this drill targets]
+TIP: [Actionable tip for the learner]
+TECHNIQUE: [Specific technique to apply]
+
+Requirements:
+- Stay within the requested word range
+- Use common, high-frequency words
+- Target the same patterns as the problem areas
+- Include complete IPA transcription
+- Make it clearly relevant to the issues"""
+
+_DRILL_CONFIG = types.GenerateContentConfig(
+    system_instruction=_DRILL_SYSTEM_INSTRUCTION,
+    temperature=0.7,  # Higher temperature for variety
+    max_output_tokens=512,
+)
+
+
+_DRILL_PROMPT_TEMPLATE = """Generate a rhythm drill for Level {level} ({name}) targeting these specific problem areas:
+
+PROBLEM AREAS:
+{issues_block}
+
+LEVEL FOCUS: {description}
+TECHNIQUES: {techniques}
+
+CRITICAL: Generate a drill with {min_words}-{max_words} words. Example for this level:
+"{example}"
+
+The TEXT MUST be {min_words}-{max_words} words (count carefully!)"""
+
+
+def _build_drill_prompt(level: int, issues: list[dict]) -> str:
+    """Build the per-request part of a targeted drill prompt."""
     # Build issues summary
     issues_summary = []
     for issue in issues[:3]:  # Focus on top 3 issues
@@ -1687,8 +2094,7 @@ def generate_targeted_drill(
         else:
             issues_summary.append(f"{issue.get('issue_type', 'unknown')} issue")
 
-    from config import RHYTHM_LEVEL_CONFIG
-    level_config = RHYTHM_LEVEL_CONFIG.get(level, {})
+    level_config = RHYTHM_LEVEL_CONFIG.get(level)
 
     # Determine min/max words based on level
     if level == 1:
@@ -1698,61 +2104,128 @@ def generate_targeted_drill(
         min_words, max_words = 10, 15
         example = "I was going to ask you if you wanted to come to the party with us."
 
-    prompt = f"""Generate a rhythm drill for Level {level} ({level_config.get('name', '')}) targeting these specific problem areas:
+    return _DRILL_PROMPT_TEMPLATE.format_map({
+        "level": level,
+        "name": level_config.name if level_config else "",
+        "issues_block": "\n".join("- " + issue for issue in issues_summary),
+        "description": level_config.description if level_config else "",
+        "techniques": _LEVEL_TECHNIQUES_JOINED.get(level, ""),
+        "min_words": min_words,
+        "max_words": max_words,
+        "example": example,
+    })
+
+
+def _drill_contents(level: int, issues: list[dict]) -> list:
+    """Wrap the targeted drill prompt as Gemini request contents."""
+    return [
+        types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=_build_drill_prompt(level, issues))],
+        ),
+    ]
 
-PROBLEM AREAS:
-{chr(10).join('- ' + issue for issue in issues_summary)}
 
-LEVEL FOCUS: {level_config.get('description', '')}
-TECHNIQUES: {', '.join(level_config.get('techniques', []))}
+def generate_targeted_drill(
+    level: int,
+    issues: list[dict],
+    existing_drills: list[str]
+) -> dict | None:
+    """
+    Use AI to generate a drill targeting specific problem areas.
 
-CRITICAL: Generate a drill with {min_words}-{max_words} words. Example for this level:
-"{example}"
+    Args:
+        level: Current level
+        issues: List of unresolved rhythm issues
+        existing_drills: IDs of drills already attempted
 
-Generate a drill in this EXACT format:
+    Returns:
+        Generated drill dictionary or None if generation fails
+    """
+    if not issues:
+        return None
 
-TEXT: [The practice text - MUST be {min_words}-{max_words} words, complete sentences for Level 2+]
-IPA: [Complete IPA transcription of the text]
-PATTERN: [Stress pattern like oO, Oo, oOo, etc.]
-FOCUS: [Brief description of what this drill targets]
-TIP: [Actionable tip for the learner]
-TECHNIQUE: [Specific technique to apply]
+    client = get_client()
 
-Requirements:
-- MUST be {min_words}-{max_words} words (count carefully!)
-- Use common, high-frequency words
-- Target the same patterns as the problem areas
-- Include complete IPA transcription
-- Make it clearly relevant to the issues"""
+    try:
+        response = client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=_drill_contents(level, issues),
+            config=_DRILL_CONFIG,
+        )
 
-    contents = [
-        types.Content(
-            role="user",
-            parts=[types.Part.from_text(text=prompt)],
-        ),
-    ]
+        response_text = extract_text_from_response(response)
+        return parse_generated_drill(response_text, level)
+    except Exception:
+        return None
 
-    generate_config = types.GenerateContentConfig(
-        temperature=0.7,  # Higher temperature for variety
-        max_output_tokens=512,
-    )
+
+async def generate_targeted_drill_async(
+    level: int,
+    issues: list[dict],
+    existing_drills: list[str]
+) -> dict | None:
+    """
+    Async variant of generate_targeted_drill using the Gemini aio client.
+
+    Args:
+        level: Current level
+        issues: List of unresolved rhythm issues
+        existing_drills: IDs of drills already attempted
+
+    Returns:
+        Generated drill dictionary or None if generation fails
+    """
+    if not issues:
+        return None
+
+    # Not the shared client: its aio connections would outlive the event
+    # loop that generate_targeted_drills_bulk's asyncio.run tears down
+    client = _new_client()
 
     try:
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=GEMINI_MODEL,
-            contents=contents,
-            config=generate_config,
+            contents=_drill_contents(level, issues),
+            config=_DRILL_CONFIG,
         )
 
         response_text = extract_text_from_response(response)
         return parse_generated_drill(response_text, level)
     except Exception:
         return None
+    finally:
+        await client.aio.aclose()
+        client.close()
+
+
+def generate_targeted_drills_bulk(
+    requests: list[tuple[int, list[dict], list[str]]]
+) -> list[dict | None]:
+    """
+    Generate several targeted drills concurrently.
+
+    Args:
+        requests: (level, issues, existing_drills) tuples, one per drill
+
+    Returns:
+        Generated drill (or None) for each request, in the same order
+    """
+    async def _gather():
+        return await asyncio.gather(
+            *(generate_targeted_drill_async(*request) for request in requests)
+        )
+
+    return list(asyncio.run(_gather()))
 
 
 def parse_generated_drill(response_text: str, level: int) -> dict | None:
     """Parse AI-generated drill response."""
 
+    # Without a TEXT section there is no drill, so skip the section scan
+    if "TEXT:" not in response_text:
+        return None
+
     sections = {
         "TEXT:": "",
         "IPA:": "",
@@ -1762,32 +2235,22 @@ def parse_generated_drill(response_text: str, level: int) -> dict | None:
         "TECHNIQUE:": "",
     }
 
-    current_section = None
-    lines = response_text.strip().split("\n")
-
-    for line in lines:
-        line_stripped = line.strip()
-
-        for section_key in sections.keys():
-            if line_stripped.startswith(section_key):
-                current_section = section_key
-                remaining = line_stripped[len(section_key):].strip()
-                if remaining:
-                    sections[current_section] = remaining
-                break
-        else:
-            if current_section and not sections[current_section]:
-                sections[current_section] = line_stripped
+    # Each field takes only the first non-empty line of its section
+    for match in _DRILL_SECTION_RE.finditer(response_text):
+        sections[match.group(1) + ":"] = match.group(2).strip().split("\n", 1)[0].strip()
 
+    # Validate text length first - reject missing, too-short or too-long
+    # drills before any IPA validation, hashing or dict building
     text = sections["TEXT:"].strip()
     if not text:
         return None
 
-    # Validate text length - reject drills that are too short
-    word_count = len(text.split())
-    min_words = 5 if level == 1 else 8  # Level 1: 5 words min, Level 2+: 8 words min
-    if word_count < min_words:
-        return None  # Reject short drills
+    words = text.split()
+    word_count = len(words)
+    # Level 1: 5-8 words, Level 2+: 8-15 words (prompt asks for 10-15)
+    min_words, max_words = (5, 8) if level == 1 else (8, 15)
+    if not min_words <= word_count <= max_words:
+        return None  # Reject drills outside the requested length
 
     # Validate IPA is not empty or trivial
     ipa = sections["IPA:"].strip()
@@ -1795,8 +2258,7 @@ def parse_generated_drill(response_text: str, level: int) -> dict | None:
         ipa = ""  # Clear invalid IPA
 
     # Generate a unique ID for the generated drill
-    import hashlib
-    drill_hash = hashlib.md5(text.encode()).hexdigest()[:6]
+    drill_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=3).hexdigest()
     drill_id = f"ai_l{level}_{drill_hash}"
 
     return {
@@ -1,6 +1,7 @@
 """Configuration and thresholds for prosody analysis."""
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -56,76 +57,97 @@ PAUSE_CONFIG = {
 DATA_DIR = Path(__file__).parent / "data"
 RECORDINGS_DIR = DATA_DIR / "recordings"
 DB_PATH = DATA_DIR / "progress.db"
+ANALYSIS_CACHE_DIR = Path.home() / ".cache" / "prosody-coach"  # Created on first write
+COACHING_CACHE_DIR = ANALYSIS_CACHE_DIR / "coaching"  # Gemini responses by request digest
 
 # Ensure directories exist
 DATA_DIR.mkdir(exist_ok=True)
 RECORDINGS_DIR.mkdir(exist_ok=True)
 
+@dataclass(frozen=True, slots=True)
+class LevelConfig:
+    """Mastery targets and techniques for one rhythm training level."""
+    name: str
+    description: str
+    npvi_target: int
+    min_rhythm_score: int
+    consecutive_passes: int
+    min_unique_drills: int
+    require_priority_1: bool
+    techniques: tuple[str, ...]
+
+
 # Rhythm training level configuration
 # Each level has specific nPVI and rhythm score targets for mastery
 # min_unique_drills: minimum different drills that must be passed
 # require_priority_1: all priority 1 (essential) drills must be passed
-RHYTHM_LEVEL_CONFIG = {
-    1: {
-        "name": "Word Stress",
-        "description": "Learn basic word stress patterns",
-        "npvi_target": 45,
-        "min_rhythm_score": 5,
-        "consecutive_passes": 3,
-        "min_unique_drills": 6,
-        "require_priority_1": True,
-        "techniques": ["Hyper-pronunciation", "Rubber band stretch on stressed syllables"],
-    },
-    2: {
-        "name": "Function Word Reduction",
-        "description": "Reduce unstressed function words (to→tuh, the→thuh)",
-        "npvi_target": 50,
-        "min_rhythm_score": 6,
-        "consecutive_passes": 3,
-        "min_unique_drills": 5,
-        "require_priority_1": True,
-        "techniques": ["Schwa reduction", "Backward build-up"],
-    },
-    3: {
-        "name": "Compound Stress",
-        "description": "Master compound word stress (HOT dog vs hot DOG)",
-        "npvi_target": 53,
-        "min_rhythm_score": 6,
-        "consecutive_passes": 3,
-        "min_unique_drills": 4,
-        "require_priority_1": True,
-        "techniques": ["Contrastive pairs", "Meaning-based stress"],
-    },
-    4: {
-        "name": "Thought Groups",
-        "description": "Group words into natural phrases with pauses",
-        "npvi_target": 55,
-        "min_rhythm_score": 7,
-        "consecutive_passes": 3,
-        "min_unique_drills": 4,
-        "require_priority_1": True,
-        "techniques": ["Phrase chunking", "Strategic pausing"],
-    },
-    5: {
-        "name": "Full Sentence Rhythm",
-        "description": "Apply stress-timing to complete sentences",
-        "npvi_target": 58,
-        "min_rhythm_score": 7,
-        "consecutive_passes": 3,
-        "min_unique_drills": 5,
-        "require_priority_1": True,
-        "techniques": ["Shadowing", "Content vs function word contrast"],
-    },
-    6: {
-        "name": "Connected Speech",
-        "description": "Master natural reductions (gonna, wanna) and linking",
-        "npvi_target": 60,
-        "min_rhythm_score": 8,
-        "consecutive_passes": 3,
-        "min_unique_drills": 4,
-        "require_priority_1": True,
-        "techniques": ["Contractions", "Linking sounds", "Elision"],
-    },
+RHYTHM_LEVEL_CONFIG: dict[int, LevelConfig] = {
+    1: LevelConfig(
+        name="Word Stress",
+        description="Learn basic word stress patterns",
+        npvi_target=45,
+        min_rhythm_score=5,
+        consecutive_passes=3,
+        min_unique_drills=6,
+        require_priority_1=True,
+        techniques=("Hyper-pronunciation", "Rubber band stretch on stressed syllables"),
+    ),
+    2: LevelConfig(
+        name="Function Word Reduction",
+        description="Reduce unstressed function words (to→tuh, the→thuh)",
+        npvi_target=50,
+        min_rhythm_score=6,
+        consecutive_passes=3,
+        min_unique_drills=5,
+        require_priority_1=True,
+        techniques=("Schwa reduction", "Backward build-up"),
+    ),
+    3: LevelConfig(
+        name="Compound Stress",
+        description="Master compound word stress (HOT dog vs hot DOG)",
+        npvi_target=53,
+        min_rhythm_score=6,
+        consecutive_passes=3,
+        min_unique_drills=4,
+        require_priority_1=True,
+        techniques=("Contrastive pairs", "Meaning-based stress"),
+    ),
+    4: LevelConfig(
+        name="Thought Groups",
+        description="Group words into natural phrases with pauses",
+        npvi_target=55,
+        min_rhythm_score=7,
+        consecutive_passes=3,
+        min_unique_drills=4,
+        require_priority_1=True,
+        techniques=("Phrase chunking", "Strategic pausing"),
+    ),
+    5: LevelConfig(
+        name="Full Sentence Rhythm",
+        description="Apply stress-timing to complete sentences",
+        npvi_target=58,
+        min_rhythm_score=7,
+        consecutive_passes=3,
+        min_unique_drills=5,
+        require_priority_1=True,
+        techniques=("Shadowing", "Content vs function word contrast"),
+    ),
+    6: LevelConfig(
+        name="Connected Speech",
+        description="Master natural reductions (gonna, wanna) and linking",
+        npvi_target=60,
+        min_rhythm_score=8,
+        consecutive_passes=3,
+        min_unique_drills=4,
+        require_priority_1=True,
+        techniques=("Contractions", "Linking sounds", "Elision"),
+    ),
+}
+
+# Comma-joined technique names per level, for prompt building
+_LEVEL_TECHNIQUES_JOINED = {
+    level: ", ".join(cfg.techniques)
+    for level, cfg in RHYTHM_LEVEL_CONFIG.items()
 }
 
 # Technique explanations for rhythm training
@@ -164,6 +186,8 @@ TECHNIQUE_EXPLANATIONS = {
 # Set your API key via environment variable: export GEMINI_API_KEY=your_key
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 GEMINI_MODEL = "gemini-2.5-flash-lite"
+GEMINI_TIMEOUT = 60  # Seconds per request before giving up on a stalled call
+GEMINI_RETRY_ATTEMPTS = 2  # Total tries for timeouts, connect errors and 429/5xx
 
 # Gemini Live API settings (real-time streaming)
 GEMINI_LIVE_MODEL = "gemini-2.0-flash-exp"
@@ -1,6 +1,7 @@
 """Feedback display module for prosody analysis results."""
 
-from rich.console import Console
+from rich.align import Align
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
@@ -15,36 +16,79 @@ from analyzer import ProsodyAnalysis
 console = Console()
 
 
-def score_to_bar(score: int, width: int = 10) -> str:
-    """Convert score (1-10) to a progress bar."""
+def _flush(renderables: list) -> None:
+    """
+    Print buffered renderables in a single render pass.
+
+    Console.print buffers every segment of the Group and writes the result
+    to the console's file once, so each display is one stdout write.
+    """
+    console.print(Group(*renderables))
+
+
+def _compute_bar(score: int, width: int = 10) -> str:
+    """Build the progress bar markup for a score."""
     filled = int(score * width / 10)
     empty = width - filled
     return "[green]" + "" * filled + "[/green][dim]" + "" * empty + "[/dim]"
 
 
+# Bars and colors for every 0-10 score at the default width, built once
+_BAR_CACHE = tuple(_compute_bar(s) for s in range(11))
+_COLOR_CACHE = ("red",) * 5 + ("yellow",) * 3 + ("green",) * 3
+_BAR_TEXT_CACHE = tuple(Text.from_markup(bar) for bar in _BAR_CACHE)
+
+# Pre-styled check marks for the rhythm feedback table
+_CHECK = Text.assemble(("✓", "green"))
+_CROSS = Text.assemble(("✗", "red"))
+_PENDING = Text.assemble(("○", "yellow"))
+
+
+def score_to_bar(score: int, width: int = 10) -> str:
+    """Convert score (1-10) to a progress bar."""
+    if width == 10 and 0 <= score < 11:
+        return _BAR_CACHE[int(score)]
+    return _compute_bar(score, width)
+
+
 def score_to_color(score: int) -> str:
     """Get color based on score."""
-    if score >= 8:
-        return "green"
-    elif score >= 5:
-        return "yellow"
+    return _COLOR_CACHE[max(0, min(10, int(score)))]
+
+
+def _score_cell(score: int) -> Text:
+    """Bar plus colored "score/10" table cell, built without markup parsing."""
+    if 0 <= score < 11:
+        bar = _BAR_TEXT_CACHE[int(score)]
     else:
-        return "red"
+        bar = Text.from_markup(score_to_bar(score))
+    return Text.assemble(bar, "  ", (f"{score}/10", score_to_color(score)))
+
+
+# Top tip per component, in the order display_analysis compares scores
+_TIPS = (
+    ("pitch", "Try raising pitch on emphasized words and letting it fall naturally at sentence ends."),
+    ("volume", "Speak louder on key words (nouns, verbs, adjectives) and softer on function words."),
+    ("tempo", "Slow down before important points, speed up on less critical information."),
+    ("rhythm", "Reduce unstressed syllables: 'comfortable' -> 'COMF-ter-ble', not 'com-for-ta-ble'."),
+    ("pauses", "Add a brief pause before delivering key information to create anticipation."),
+)
 
 
 def display_analysis(analysis: ProsodyAnalysis) -> None:
     """Display complete prosody analysis with rich formatting."""
+    parts = []
 
     # Header
-    console.print()
-    console.print(
+    parts.append("")
+    parts.append(
         Panel(
             f"[bold]Duration:[/bold] {analysis.duration:.1f} seconds",
             title="[bold blue]PROSODY ANALYSIS[/bold blue]",
             border_style="blue",
         )
     )
-    console.print()
+    parts.append("")
 
     # Main scores table
     table = Table(
@@ -60,91 +104,81 @@ def display_analysis(analysis: ProsodyAnalysis) -> None:
 
     # Pitch row
     pitch = analysis.pitch
-    pitch_color = score_to_color(pitch.score)
     table.add_row(
         "Pitch",
-        f"{score_to_bar(pitch.score)}  [{pitch_color}]{pitch.score}/10[/{pitch_color}]",
+        _score_cell(pitch.score),
         f"Range: {pitch.min_hz:.0f}-{pitch.max_hz:.0f} Hz\nVariation: {pitch.range_hz:.0f} Hz",
         pitch.feedback,
     )
 
     # Volume row
     volume = analysis.volume
-    volume_color = score_to_color(volume.score)
     table.add_row(
         "Volume",
-        f"{score_to_bar(volume.score)}  [{volume_color}]{volume.score}/10[/{volume_color}]",
+        _score_cell(volume.score),
         f"Range: {volume.dynamic_range_db:.1f} dB\nStress contrast: {volume.stress_contrast_db:.1f} dB",
         volume.feedback,
     )
 
     # Tempo row
     tempo = analysis.tempo
-    tempo_color = score_to_color(tempo.score)
     table.add_row(
         "Tempo",
-        f"{score_to_bar(tempo.score)}  [{tempo_color}]{tempo.score}/10[/{tempo_color}]",
+        _score_cell(tempo.score),
         f"Speed: {tempo.estimated_wpm:.0f} WPM\nVariation: {tempo.variation_percent:.0f}%",
         tempo.feedback,
     )
 
     # Rhythm row
     rhythm = analysis.rhythm
-    rhythm_color = score_to_color(rhythm.score)
     rhythm_type = "Syllable-timed" if rhythm.is_syllable_timed else "Stress-timed"
     table.add_row(
         "Rhythm",
-        f"{score_to_bar(rhythm.score)}  [{rhythm_color}]{rhythm.score}/10[/{rhythm_color}]",
+        _score_cell(rhythm.score),
         f"PVI: {rhythm.pvi:.0f}\nType: {rhythm_type}",
         rhythm.feedback,
     )
 
     # Pauses row
     pauses = analysis.pauses
-    pauses_color = score_to_color(pauses.score)
     table.add_row(
         "Pauses",
-        f"{score_to_bar(pauses.score)}  [{pauses_color}]{pauses.score}/10[/{pauses_color}]",
+        _score_cell(pauses.score),
         f"Count: {pauses.pause_count}\nAvg duration: {pauses.avg_pause_duration:.1f}s",
         pauses.feedback,
     )
 
-    console.print(table)
+    parts.append(table)
 
     # Overall score
     overall_color = score_to_color(int(analysis.overall_score))
-    console.print()
-    console.print(
-        Panel(
-            f"[bold {overall_color}]{analysis.overall_score:.1f}/10[/bold {overall_color}]",
+    parts.append("")
+    parts.append(
+        Align.center(Panel(
+            Text.from_markup(
+                f"[bold {overall_color}]{analysis.overall_score:.1f}/10[/bold {overall_color}]",
+                justify="center",
+            ),
             title="[bold]Overall Score[/bold]",
             border_style=overall_color,
             width=30,
-        ),
-        justify="center",
+        ))
     )
 
-    # Top tip based on lowest score
-    lowest = min(
-        [
-            (pitch.score, "pitch", "Try raising pitch on emphasized words and letting it fall naturally at sentence ends."),
-            (volume.score, "volume", "Speak louder on key words (nouns, verbs, adjectives) and softer on function words."),
-            (tempo.score, "tempo", "Slow down before important points, speed up on less critical information."),
-            (rhythm.score, "rhythm", "Reduce unstressed syllables: 'comfortable' -> 'COMF-ter-ble', not 'com-for-ta-ble'."),
-            (pauses.score, "pauses", "Add a brief pause before delivering key information to create anticipation."),
-        ],
-        key=lambda x: x[0],
-    )
+    # Top tip based on lowest score (first component wins ties)
+    scores = (pitch.score, volume.score, tempo.score, rhythm.score, pauses.score)
+    focus, tip = _TIPS[min(range(len(scores)), key=scores.__getitem__)]
 
-    console.print()
-    console.print(
+    parts.append("")
+    parts.append(
         Panel(
-            f"[bold]Focus on {lowest[1]}:[/bold] {lowest[2]}",
+            f"[bold]Focus on {focus}:[/bold] {tip}",
             title="[bold yellow]Top Tip[/bold yellow]",
             border_style="yellow",
         )
     )
-    console.print()
+    parts.append("")
+    _flush(parts)
 
 
 def display_quick_feedback(analysis: ProsodyAnalysis) -> None:
@@ -165,8 +199,8 @@ def display_quick_feedback(analysis: ProsodyAnalysis) -> None:
 
 def display_comparison(analysis1: ProsodyAnalysis, analysis2: ProsodyAnalysis, label1: str = "Recording 1", label2: str = "Recording 2") -> None:
     """Display side-by-side comparison of two analyses."""
-    console.print()
-    console.print(Panel("[bold]COMPARISON[/bold]", border_style="blue"))
+    parts = [""]
+    parts.append(Panel("[bold]COMPARISON[/bold]", border_style="blue"))
 
     table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
     table.add_column("Component", style="bold", width=12)
@@ -199,20 +233,66 @@ def display_comparison(analysis1: ProsodyAnalysis, analysis2: ProsodyAnalysis, l
             diff_str,
         )
 
-    console.print(table)
-    console.print()
+    parts.append(table)
+    parts.append("")
+    _flush(parts)
 
 
 # =============================================================================
 # Rhythm Training Display Functions
 # =============================================================================
 
+# Config tables, bound on first use by the rhythm display functions
+_RHYTHM_LEVEL_CONFIG = None
+_TECHNIQUE_EXPLANATIONS = None
+_TECHNIQUE_LC = None  # (lowercased key, key, explanation) for partial matching
+
+
+def _level_config() -> dict:
+    """Return RHYTHM_LEVEL_CONFIG, importing it on first call."""
+    global _RHYTHM_LEVEL_CONFIG
+    if _RHYTHM_LEVEL_CONFIG is None:
+        from config import RHYTHM_LEVEL_CONFIG
+        _RHYTHM_LEVEL_CONFIG = RHYTHM_LEVEL_CONFIG
+    return _RHYTHM_LEVEL_CONFIG
+
+
+def _technique_explanations() -> dict:
+    """Return TECHNIQUE_EXPLANATIONS, importing it (and _TECHNIQUE_LC) on first call."""
+    global _TECHNIQUE_EXPLANATIONS, _TECHNIQUE_LC
+    if _TECHNIQUE_EXPLANATIONS is None:
+        from config import TECHNIQUE_EXPLANATIONS
+        _TECHNIQUE_EXPLANATIONS = TECHNIQUE_EXPLANATIONS
+        _TECHNIQUE_LC = [(k.lower(), k, v) for k, v in TECHNIQUE_EXPLANATIONS.items()]
+    return _TECHNIQUE_EXPLANATIONS
+
+
+# (progress, status) cells for the level table; in-progress rows are built
+# once per (consecutive, required) pair
+_LOCKED_ROW = ("[dim]🔒 Locked[/dim]", "")
+_MASTERED_ROW = ("[green]✓ ✓ ✓[/green]", "[green]Mastered[/green]")
+_PROGRESS_ROWS: dict[tuple[int, int], tuple[str, str]] = {}
+
+
+def _progress_row(consecutive: int, required: int) -> tuple[str, str]:
+    """Return the cached progress/status cells for a level in progress."""
+    row = _PROGRESS_ROWS.get((consecutive, required))
+    if row is None:
+        checks = "✓ " * consecutive + "○ " * (required - consecutive)
+        row = (
+            f"[yellow]{checks.strip()}[/yellow]",
+            f"[yellow]{consecutive}/{required}[/yellow]",
+        )
+        _PROGRESS_ROWS[(consecutive, required)] = row
+    return row
+
+
 def display_rhythm_progress(progress: dict) -> None:
     """Display rhythm training progress with level progress bars and nPVI trend."""
-    from config import RHYTHM_LEVEL_CONFIG
+    level_configs = _level_config()
 
-    console.print()
-    console.print(Panel(
+    parts = [""]
+    parts.append(Panel(
         "[bold]Rhythm Training Progress[/bold]",
         border_style="cyan",
     ))
@@ -232,20 +312,20 @@ def display_rhythm_progress(progress: dict) -> None:
         filled = int(npvi_normalized * npvi_bar_width / 100)
         empty = npvi_bar_width - filled
 
-        console.print()
-        console.print(f"[bold]nPVI:[/bold] {npvi_current:.0f} [{change_color}]({change_str})[/{change_color}]")
-        console.print(f"  [dim]35[/dim] [green]{'█' * filled}[/green][dim]{'░' * empty}[/dim] [dim]65[/dim]")
-        console.print(f"  [dim]Spanish-like → English-like[/dim]")
+        parts.append("")
+        parts.append(f"[bold]nPVI:[/bold] {npvi_current:.0f} [{change_color}]({change_str})[/{change_color}]")
+        parts.append(f"  [dim]35[/dim] [green]{'█' * filled}[/green][dim]{'░' * empty}[/dim] [dim]65[/dim]")
+        parts.append(f"  [dim]Spanish-like → English-like[/dim]")
 
     elif npvi_current:
-        console.print(f"\n[bold]Current nPVI:[/bold] {npvi_current:.0f}")
+        parts.append(f"\n[bold]Current nPVI:[/bold] {npvi_current:.0f}")
 
     # Level progress
     current_level = progress.get("current_level", 1)
     levels = progress.get("levels", {})
 
-    console.print()
-    console.print("[bold]Levels:[/bold]")
+    parts.append("")
+    parts.append("[bold]Levels:[/bold]")
 
     table = Table(box=box.SIMPLE, show_header=False, padding=(0, 1))
     table.add_column("Level", width=30)
@@ -254,10 +334,10 @@ def display_rhythm_progress(progress: dict) -> None:
 
     for level_num in range(1, 7):
         level_data = levels.get(level_num, {})
-        config = RHYTHM_LEVEL_CONFIG.get(level_num, {})
+        config = level_configs.get(level_num)
 
-        level_name = config.get("name", f"Level {level_num}")
-        required = config.get("consecutive_passes", 3)
+        level_name = config.name if config else f"Level {level_num}"
+        required = config.consecutive_passes if config else 3
         consecutive = level_data.get("consecutive_passes", 0)
         unlocked = level_data.get("unlocked_at") is not None
         mastered = consecutive >= required
@@ -267,15 +347,11 @@ def display_rhythm_progress(progress: dict) -> None:
 
         # Progress bar
         if not unlocked:
-            progress_str = "[dim]🔒 Locked[/dim]"
-            status = ""
+            progress_str, status = _LOCKED_ROW
         elif mastered:
-            progress_str = "[green]✓ ✓ ✓[/green]"
-            status = "[green]Mastered[/green]"
+            progress_str, status = _MASTERED_ROW
         else:
-            checks = "✓ " * consecutive + "○ " * (required - consecutive)
-            progress_str = f"[yellow]{checks.strip()}[/yellow]"
-            status = f"[yellow]{consecutive}/{required}[/yellow]"
+            progress_str, status = _progress_row(consecutive, required)
 
         # Highlight current level
         if level_num == current_level and not mastered:
@@ -283,17 +359,17 @@ def display_rhythm_progress(progress: dict) -> None:
 
         table.add_row(level_label, progress_str, status)
 
-    console.print(table)
-    console.print()
+    parts.append(table)
+    parts.append("")
+    _flush(parts)
 
 
 def display_level_unlock(level: int) -> None:
     """Display celebration when a new level is unlocked."""
-    from config import RHYTHM_LEVEL_CONFIG
-
-    config = RHYTHM_LEVEL_CONFIG.get(level, {})
-    level_name = config.get("name", f"Level {level}")
-    description = config.get("description", "")
+    config = _level_config().get(level)
+    level_name = config.name if config else f"Level {level}"
+    description = config.description if config else ""
+    techniques = config.techniques if config else ()
 
     console.print()
     console.print(Panel(
@@ -301,7 +377,7 @@ def display_level_unlock(level: int) -> None:
         f"[bold]{level_name}[/bold]\n"
         f"[dim]{description}[/dim]\n\n"
         f"[cyan]New techniques to practice:[/cyan]\n"
-        f"{chr(10).join('• ' + t for t in config.get('techniques', []))}",
+        f"{chr(10).join('• ' + t for t in techniques)}",
         border_style="green",
         title="[bold]CONGRATULATIONS[/bold]",
     ))
@@ -311,41 +387,40 @@ def display_level_unlock(level: int) -> None:
 def display_rhythm_feedback(result, prosody, level: int, passed: bool) -> None:
     """Display rhythm-specific feedback from AI analysis."""
 
-    console.print()
+    parts = [""]
 
     # Pass/Fail indicator
     if passed:
-        console.print(Panel(
+        parts.append(Panel(
             f"[bold green]✓ LEVEL {level} PASS[/bold green]",
             border_style="green",
         ))
     else:
-        console.print(Panel(
+        parts.append(Panel(
             f"[bold yellow]○ Keep practicing Level {level}[/bold yellow]",
             border_style="yellow",
         ))
 
     # Transcript
     if result.transcript:
-        console.print()
-        console.print(Panel(
+        parts.append("")
+        parts.append(Panel(
             f"[italic]{result.transcript}[/italic]",
             title="[bold blue]What you said[/bold blue]",
             border_style="blue",
         ))
 
     # Rhythm metrics
-    console.print()
+    parts.append("")
     table = Table(box=box.ROUNDED, show_header=True, title="[bold]Rhythm Analysis[/bold]", expand=True)
     table.add_column("Metric", style="bold", width=18)
     table.add_column("Value", justify="center", width=12)
     table.add_column("Feedback")  # No fixed width - let it expand
 
     # AI rhythm score
-    rhythm_color = score_to_color(result.rhythm_score)
     table.add_row(
         "AI Rhythm Score",
-        f"[{rhythm_color}]{result.rhythm_score}/10[/{rhythm_color}]",
+        Text.assemble((f"{result.rhythm_score}/10", score_to_color(result.rhythm_score))),
         result.timing_feedback,  # Full feedback
     )
 
@@ -354,8 +429,8 @@ def display_rhythm_feedback(result, prosody, level: int, passed: bool) -> None:
     npvi_color = "green" if npvi >= 55 else "yellow" if npvi >= 45 else "red"
     table.add_row(
         "nPVI (measured)",
-        f"[{npvi_color}]{npvi:.0f}[/{npvi_color}]",
-        "[dim]Target: 55-65 (English-like)[/dim]",
+        Text.assemble((f"{npvi:.0f}", npvi_color)),
+        Text.assemble(("Target: 55-65 (English-like)", "dim")),
     )
 
     # AI nPVI estimate
@@ -363,12 +438,12 @@ def display_rhythm_feedback(result, prosody, level: int, passed: bool) -> None:
         est_color = "green" if result.npvi_estimate >= 55 else "yellow" if result.npvi_estimate >= 45 else "red"
         table.add_row(
             "nPVI (AI estimate)",
-            f"[{est_color}]{result.npvi_estimate:.0f}[/{est_color}]",
-            "[dim]Based on AI perception[/dim]",
+            Text.assemble((f"{result.npvi_estimate:.0f}", est_color)),
+            Text.assemble(("Based on AI perception", "dim")),
         )
 
     # Stress correct
-    stress_check = "[green]✓[/green]" if result.stress_correct else "[red]✗[/red]"
+    stress_check = _CHECK if result.stress_correct else _CROSS
     table.add_row(
         "Stress Patterns",
         stress_check,
@@ -377,33 +452,33 @@ def display_rhythm_feedback(result, prosody, level: int, passed: bool) -> None:
 
     # Function reduction (for levels 2+)
     if level >= 2:
-        reduction_check = "[green]✓[/green]" if result.function_reduction else "[yellow]○[/yellow]"
+        reduction_check = _CHECK if result.function_reduction else _PENDING
         table.add_row(
             "Function Reduction",
             reduction_check,
             result.reduction_feedback,  # Full feedback
         )
 
-    console.print(table)
+    parts.append(table)
 
     # Word stress issues
     if result.word_stress_issues:
-        console.print()
-        console.print("[bold red]Word Stress Issues:[/bold red]")
+        parts.append("")
+        parts.append("[bold red]Word Stress Issues:[/bold red]")
         for issue in result.word_stress_issues:
-            console.print(f"  [red]•[/red] [bold]{issue.get('word', '')}[/bold]")
+            parts.append(f"  [red]•[/red] [bold]{issue.get('word', '')}[/bold]")
             expected = issue.get('expected', '')
             heard = issue.get('heard', '')
             if expected and heard:
-                console.print(f"    Expected: {expected} → Heard: {heard}")
+                parts.append(f"    Expected: {expected} → Heard: {heard}")
             tip = issue.get('tip', '')
             if tip:
-                console.print(f"    [dim]{tip}[/dim]")
+                parts.append(f"    [dim]{tip}[/dim]")
 
     # Technique tip
     if result.technique_tip:
-        console.print()
-        console.print(Panel(
+        parts.append("")
+        parts.append(Panel(
             f"[yellow]{result.technique_tip}[/yellow]",
             title="[bold yellow]Technique Tip[/bold yellow]",
             border_style="yellow",
@@ -411,7 +486,7 @@ def display_rhythm_feedback(result, prosody, level: int, passed: bool) -> None:
 
     # Connected speech guidance (AI-generated)
     if result.linked or result.stress_pattern:
-        console.print()
+        parts.append("")
         content = ""
         if result.stress_pattern:
             content += f"[bold white]Pattern:[/bold white] [white]{result.stress_pattern}[/white]  [dim](o = unstressed, O = STRESSED)[/dim]\n\n"
@@ -419,7 +494,7 @@ def display_rhythm_feedback(result, prosody, level: int, passed: bool) -> None:
             content += f"[bold yellow]Say it like:[/bold yellow] [yellow]{result.linked}[/yellow]"
             if result.linked_ipa:
                 content += f"\n[dim yellow]{result.linked_ipa}[/dim yellow]"
-        console.print(Panel(
+        parts.append(Panel(
             content.strip(),
             title="[bold cyan]Connected Speech[/bold cyan]",
             border_style="cyan",
@@ -427,18 +502,17 @@ def display_rhythm_feedback(result, prosody, level: int, passed: bool) -> None:
 
     # Encouragement
     if result.encouragement:
-        console.print()
-        console.print(f"[green]{result.encouragement}[/green]")
+        parts.append("")
+        parts.append(f"[green]{result.encouragement}[/green]")
 
-    console.print()
+    parts.append("")
+    _flush(parts)
 
 
 def display_rhythm_drill_intro(drill: dict, level: int) -> None:
     """Display the drill introduction with text and technique."""
-    from config import RHYTHM_LEVEL_CONFIG, TECHNIQUE_EXPLANATIONS
-
-    config = RHYTHM_LEVEL_CONFIG.get(level, {})
-    level_name = config.get("name", f"Level {level}")
+    config = _level_config().get(level)
+    level_name = config.name if config else f"Level {level}"
 
     # Build panel content with text and IPA
     content = f"[bold white]{drill.get('text', '')}[/bold white]"
@@ -471,10 +545,12 @@ def display_rhythm_drill_intro(drill: dict, level: int) -> None:
             # Short label - look up detailed explanation
             console.print(f"\n[bold cyan]Technique: {technique_text}[/bold cyan]")
             # Try exact match first, then partial match
-            explanation = TECHNIQUE_EXPLANATIONS.get(technique_text)
+            technique_explanations = _technique_explanations()
+            explanation = technique_explanations.get(technique_text)
             if not explanation:
-                for key, value in TECHNIQUE_EXPLANATIONS.items():
-                    if key.lower() in technique_text.lower() or technique_text.lower() in key.lower():
+                technique_lc = technique_text.lower()
+                for key_lc, _key, value in _TECHNIQUE_LC:
+                    if key_lc in technique_lc or technique_lc in key_lc:
                         explanation = value
                         break
             if explanation:
@@ -487,6 +563,15 @@ def display_rhythm_drill_intro(drill: dict, level: int) -> None:
 # Real-Time Feedback Display
 # =============================================================================
 
+# Fixed status lines for the live display states that carry no data
+_STATE_TEXTS = {
+    "playing_tts": Text("  Listen first...", style="bold cyan"),
+    "listening": Text("  Recording - speak now...", style="bold red"),
+    "processing": Text("  Processing...", style="dim"),
+    "transitioning": Text("\n  [Next drill in 2s...]", style="dim"),
+}
+
+
 class LiveFeedbackDisplay:
     """
     Real-time feedback display using Rich Live for streaming updates.
@@ -496,7 +581,8 @@ class LiveFeedbackDisplay:
 
     def __init__(self, console: Console = None):
         """Initialize the live feedback display."""
-        self.console = console or Console()
+        # Fall back to the shared module console (the parameter shadows its name)
+        self.console = console if console is not None else globals()["console"]
         self.live: Optional[Live] = None
         self._current_state = "idle"
         self._drill_text = ""
@@ -506,25 +592,51 @@ class LiveFeedbackDisplay:
         self._result_text = ""
         self._score = 0
         self._passed = False
+        self._dirty = True  # Display state changed since the last live update
+        self._cache_key = None  # State tuple of the last built panel
+        self._cache_panel: Optional[Panel] = None
+        self._text = Text()  # Panel content, reused across builds
+        self._prefix_key = None  # (drill text, IPA) currently at the start of _text
+        self._static_len = 0  # Length of the drill prefix in _text
 
     def _build_display(self) -> Panel:
         """Build the current display panel based on state."""
-        content = Text()
-
-        # Drill text
-        if self._drill_text:
-            content.append(self._drill_text + "\n", style="bold white")
-            if self._drill_ipa:
-                content.append(f"/{self._drill_ipa}/\n", style="dim cyan")
-            content.append("\n")
+        key = (
+            self._current_state,
+            self._drill_text,
+            self._drill_ipa,
+            self._level,
+            self._partial_feedback,
+            self._result_text,
+            self._score,
+            self._passed,
+        )
+        if key == self._cache_key:
+            return self._cache_panel
+
+        # The drill prefix only changes with set_drill, so keep it and drop
+        # just the previous state suffix
+        content = self._text
+        prefix_key = (self._drill_text, self._drill_ipa)
+        keep = self._static_len if prefix_key == self._prefix_key else 0
+        if len(content) > keep:  # right_crop(0) would empty the text
+            content.right_crop(len(content) - keep)
+
+        if prefix_key != self._prefix_key:
+            # Drill text
+            if self._drill_text:
+                content.append(self._drill_text + "\n", style="bold white")
+                if self._drill_ipa:
+                    content.append(f"/{self._drill_ipa}/\n", style="dim cyan")
+                content.append("\n")
+
+            self._prefix_key = prefix_key
+            self._static_len = len(content)
 
         # State-specific content
-        if self._current_state == "playing_tts":
-            content.append("  Listen first...", style="bold cyan")
-        elif self._current_state == "listening":
-            content.append("  Recording - speak now...", style="bold red")
-        elif self._current_state == "processing":
-            content.append("  Processing...", style="dim")
+        state_text = _STATE_TEXTS.get(self._current_state)
+        if state_text is not None:
+            content.append_text(state_text)
         elif self._current_state == "feedback":
             if self._partial_feedback:
                 content.append(f"  {self._partial_feedback}", style="yellow")
@@ -535,27 +647,29 @@ class LiveFeedbackDisplay:
                 content.append(f"  Keep practicing ({self._score}/10) - ", style="bold yellow")
             if self._result_text:
                 content.append(self._result_text)
-        elif self._current_state == "transitioning":
-            content.append("\n  [Next drill in 2s...]", style="dim")
 
         border_style = "green" if self._passed and self._current_state == "result" else "blue"
 
-        return Panel(
+        self._cache_key = key
+        self._cache_panel = Panel(
             content,
             title=f"[bold]Level {self._level}: Real-Time Rhythm[/bold]",
             subtitle="[dim]say 'stop' or press 'q' to quit[/dim]",
             border_style=border_style,
         )
+        return self._cache_panel
 
     def start(self):
         """Start the live display."""
+        # No auto-refresh thread: the display only redraws on state changes
         self.live = Live(
             self._build_display(),
             console=self.console,
-            refresh_per_second=4,
+            auto_refresh=False,
             transient=False,
         )
-        self.live.start()
+        self.live.start(refresh=True)
+        self._dirty = False
 
     def stop(self):
         """Stop the live display."""
@@ -565,58 +679,64 @@ class LiveFeedbackDisplay:
 
     def set_drill(self, text: str, ipa: str = "", level: int = 1):
         """Set the current drill information."""
-        self._drill_text = text
-        self._drill_ipa = ipa
-        self._level = level
-        self._partial_feedback = ""
-        self._result_text = ""
-        self._passed = False
-        self._update()
+        self._set(
+            _drill_text=text,
+            _drill_ipa=ipa,
+            _level=level,
+            _partial_feedback="",
+            _result_text="",
+            _passed=False,
+        )
 
     def show_playing_tts(self):
         """Show that TTS is playing."""
-        self._current_state = "playing_tts"
-        self._update()
+        self._set(_current_state="playing_tts")
 
     def show_listening(self):
         """Show listening state with animation."""
-        self._current_state = "listening"
-        self._update()
+        self._set(_current_state="listening")
 
     def show_processing(self):
         """Show processing state."""
-        self._current_state = "processing"
-        self._update()
+        self._set(_current_state="processing")
 
     def update_partial_feedback(self, feedback: str):
         """Update with partial streaming feedback."""
-        self._current_state = "feedback"
-        self._partial_feedback = feedback
-        self._update()
+        self._set(_current_state="feedback", _partial_feedback=feedback)
 
     def show_result(self, passed: bool, score: int, feedback: str = ""):
         """Show the final result."""
-        self._current_state = "result"
-        self._passed = passed
-        self._score = score
-        self._result_text = feedback
-        self._update()
+        self._set(
+            _current_state="result",
+            _passed=passed,
+            _score=score,
+            _result_text=feedback,
+        )
 
     def show_transitioning(self):
         """Show transitioning to next drill."""
-        self._current_state = "transitioning"
-        self._update()
+        self._set(_current_state="transitioning")
 
     def clear(self):
         """Clear and reset the display."""
-        self._current_state = "idle"
-        self._drill_text = ""
-        self._drill_ipa = ""
-        self._partial_feedback = ""
-        self._result_text = ""
+        self._set(
+            _current_state="idle",
+            _drill_text="",
+            _drill_ipa="",
+            _partial_feedback="",
+            _result_text="",
+        )
+
+    def _set(self, **values):
+        """Assign display fields, marking the display dirty only on change."""
+        for name, value in values.items():
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                self._dirty = True
         self._update()
 
     def _update(self):
-        """Update the live display."""
-        if self.live:
-            self.live.update(self._build_display())
+        """Update the live display if anything changed since the last update."""
+        if self._dirty and self.live:
+            self.live.update(self._build_display(), refresh=True)
+            self._dirty = False
@@ -1,55 +1,165 @@
 #!/usr/bin/env python3
 """Prosody Coach CLI - Improve your English pronunciation and speaking patterns."""
 
-import typer
+import sys
+from pathlib import Path
+
 from rich.console import Console
+
+# `info` and `tips` only print static text, so serve them before typer and
+# storage (sqlite, .env loading) are imported
+if (__name__ == "__main__" or Path(sys.argv[0]).name == "prosody") and sys.argv[1:] in (["info"], ["tips"]):
+    from cli_text import show_info, show_tips
+
+    (show_info if sys.argv[1] == "info" else show_tips)(Console())
+    sys.exit(0)
+
+import typer
+from datetime import datetime
 from rich.panel import Panel
-from pathlib import Path
 from typing import Optional
 
-from recorder import record_audio, save_recording, load_audio, get_duration, play_audio, play_tts
-from analyzer import analyze_prosody
-from feedback import display_analysis, display_quick_feedback
-from coach import analyze_with_coach, analyze_parallel, display_coaching
-from prompts import (
-    get_prompt_by_id,
-    get_prompts_by_category,
-    get_all_categories,
-    get_random_prompt,
-    list_all_prompts,
-    get_rhythm_drill,
-    get_rhythm_drills_by_level,
-    get_random_rhythm_drill,
-)
-from storage import (
-    save_session, get_history, get_stats, get_best_and_worst, get_session,
-    get_user_weaknesses, get_due_sounds, update_sound_after_practice, get_sound_stats,
-    get_due_words, update_word_after_practice, get_word_stats,
-    get_rhythm_progress, set_rhythm_baseline, update_rhythm_progress,
-    save_rhythm_drill_attempt, get_due_rhythm_drills, get_available_levels,
-)
-
+# recorder, analyzer, feedback, coach, prompts and storage are imported
+# inside the commands that use them, so commands only load PortAudio,
+# numpy/parselmouth, the Gemini client or sqlite when they need them
+import functools
+import hashlib
+import pickle
 import re
+import time
+
+# Bump when analyzer changes would make cached results stale
+_ANALYSIS_CACHE_VERSION = 2
 
+# First word of a pronunciation-issue example, for spaced-repetition matching
+_LEADING_WORD_RE = re.compile(r'^([a-z]+)')
 
-def normalize_sound_name(sound: str) -> str:
+
+def cached_analyze(audio_data, sample_rate: int, source: Optional[Path] = None, use_cache: bool = True):
     """
-    Normalize a sound name for comparison by removing markdown formatting.
+    Run analyze_prosody, reusing a cached result for an unchanged audio file.
 
-    Examples:
-        '- **Consonant Clusters**' -> 'consonant clusters'
-        '1. S-Clusters' -> 's-clusters'
-        '- SOUND: /θ/' -> 'sound: /θ/'
+    The cache key is the file's resolved path, size and mtime, so a hit
+    needs no hashing of the samples. Live recordings (no source) are
+    always analyzed.
+
+    Args:
+        audio_data: Audio samples loaded from source
+        sample_rate: Sample rate in Hz
+        source: Audio file the samples came from, if any
+        use_cache: Set False to force a fresh analysis
+
+    Returns:
+        ProsodyAnalysis for the audio
     """
-    s = sound.strip()
-    # Remove leading dash/bullet and space
-    s = re.sub(r'^[-•]\s*', '', s)
-    # Remove leading numbers with dot or parenthesis
-    s = re.sub(r'^\d+[.)]\s*', '', s)
-    # Remove markdown bold markers
-    s = s.replace('**', '')
-    # Convert to lowercase and strip
-    return s.lower().strip()
+    from analyzer import analyze_prosody
+    from config import ANALYSIS_CACHE_DIR
+
+    if source is None or not use_cache:
+        return analyze_prosody(audio_data, sample_rate)
+
+    stat = source.stat()
+    key = f"{_ANALYSIS_CACHE_VERSION}|{source.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+    cache_path = ANALYSIS_CACHE_DIR / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass  # Missing or unreadable entry: recompute
+
+    analysis = analyze_prosody(audio_data, sample_rate)
+    try:
+        ANALYSIS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(analysis, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Caching is best-effort
+    return analysis
+
+
+# Response sections, in order, used to report streaming coaching progress
+_STREAM_SECTIONS = ("TRANSCRIPT", "GRAMMAR", "COACHING", "CONFIDENCE", "FLUENCY", "PROSODY", "OVERALL")
+_SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+
+
+def _stream_progress(stream_state: dict):
+    """
+    Build an on_chunk callback that tracks a streaming coaching response.
+
+    The callback records the latest section seen and a short transcript
+    preview in stream_state, for _stream_status to render.
+    """
+    def on_chunk(chunk, accumulated):
+        stream_state["chunks"] += 1
+        # Detect which section we're in
+        for section in reversed(_STREAM_SECTIONS):
+            if section in accumulated:
+                stream_state["section"] = section.capitalize()
+                break
+
+        # Get transcript preview when available
+        if "TRANSCRIPT:" in accumulated and not stream_state["preview"]:
+            lines = accumulated.split("\n")
+            for i, line in enumerate(lines):
+                if "TRANSCRIPT:" in line:
+                    for next_line in lines[i+1:i+3]:
+                        if next_line.strip() and not next_line.startswith("["):
+                            stream_state["preview"] = next_line.strip()[:50]
+                            break
+                    break
+
+    return on_chunk
+
+
+def _stream_status(stream_state: dict, frame: int, label: str = "Analyzing"):
+    """Render the spinner line for a streaming coaching response."""
+    from rich.text import Text
+
+    spinner = _SPINNER_FRAMES[frame % len(_SPINNER_FRAMES)]
+    text = Text()
+    text.append(f"  {spinner} ", style="cyan")
+    text.append(label, style="cyan bold")
+    text.append(f"  {stream_state['section']}", style="dim")
+    if stream_state["preview"]:
+        text.append(f'\n  "{stream_state["preview"]}..."', style="italic dim")
+    return text
+
+
+class _StreamStatus:
+    """Live renderable for _stream_status, with the spinner frame taken from the clock."""
+
+    def __init__(self, stream_state: dict, label: str = "Analyzing"):
+        self.stream_state = stream_state
+        self.label = label
+
+    def __rich__(self):
+        return _stream_status(self.stream_state, int(time.monotonic() * 10), self.label)
+
+
+def _cli_errors(cancelled: str):
+    """
+    Give a command body the shared Ctrl-C and error handling.
+
+    Ctrl-C stops any sounddevice playback or recording still running, prints
+    `cancelled` and exits 0; any other error is printed and exits 1.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except KeyboardInterrupt:
+                sd = sys.modules.get("sounddevice")
+                if sd is not None:
+                    sd.stop()
+                console.print(f"\n[yellow]{cancelled}[/yellow]")
+                raise typer.Exit(0)
+            except Exception as e:
+                console.print(f"\n[red]Error: {e}[/red]")
+                raise typer.Exit(1)
+        return wrapper
+    return decorator
 
 
 app = typer.Typer(
@@ -62,10 +172,10 @@ console = Console()
 
 @app.command()
 def analyze(
-    file: Optional[Path] = typer.Option(
+    file: Optional[list[Path]] = typer.Option(
         None,
         "--file", "-f",
-        help="Analyze an existing audio file instead of recording.",
+        help="Analyze an existing audio file instead of recording. Repeat, or pass a directory, to analyze a batch.",
         exists=True,
     ),
     save: bool = typer.Option(
@@ -88,6 +198,11 @@ def analyze(
         "--playback", "-p",
         help="Play back your recording after analysis.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-analyze a --file input and re-request AI coaching even if cached results exist.",
+    ),
 ):
     """
     Record and analyze your speech prosody.
@@ -97,267 +212,283 @@ def analyze(
 
     Use --coach to enable AI-powered transcription, grammar correction,
     and personalized coaching tips.
-    """
-    try:
-        if file:
-            # Analyze existing file
-            console.print(f"\n[bold blue]Loading:[/bold blue] {file}")
-            audio_data, sample_rate = load_audio(file)
-            duration = get_duration(audio_data, sample_rate)
-            console.print(f"[dim]Duration: {duration:.1f} seconds[/dim]\n")
-        else:
-            # Record new audio
-            console.print()
-            console.print(
-                Panel(
-                    "[bold]Press Enter to stop recording[/bold]",
-                    title="[bold blue]Recording[/bold blue]",
-                    border_style="blue",
-                )
-            )
 
-            audio_data, sample_rate = record_audio()
-            duration = get_duration(audio_data, sample_rate)
+    Several files (or a directory of recordings) are analyzed in parallel,
+    local analysis only.
+    """
+    files = _expand_audio_paths(file or [])
+    if file and not files:
+        console.print("[red]No audio files found.[/red]")
+        raise typer.Exit(1)
 
-            console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
+    if len(files) > 1:
+        if coach or playback:
+            console.print("[dim]--coach and --playback apply to single files; skipping them for this batch.[/dim]")
+        _run_batch_analyze(files, quick, no_cache)
+        return
 
-            if duration < 1.0:
-                console.print("[red]Recording too short. Please speak for at least 2 seconds.[/red]")
-                raise typer.Exit(1)
+    _run_analyze(files[0] if files else None, save, quick, coach, playback, no_cache)
 
-            if save:
-                filepath = save_recording(audio_data, sample_rate)
-                console.print(f"[dim]Saved to: {filepath}[/dim]\n")
 
-        # Initialize result variables
-        transcript = None
-        ai_summary = None
-        ai_tips = None
-        grammar_issues = None
-        suggested_revision = None
-        confidence_score = None
-        confidence_feedback = None
-        filler_word_count = None
-        filler_words_detail = None
-        pronunciation_issues = None
-        fluency_score = None
-        fluency_feedback = None
-        analysis = None
-        coaching = None
-
-        if coach:
-            # PARALLEL MODE: Run prosody + Gemini simultaneously with streaming
-            from rich.live import Live
-            from rich.spinner import Spinner
-            from rich.text import Text
-
-            # Track streaming progress
-            stream_state = {"section": "Starting", "preview": "", "chunks": 0}
-
-            def on_chunk(chunk, accumulated):
-                stream_state["chunks"] += 1
-                # Detect which section we're in
-                sections = ["TRANSCRIPT", "GRAMMAR", "COACHING", "CONFIDENCE", "FLUENCY", "PROSODY", "OVERALL"]
-                for section in reversed(sections):
-                    if section in accumulated:
-                        stream_state["section"] = section.capitalize()
-                        break
-
-                # Get transcript preview when available
-                if "TRANSCRIPT:" in accumulated and not stream_state["preview"]:
-                    lines = accumulated.split("\n")
-                    for i, line in enumerate(lines):
-                        if "TRANSCRIPT:" in line:
-                            for next_line in lines[i+1:i+3]:
-                                if next_line.strip() and not next_line.startswith("["):
-                                    stream_state["preview"] = next_line.strip()[:50]
-                                    break
-                            break
+# Extensions picked up when --file names a directory
+_AUDIO_SUFFIXES = {".wav", ".flac", ".ogg", ".aiff", ".aif"}
 
-            try:
-                with Live(console=console, refresh_per_second=4, transient=True) as live:
-                    import threading
-                    result_holder = {"analysis": None, "coaching": None, "error": None}
-
-                    def run_analysis():
-                        try:
-                            result_holder["analysis"], result_holder["coaching"] = analyze_parallel(
-                                audio_data, sample_rate, on_chunk
-                            )
-                        except Exception as e:
-                            result_holder["error"] = str(e)
-
-                    thread = threading.Thread(target=run_analysis)
-                    thread.start()
-
-                    # Update display while waiting
-                    spinner_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-                    frame = 0
-                    while thread.is_alive():
-                        spinner = spinner_frames[frame % len(spinner_frames)]
-                        text = Text()
-                        text.append(f"  {spinner} ", style="cyan")
-                        text.append("Analyzing", style="cyan bold")
-                        text.append(f"  {stream_state['section']}", style="dim")
-                        if stream_state["preview"]:
-                            text.append(f'\n  "{stream_state["preview"]}..."', style="italic dim")
-                        live.update(text)
-                        frame += 1
-                        thread.join(timeout=0.1)
-
-                    thread.join()
-
-                if result_holder["error"]:
-                    raise Exception(result_holder["error"])
-
-                analysis = result_holder["analysis"]
-                coaching = result_holder["coaching"]
 
-            except Exception as e:
-                console.print(f"[yellow]AI coaching unavailable: {e}[/yellow]")
-                # Fall back to local prosody only
-                console.print("[dim]Falling back to local analysis...[/dim]")
-                analysis = analyze_prosody(audio_data, sample_rate)
+def _expand_audio_paths(paths: list[Path]) -> list[Path]:
+    """Replace directories with the audio files they contain, sorted by name."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in _AUDIO_SUFFIXES))
         else:
-            # LOCAL ONLY: Just prosody analysis
-            console.print("[dim]Analyzing prosody...[/dim]")
-            analysis = analyze_prosody(audio_data, sample_rate)
+            files.append(path)
+    return files
 
-        # Display local prosody results
-        if quick:
-            display_quick_feedback(analysis)
-        else:
-            display_analysis(analysis)
 
-        # Display AI coaching if available
-        if coaching:
-            display_coaching(coaching, console)
-            transcript = coaching.transcript
-            ai_summary = coaching.overall_feedback
-            ai_tips = coaching.coaching_tips
-            grammar_issues = coaching.grammar_issues
-            suggested_revision = coaching.suggested_revision
-            confidence_score = coaching.confidence_score
-            confidence_feedback = coaching.confidence_feedback
-            filler_word_count = coaching.filler_word_count
-            filler_words_detail = coaching.filler_words_detail
-            pronunciation_issues = coaching.pronunciation_issues
-            fluency_score = coaching.fluency_score
-            fluency_feedback = coaching.fluency_feedback
+def _analyze_one(path: Path, use_cache: bool):
+    """
+    Load and analyze one file in a batch worker process.
 
-        # Playback
-        if playback:
-            console.print("[dim]Playing back your recording...[/dim]")
-            play_audio(audio_data, sample_rate)
+    Decoding happens here, so the parent only sends paths and workers
+    never load PortAudio.
 
-        # Save session
-        save_session(
-            analysis,
-            mode="analyze",
-            transcript=transcript,
-            ai_summary=ai_summary,
-            ai_tips=ai_tips,
-            grammar_issues=grammar_issues,
-            suggested_revision=suggested_revision,
-            confidence_score=confidence_score,
-            confidence_feedback=confidence_feedback,
-            filler_word_count=filler_word_count,
-            filler_words_detail=filler_words_detail,
-            pronunciation_issues=pronunciation_issues,
-            fluency_score=fluency_score,
-            fluency_feedback=fluency_feedback,
-        )
+    Raises:
+        ValueError: If the file is shorter than one second
+    """
+    import soundfile as sf
+    from audio_files import load_audio_resampled
 
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Recording cancelled.[/yellow]")
-        raise typer.Exit(0)
-    except Exception as e:
-        console.print(f"\n[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    info = sf.info(path)
+    if info.frames / info.samplerate < 1.0:
+        raise ValueError("Audio too short. Need at least 1 second.")
+    audio_data, sample_rate = load_audio_resampled(path)
+    return cached_analyze(audio_data, sample_rate, path, use_cache)
 
 
-@app.command()
-def info():
+@_cli_errors("Batch analysis cancelled.")
+def _run_batch_analyze(files: list[Path], quick: bool, no_cache: bool) -> None:
     """
-    Display information about the prosody components analyzed.
+    Analyze several files, one worker process per core.
+
+    Workers decode and analyze their own files (see _analyze_one). Results
+    are shown and saved in the order the files were given.
     """
-    console.print()
-    console.print(Panel("[bold]The 5 Components of Prosody[/bold]", border_style="blue"))
+    from concurrent.futures import ProcessPoolExecutor
+    from feedback import display_analysis, display_quick_feedback
+    from storage import save_session
 
-    info_text = """
-[bold cyan]1. Pitch[/bold cyan] (Intonation)
-   The highness or lowness of your voice. English uses wide pitch
-   variation to convey meaning and emotion.
-   [dim]Target: 100-150 Hz variation range[/dim]
+    console.print(f"\n[bold blue]Analyzing {len(files)} files...[/bold blue]")
 
-[bold cyan]2. Volume[/bold cyan] (Stress)
-   Loudness variation between stressed and unstressed syllables.
-   English emphasizes important words by making them louder.
-   [dim]Target: 6-10 dB contrast between stressed/unstressed[/dim]
+    with ProcessPoolExecutor() as pool:
+        futures = [pool.submit(_analyze_one, path, not no_cache) for path in files]
 
-[bold cyan]3. Tempo[/bold cyan] (Speed)
-   Speaking rate and its variation. Good speakers vary speed for emphasis.
-   [dim]Target: 130-160 WPM with 15-25% variation[/dim]
+        for path, future in zip(files, futures):
+            console.print(f"\n[bold blue]File:[/bold blue] {path}")
+            try:
+                analysis = future.result()
+            except ValueError as e:
+                console.print(f"[red]{e}[/red]")
+                continue
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+                continue
 
-[bold cyan]4. Rhythm[/bold cyan] (Timing Pattern)
-   The timing between syllables. Spanish is syllable-timed (equal length),
-   English is stress-timed (stressed syllables longer).
-   [dim]Target: PVI of 55-65 (higher = more English-like)[/dim]
+            if quick:
+                display_quick_feedback(analysis)
+            else:
+                display_analysis(analysis)
+            save_session(analysis, mode="analyze")
+
+
+@_cli_errors("Recording cancelled.")
+def _run_analyze(
+    file: Optional[Path],
+    save: bool,
+    quick: bool,
+    coach: bool,
+    playback: bool,
+    no_cache: bool = False,
+) -> None:
+    """Record or load audio, analyze it and save the session (`analyze` body)."""
+    save_future = None
+    if file:
+        # Analyze existing file
+        console.print(f"\n[bold blue]Loading:[/bold blue] {file}")
+
+        # Reject short clips from the header alone, before decoding samples
+        import soundfile as sf
+
+        info = sf.info(file)
+        duration = info.frames / info.samplerate
+        if duration < 1.0:
+            console.print(f"[red]Audio too short ({duration:.1f} seconds). Need at least 1 second.[/red]")
+            raise typer.Exit(1)
 
-[bold cyan]5. Pauses[/bold cyan] (Strategic Silence)
-   Deliberate breaks in speech for emphasis and breathing.
-   [dim]Target: 3-5 pauses per 30 seconds, 0.5-1.5s each[/dim]
-"""
-    console.print(info_text)
+        from audio_files import load_audio_resampled
 
+        audio_data, sample_rate = load_audio_resampled(file)
+        console.print(f"[dim]Duration: {duration:.1f} seconds[/dim]\n")
+    else:
+        # Record new audio
+        from recorder import record_audio, save_recording
 
-@app.command()
-def tips():
-    """
-    Show tips for improving prosody as a Spanish speaker.
-    """
-    console.print()
-    console.print(Panel("[bold]Tips for Spanish Speakers[/bold]", border_style="green"))
+        console.print()
+        console.print(
+            Panel(
+                "[bold]Press Enter to stop recording[/bold]",
+                title="[bold blue]Recording[/bold blue]",
+                border_style="blue",
+            )
+        )
+
+        audio_data, sample_rate = record_audio()
+        duration = len(audio_data) / sample_rate
+
+        console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
+
+        if duration < 1.0:
+            console.print("[red]Recording too short. Please speak for at least 2 seconds.[/red]")
+            raise typer.Exit(1)
+
+        # Write the WAV in the background while prosody is analyzed
+        if save:
+            import concurrent.futures
+
+            writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            save_future = writer.submit(save_recording, audio_data, sample_rate)
+            writer.shutdown(wait=False)
+
+    # Only input that passed the length checks pays for the analysis stack
+    # (feedback pulls in analyzer and Praat) and the database
+    from recorder import play_audio
+    from feedback import display_analysis, display_quick_feedback
+    from storage import save_session
+
+    # Initialize result variables
+    transcript = None
+    ai_summary = None
+    ai_tips = None
+    grammar_issues = None
+    suggested_revision = None
+    confidence_score = None
+    confidence_feedback = None
+    filler_word_count = None
+    filler_words_detail = None
+    pronunciation_issues = None
+    fluency_score = None
+    fluency_feedback = None
+    analysis = None
+    coaching = None
+
+    if coach:
+        # PARALLEL MODE: Run prosody + Gemini simultaneously with streaming
+        import asyncio
+        from coach import analyze_parallel_async, display_coaching
+        from rich.live import Live
 
-    tips_text = """
-[bold yellow]Common Patterns to Avoid:[/bold yellow]
+        # Track streaming progress
+        stream_state = {"section": "Starting", "preview": "", "chunks": 0}
+        on_chunk = _stream_progress(stream_state)
 
-[bold]1. Monotone Speech[/bold]
-   Spanish speakers often use flatter pitch in English.
-   [green]Fix:[/green] Exaggerate pitch changes at first. Go higher on
-   stressed words, lower at sentence ends.
+        try:
+            # Chunks update stream_state from the event loop; Live's own
+            # refresh redraws the status, so nothing here polls
+            with Live(_StreamStatus(stream_state), console=console, refresh_per_second=10, transient=True):
+                analysis, coaching = asyncio.run(
+                    analyze_parallel_async(
+                        # Only file inputs can be re-sent unchanged; live takes would never hit
+                        audio_data, sample_rate, on_chunk, use_cache=file is not None and not no_cache
+                    )
+                )
+
+        except Exception as e:
+            console.print(f"[yellow]AI coaching unavailable: {e}[/yellow]")
+            # Fall back to local prosody only
+            console.print("[dim]Falling back to local analysis...[/dim]")
+            analysis = cached_analyze(audio_data, sample_rate, file, not no_cache)
+    else:
+        # LOCAL ONLY: Just prosody analysis
+        console.print("[dim]Analyzing prosody...[/dim]")
+        analysis = cached_analyze(audio_data, sample_rate, file, not no_cache)
 
-[bold]2. Equal Syllable Length[/bold]
-   Spanish gives equal time to each syllable. English doesn't.
-   [green]Fix:[/green] Stretch stressed syllables, rush through unstressed ones.
-   "COMfortable" not "com-for-ta-ble"
+    if save_future:
+        console.print(f"[dim]Saved to: {save_future.result()}[/dim]\n")
 
-[bold]3. Missing Reductions[/bold]
-   Unstressed vowels in English become "schwa" (uh).
-   [green]Fix:[/green] "to" -> "tuh", "for" -> "fer", "can" -> "cun"
+    # Display local prosody results
+    if quick:
+        display_quick_feedback(analysis)
+    else:
+        display_analysis(analysis)
+
+    # Playback in the background so results can be read meanwhile
+    player = None
+    if playback:
+        import threading
+
+        console.print("[dim]Playing back your recording...[/dim]")
+        # Files stream from disk at their original rate; recordings play from memory
+        source = (file,) if file else (audio_data, sample_rate)
+        player = threading.Thread(target=play_audio, args=source, daemon=True)
+        player.start()
+
+    # Display AI coaching if available
+    if coaching:
+        display_coaching(coaching, console)
+        transcript = coaching.transcript
+        ai_summary = coaching.overall_feedback
+        ai_tips = coaching.coaching_tips
+        grammar_issues = coaching.grammar_issues
+        suggested_revision = coaching.suggested_revision
+        confidence_score = coaching.confidence_score
+        confidence_feedback = coaching.confidence_feedback
+        filler_word_count = coaching.filler_word_count
+        filler_words_detail = coaching.filler_words_detail
+        pronunciation_issues = coaching.pronunciation_issues
+        fluency_score = coaching.fluency_score
+        fluency_feedback = coaching.fluency_feedback
+
+    # Save session
+    save_session(
+        analysis,
+        mode="analyze",
+        transcript=transcript,
+        ai_summary=ai_summary,
+        ai_tips=ai_tips,
+        grammar_issues=grammar_issues,
+        suggested_revision=suggested_revision,
+        confidence_score=confidence_score,
+        confidence_feedback=confidence_feedback,
+        filler_word_count=filler_word_count,
+        filler_words_detail=filler_words_detail,
+        pronunciation_issues=pronunciation_issues,
+        fluency_score=fluency_score,
+        fluency_feedback=fluency_feedback,
+    )
 
-[bold]4. No Strategic Pauses[/bold]
-   Spanish speakers often speak in continuous streams.
-   [green]Fix:[/green] Pause before important information to create anticipation.
+    # Let playback finish before the process exits
+    if player:
+        player.join()
 
-[bold]5. Harsh Intonation[/bold]
-   Falling pitch throughout can sound angry in English.
-   [green]Fix:[/green] Rise slightly on positive statements, only fall on negatives.
 
-[bold yellow]Practice Sentences:[/bold yellow]
+@app.command()
+def info():
+    """
+    Display information about the prosody components analyzed.
+    """
+    # Imported here: cli_text renders its markup at import time
+    from cli_text import show_info
 
-Try these with exaggerated prosody:
+    show_info(console)
 
-  "I THINK we should WAIT until TOMORROW."
-  (Stress caps, reduce others, pause after "think")
 
-  "That's INteresting! Tell me MORE about it."
-  (Rise on "interesting", fall on "more")
+@app.command()
+def tips():
+    """
+    Show tips for improving prosody as a Spanish speaker.
+    """
+    from cli_text import show_tips
 
-  "I NEver said she STOLE my MOney."
-  (Each word can be stressed for different meanings)
-"""
-    console.print(tips_text)
+    show_tips(console)
 
 
 @app.command()
@@ -391,6 +522,11 @@ def practice(
         "--save", "-s",
         help="Save the recording for later reference.",
     ),
+    loop: bool = typer.Option(
+        False,
+        "--loop",
+        help="Keep practicing new prompts in one session until you quit.",
+    ),
 ):
     """
     Practice reading specific texts with AI feedback.
@@ -404,179 +540,225 @@ def practice(
         prosody practice --id pro_1         # Specific prompt
         prosody practice --text "Hello"     # Custom text
         prosody practice --list             # Show all prompts
+        prosody practice stress --loop      # Back-to-back prompts
     """
-    try:
-        # List mode
-        if list_prompts:
-            console.print()
-            console.print(Panel("[bold]Available Practice Prompts[/bold]", border_style="blue"))
-            console.print()
-
-            for cat in get_all_categories():
-                console.print(f"[bold cyan]{cat.upper()}[/bold cyan]")
-                for p in get_prompts_by_category(cat):
-                    console.print(f"  [dim]{p['id']}:[/dim] {p['text'][:60]}...")
-                console.print()
-            return
-
-        # Get the prompt to practice
-        if text:
-            # Custom text
-            prompt_data = {
-                "id": "custom",
-                "text": text,
-                "tip": "Read naturally with good prosody.",
-                "focus": "all"
-            }
-        elif prompt_id:
-            # Specific prompt by ID
-            prompt_data = get_prompt_by_id(prompt_id)
-            if not prompt_data:
-                console.print(f"[red]Prompt '{prompt_id}' not found. Use --list to see available prompts.[/red]")
-                raise typer.Exit(1)
-        elif category:
-            # Random from category
-            prompts = get_prompts_by_category(category)
-            if not prompts:
-                console.print(f"[red]Category '{category}' not found. Options: {', '.join(get_all_categories())}[/red]")
-                raise typer.Exit(1)
-            prompt_data = get_random_prompt(category)
-        else:
-            # Random from all
-            prompt_data = get_random_prompt()
-
-        # Display the text to read
+    # List mode
+    if list_prompts:
         console.print()
-        console.print(Panel(
-            f"[bold white]{prompt_data['text']}[/bold white]",
-            title="[bold green]READ THIS TEXT[/bold green]",
-            border_style="green",
-            padding=(1, 2),
-        ))
-
-        if prompt_data.get("tip"):
-            console.print(f"[yellow]Tip:[/yellow] {prompt_data['tip']}")
-
-        if prompt_data.get("focus"):
-            console.print(f"[dim]Focus: {prompt_data['focus']}[/dim]")
-
-        # Play reference audio (TTS)
+        console.print(Panel("[bold]Available Practice Prompts[/bold]", border_style="blue"))
         console.print()
-        console.print("[bold cyan]🔊 Listen first...[/bold cyan]")
-        if not play_tts(prompt_data["text"]):
-            console.print("[dim]TTS unavailable - skipping reference audio[/dim]")
 
-        console.print()
-        console.print(
-            Panel(
-                "[bold]Press Enter to stop recording[/bold]",
-                title="[bold blue]Recording[/bold blue]",
-                border_style="blue",
-            )
-        )
-
-        # Record
-        audio_data, sample_rate = record_audio()
-        duration = get_duration(audio_data, sample_rate)
-        console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
+        console.print(_prompt_listing())
+        return
 
-        if duration < 1.0:
-            console.print("[red]Recording too short. Please read the full text.[/red]")
+    if loop:
+        if prompt_id or text:
+            console.print("[red]--loop picks a new prompt each round; it can't be combined with --id or --text.[/red]")
             raise typer.Exit(1)
+        try:
+            _practice_loop(category, playback, save)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Practice cancelled.[/yellow]")
+        return
 
-        if save:
-            filepath = save_recording(audio_data, sample_rate)
-            console.print(f"[dim]Saved to: {filepath}[/dim]\n")
+    _run_practice(category, prompt_id, text, playback, save)
+
+
+@_cli_errors("Practice cancelled.")
+def _run_practice(
+    category: Optional[str],
+    prompt_id: Optional[str],
+    text: Optional[str],
+    playback: bool,
+    save: bool,
+) -> None:
+    """Run one practice round: show a prompt, record, analyze and coach."""
+    from prompts import get_prompt_by_id, get_prompts_by_category, get_all_categories, get_random_prompt
+    from storage import save_session
+
+    # Get the prompt to practice
+    if text:
+        # Custom text
+        prompt_data = {
+            "id": "custom",
+            "text": text,
+            "tip": "Read naturally with good prosody.",
+            "focus": "all"
+        }
+    elif prompt_id:
+        # Specific prompt by ID
+        prompt_data = get_prompt_by_id(prompt_id)
+        if not prompt_data:
+            console.print(f"[red]Prompt '{prompt_id}' not found. Use --list to see available prompts.[/red]")
+            raise typer.Exit(1)
+    elif category:
+        # Random from category
+        prompts = get_prompts_by_category(category)
+        if not prompts:
+            console.print(f"[red]Category '{category}' not found. Options: {', '.join(get_all_categories())}[/red]")
+            raise typer.Exit(1)
+        prompt_data = get_random_prompt(category)
+    else:
+        # Random from all
+        prompt_data = get_random_prompt()
 
-        # Analyze prosody
-        console.print("[dim]Analyzing prosody...[/dim]")
-        analysis = analyze_prosody(audio_data, sample_rate)
-        display_analysis(analysis)
+    from recorder import record_audio, save_recording, play_audio, play_tts
+    from analyzer import analyze_prosody
+    from feedback import display_analysis
 
-        # Start AI request in background while playing back
-        import threading
-        from coach import analyze_with_coach_practice, display_coaching
+    # Display the text to read
+    console.print()
+    console.print(Panel(
+        f"[bold white]{prompt_data['text']}[/bold white]",
+        title="[bold green]READ THIS TEXT[/bold green]",
+        border_style="green",
+        padding=(1, 2),
+    ))
 
-        transcript = None
-        ai_summary = None
-        ai_tips = None
-        grammar_issues = None
-        suggested_revision = None
-        confidence_score = None
-        confidence_feedback = None
-        filler_word_count = None
-        filler_words_detail = None
-        pronunciation_issues = None
-        fluency_score = None
-        fluency_feedback = None
-        coaching_result = {"coaching": None, "error": None}
+    if prompt_data.get("tip"):
+        console.print(f"[yellow]Tip:[/yellow] {prompt_data['tip']}")
 
-        def fetch_coaching():
-            try:
-                coaching_result["coaching"] = analyze_with_coach_practice(
-                    audio_data, sample_rate, analysis, prompt_data["text"]
-                )
-            except Exception as e:
-                coaching_result["error"] = str(e)
+    if prompt_data.get("focus"):
+        console.print(f"[dim]Focus: {prompt_data['focus']}[/dim]")
 
-        # Start AI request in background
-        ai_thread = threading.Thread(target=fetch_coaching)
-        ai_thread.start()
+    # Play reference audio (TTS)
+    console.print()
+    console.print("[bold cyan]🔊 Listen first...[/bold cyan]")
+    if not play_tts(prompt_data["text"]):
+        console.print("[dim]TTS unavailable - skipping reference audio[/dim]")
 
-        # Playback while AI processes
-        if playback:
-            console.print("[dim]Playing back (AI processing in background)...[/dim]")
-            play_audio(audio_data, sample_rate)
+    console.print()
+    console.print(
+        Panel(
+            "[bold]Press Enter to stop recording[/bold]",
+            title="[bold blue]Recording[/bold blue]",
+            border_style="blue",
+        )
+    )
 
-        # Wait for AI to finish if still running
-        if ai_thread.is_alive():
-            console.print("[dim]Waiting for AI feedback...[/dim]")
-        ai_thread.join()
+    # Record
+    audio_data, sample_rate = record_audio()
+    duration = len(audio_data) / sample_rate
+    console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
 
-        # Display AI coaching results
-        if coaching_result["coaching"]:
-            coaching = coaching_result["coaching"]
-            display_coaching(coaching, console)
-            transcript = coaching.transcript
-            ai_summary = coaching.overall_feedback
-            ai_tips = coaching.coaching_tips
-            grammar_issues = coaching.grammar_issues
-            suggested_revision = coaching.suggested_revision
-            confidence_score = coaching.confidence_score
-            confidence_feedback = coaching.confidence_feedback
-            filler_word_count = coaching.filler_word_count
-            filler_words_detail = coaching.filler_words_detail
-            pronunciation_issues = coaching.pronunciation_issues
-            fluency_score = coaching.fluency_score
-            fluency_feedback = coaching.fluency_feedback
-        elif coaching_result["error"]:
-            console.print(f"[yellow]AI feedback unavailable: {coaching_result['error']}[/yellow]")
+    if duration < 1.0:
+        console.print("[red]Recording too short. Please read the full text.[/red]")
+        raise typer.Exit(1)
 
-        # Save session
-        save_session(
-            analysis,
-            mode="practice",
-            prompt_id=prompt_data.get("id"),
-            transcript=transcript,
-            ai_summary=ai_summary,
-            ai_tips=ai_tips,
-            grammar_issues=grammar_issues,
-            suggested_revision=suggested_revision,
-            confidence_score=confidence_score,
-            confidence_feedback=confidence_feedback,
-            filler_word_count=filler_word_count,
-            filler_words_detail=filler_words_detail,
-            pronunciation_issues=pronunciation_issues,
-            fluency_score=fluency_score,
-            fluency_feedback=fluency_feedback,
-        )
+    # Trim and FLAC-encode the audio for Gemini, and write the WAV, while
+    # prosody is analyzed; the coaching prompt needs the scores, but the
+    # upload payload and the saved file don't
+    import concurrent.futures
+    from coach import audio_to_flac_bytes
+
+    background = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    audio_bytes_future = background.submit(audio_to_flac_bytes, audio_data, sample_rate)
+    save_future = background.submit(save_recording, audio_data, sample_rate) if save else None
+    background.shutdown(wait=False)
+
+    # Analyze prosody
+    console.print("[dim]Analyzing prosody...[/dim]")
+    analysis = analyze_prosody(audio_data, sample_rate)
+
+    if save_future:
+        console.print(f"[dim]Saved to: {save_future.result()}[/dim]\n")
+    display_analysis(analysis)
+
+    # Start AI request in background while playing back
+    import threading
+    from coach import analyze_with_coach_practice, display_coaching
+
+    transcript = None
+    ai_summary = None
+    ai_tips = None
+    grammar_issues = None
+    suggested_revision = None
+    confidence_score = None
+    confidence_feedback = None
+    filler_word_count = None
+    filler_words_detail = None
+    pronunciation_issues = None
+    fluency_score = None
+    fluency_feedback = None
+    coaching_result = {"coaching": None, "error": None}
+
+    # Stream the response so progress shows while it generates
+    stream_state = {"section": "Starting", "preview": "", "chunks": 0}
+
+    def fetch_coaching():
+        try:
+            coaching_result["coaching"] = analyze_with_coach_practice(
+                audio_data, sample_rate, analysis, prompt_data["text"],
+                audio_bytes=audio_bytes_future.result(),
+                on_chunk=_stream_progress(stream_state),
+            )
+        except Exception as e:
+            coaching_result["error"] = str(e)
+
+    # Start AI request in background
+    ai_thread = threading.Thread(target=fetch_coaching)
+    ai_thread.start()
+
+    # Playback in the background while AI processes and results display
+    player = None
+    if playback:
+        console.print("[dim]Playing back (AI processing in background)...[/dim]")
+        player = threading.Thread(target=play_audio, args=(audio_data, sample_rate), daemon=True)
+        player.start()
+
+    # Wait for AI to finish if still running, showing streaming progress
+    if ai_thread.is_alive():
+        from rich.live import Live
+
+        with Live(console=console, refresh_per_second=4, transient=True) as live:
+            frame = 0
+            while ai_thread.is_alive():
+                live.update(_stream_status(stream_state, frame, "Waiting for AI feedback"))
+                frame += 1
+                ai_thread.join(timeout=0.1)
+    ai_thread.join()
+
+    # Display AI coaching results
+    if coaching_result["coaching"]:
+        coaching = coaching_result["coaching"]
+        display_coaching(coaching, console)
+        transcript = coaching.transcript
+        ai_summary = coaching.overall_feedback
+        ai_tips = coaching.coaching_tips
+        grammar_issues = coaching.grammar_issues
+        suggested_revision = coaching.suggested_revision
+        confidence_score = coaching.confidence_score
+        confidence_feedback = coaching.confidence_feedback
+        filler_word_count = coaching.filler_word_count
+        filler_words_detail = coaching.filler_words_detail
+        pronunciation_issues = coaching.pronunciation_issues
+        fluency_score = coaching.fluency_score
+        fluency_feedback = coaching.fluency_feedback
+    elif coaching_result["error"]:
+        console.print(f"[yellow]AI feedback unavailable: {coaching_result['error']}[/yellow]")
+
+    # Save session
+    save_session(
+        analysis,
+        mode="practice",
+        prompt_id=prompt_data.get("id"),
+        transcript=transcript,
+        ai_summary=ai_summary,
+        ai_tips=ai_tips,
+        grammar_issues=grammar_issues,
+        suggested_revision=suggested_revision,
+        confidence_score=confidence_score,
+        confidence_feedback=confidence_feedback,
+        filler_word_count=filler_word_count,
+        filler_words_detail=filler_words_detail,
+        pronunciation_issues=pronunciation_issues,
+        fluency_score=fluency_score,
+        fluency_feedback=fluency_feedback,
+    )
 
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Practice cancelled.[/yellow]")
-        raise typer.Exit(0)
-    except Exception as e:
-        console.print(f"\n[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    # Let playback finish before the process exits or the next prompt records
+    if player:
+        player.join()
 
 
 @app.command()
@@ -600,7 +782,10 @@ def train(
     """
     from rich.prompt import Prompt
     from coach import generate_tailored_prompt, analyze_with_coach_practice, display_coaching
-    from recorder import play_tts
+    from recorder import record_audio, play_audio, save_recording, play_tts
+    from analyzer import analyze_prosody
+    from feedback import display_analysis
+    from storage import get_user_weaknesses, save_session
 
     weaknesses = get_user_weaknesses(limit=10)
 
@@ -667,7 +852,7 @@ def train(
             console.print("\n[yellow]Training cancelled.[/yellow]")
             raise typer.Exit(0)
 
-        duration = get_duration(audio_data, sample_rate)
+        duration = len(audio_data) / sample_rate
         console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
 
         if duration < 1.0:
@@ -804,6 +989,9 @@ def rhythm(
         prosody rhythm --realtime   # Real-time streaming mode
     """
     from rich.prompt import Prompt
+    from recorder import record_audio, play_audio, play_tts
+    from analyzer import analyze_prosody
+    from prompts import get_rhythm_drill, get_random_rhythm_drill
     from feedback import (
         display_rhythm_progress,
         display_rhythm_feedback,
@@ -818,6 +1006,12 @@ def rhythm(
     )
     from config import RHYTHM_LEVEL_CONFIG
     from storage import (
+        get_rhythm_progress,
+        set_rhythm_baseline,
+        update_rhythm_progress,
+        save_rhythm_drill_attempt,
+        get_due_rhythm_drills,
+        get_available_levels,
         track_rhythm_issue,
         mark_rhythm_issue_resolved,
         get_rhythm_issues,
@@ -885,7 +1079,7 @@ def rhythm(
             ))
 
             audio_data, sample_rate = record_audio()
-            duration = get_duration(audio_data, sample_rate)
+            duration = len(audio_data) / sample_rate
             console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
 
             if duration < 2.0:
@@ -941,16 +1135,16 @@ def rhythm(
             console.print()
             raise typer.Exit(0)
 
-        level_config = RHYTHM_LEVEL_CONFIG.get(practice_level, {})
+        level_config = RHYTHM_LEVEL_CONFIG.get(practice_level)  # None for an unknown level
 
         # Show level intro
         console.print()
         console.print(Panel(
-            f"[bold]Level {practice_level}: {level_config.get('name', '')}[/bold]\n\n"
-            f"{level_config.get('description', '')}\n\n"
-            f"[dim]nPVI Target: {level_config.get('npvi_target', 50)}+ | "
-            f"Min Rhythm Score: {level_config.get('min_rhythm_score', 5)}/10 | "
-            f"Passes needed: {level_config.get('consecutive_passes', 3)}[/dim]",
+            f"[bold]Level {practice_level}: {level_config.name if level_config else ''}[/bold]\n\n"
+            f"{level_config.description if level_config else ''}\n\n"
+            f"[dim]nPVI Target: {level_config.npvi_target if level_config else 50}+ | "
+            f"Min Rhythm Score: {level_config.min_rhythm_score if level_config else 5}/10 | "
+            f"Passes needed: {level_config.consecutive_passes if level_config else 3}[/dim]",
             border_style="cyan",
         ))
 
@@ -1007,7 +1201,7 @@ def rhythm(
             ))
 
             audio_data, sample_rate = record_audio()
-            duration = get_duration(audio_data, sample_rate)
+            duration = len(audio_data) / sample_rate
             console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
 
             if duration < 1.0:
@@ -1055,8 +1249,8 @@ def rhythm(
             # Determine pass/fail
             npvi = analysis.rhythm.pvi
             rhythm_score = analysis.rhythm.score
-            npvi_target = level_config.get("npvi_target", 45)
-            min_rhythm = level_config.get("min_rhythm_score", 5)
+            npvi_target = level_config.npvi_target if level_config else 45
+            min_rhythm = level_config.min_rhythm_score if level_config else 5
 
             # Use AI judgment if available, otherwise use measured values
             if rhythm_result:
@@ -1146,7 +1340,6 @@ def rhythm(
                         # Force level unlock if AI recommends and not already unlocked
                         if not progress_update.get("next_level_unlocked"):
                             from storage import get_db, init_db
-                            from datetime import datetime
                             init_db()
                             with get_db() as db:
                                 db.execute(
@@ -1254,16 +1447,9 @@ def history(
 
     Shows recent sessions with scores and timestamps.
     """
-    from rich.table import Table
-    from datetime import datetime
+    from rich.table import Table  # Not loaded by typer/rich.console, unlike datetime
+    from storage import iter_history
 
-    sessions = get_history(limit=limit, mode=mode)
-
-    if not sessions:
-        console.print("\n[yellow]No sessions recorded yet. Run 'prosody analyze' to start.[/yellow]\n")
-        return
-
-    console.print()
     table = Table(title="Practice History", border_style="blue")
     table.add_column("ID", style="dim")
     table.add_column("Date", style="dim")
@@ -1276,12 +1462,10 @@ def history(
     table.add_column("Pauses", justify="center")
     table.add_column("Overall", justify="center", style="bold")
 
-    for s in sessions:
-        dt = datetime.fromisoformat(s["created_at"])
-        date_str = dt.strftime("%m/%d %H:%M")
+    for s in iter_history(limit=limit, mode=mode):
         table.add_row(
             str(s["id"]),
-            date_str,
+            s["date_str"],
             s["mode"],
             f"{s['duration']:.0f}s",
             str(s["pitch_score"]),
@@ -1292,6 +1476,11 @@ def history(
             f"{s['overall_score']:.1f}",
         )
 
+    if not table.row_count:
+        console.print("\n[yellow]No sessions recorded yet. Run 'prosody analyze' to start.[/yellow]\n")
+        return
+
+    console.print()
     console.print(table)
     console.print("[dim]Use 'prosody show <ID>' to view session details[/dim]")
     console.print()
@@ -1306,7 +1495,7 @@ def show(
 
     Shows all prosody feedback and AI coaching tips.
     """
-    from datetime import datetime
+    from storage import get_session
 
     session = get_session(session_id)
 
@@ -1321,36 +1510,38 @@ def show(
         border_style="blue"
     ))
 
-    # Basic info
-    console.print(f"\n[bold]Mode:[/bold] {session['mode']}")
-    console.print(f"[bold]Duration:[/bold] {session['duration']:.0f} seconds")
-    console.print(f"[bold]Overall Score:[/bold] {session['overall_score']}/10")
-
-    # Prosody feedback
-    console.print("\n[bold cyan]Prosody Analysis:[/bold cyan]")
-    console.print(f"  [bold]Pitch ({session['pitch_score']}/10):[/bold] {session.get('pitch_feedback', 'N/A')}")
-    console.print(f"  [bold]Volume ({session['volume_score']}/10):[/bold] {session.get('volume_feedback', 'N/A')}")
-    console.print(f"  [bold]Tempo ({session['tempo_score']}/10):[/bold] {session.get('tempo_feedback', 'N/A')}")
-    console.print(f"  [bold]Rhythm ({session['rhythm_score']}/10):[/bold] {session.get('rhythm_feedback', 'N/A')}")
-    console.print(f"  [bold]Pauses ({session['pause_score']}/10):[/bold] {session.get('pause_feedback', 'N/A')}")
+    # Collected and printed in one call: one render pass and one write
+    lines = [
+        # Basic info
+        f"\n[bold]Mode:[/bold] {session['mode']}",
+        f"[bold]Duration:[/bold] {session['duration']:.0f} seconds",
+        f"[bold]Overall Score:[/bold] {session['overall_score']}/10",
+        # Prosody feedback
+        "\n[bold cyan]Prosody Analysis:[/bold cyan]",
+        f"  [bold]Pitch ({session['pitch_score']}/10):[/bold] {session.get('pitch_feedback', 'N/A')}",
+        f"  [bold]Volume ({session['volume_score']}/10):[/bold] {session.get('volume_feedback', 'N/A')}",
+        f"  [bold]Tempo ({session['tempo_score']}/10):[/bold] {session.get('tempo_feedback', 'N/A')}",
+        f"  [bold]Rhythm ({session['rhythm_score']}/10):[/bold] {session.get('rhythm_feedback', 'N/A')}",
+        f"  [bold]Pauses ({session['pause_score']}/10):[/bold] {session.get('pause_feedback', 'N/A')}",
+    ]
 
     # Transcript
     if session.get("transcript"):
-        console.print("\n[bold cyan]Transcript:[/bold cyan]")
-        console.print(f"  {session['transcript']}")
+        lines.append("\n[bold cyan]Transcript:[/bold cyan]")
+        lines.append(f"  {session['transcript']}")
 
     # AI Summary
     if session.get("ai_summary"):
-        console.print("\n[bold cyan]AI Summary:[/bold cyan]")
-        console.print(f"  {session['ai_summary']}")
+        lines.append("\n[bold cyan]AI Summary:[/bold cyan]")
+        lines.append(f"  {session['ai_summary']}")
 
     # AI Tips
     if session.get("ai_tips"):
-        console.print("\n[bold cyan]AI Coaching Tips:[/bold cyan]")
-        for tip in session["ai_tips"]:
-            console.print(f"  • {tip}")
+        lines.append("\n[bold cyan]AI Coaching Tips:[/bold cyan]")
+        lines.extend(f"  • {tip}" for tip in session["ai_tips"])
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 @app.command()
@@ -1360,7 +1551,9 @@ def progress():
 
     Shows overall stats, averages, and trends.
     """
-    stats = get_stats()
+    from storage import get_progress_summary
+
+    stats = get_progress_summary()
 
     if stats["total_sessions"] == 0:
         console.print("\n[yellow]No sessions recorded yet. Run 'prosody analyze' to start.[/yellow]\n")
@@ -1370,37 +1563,41 @@ def progress():
     console.print(Panel("[bold]Your Progress[/bold]", border_style="green"))
 
     # Summary stats
-    console.print(f"\n[bold]Total Sessions:[/bold] {stats['total_sessions']}")
-    console.print(f"[bold]Total Practice Time:[/bold] {stats['total_practice_time']} minutes")
+    lines = [
+        f"\n[bold]Total Sessions:[/bold] {stats['total_sessions']}",
+        f"[bold]Total Practice Time:[/bold] {stats['total_practice_time']} minutes",
+    ]
 
     # Average scores
     if stats["averages"]:
-        console.print("\n[bold cyan]Average Scores:[/bold cyan]")
         avg = stats["averages"]
-        console.print(f"  Pitch:   {avg['pitch']}/10")
-        console.print(f"  Volume:  {avg['volume']}/10")
-        console.print(f"  Tempo:   {avg['tempo']}/10")
-        console.print(f"  Rhythm:  {avg['rhythm']}/10")
-        console.print(f"  Pauses:  {avg['pause']}/10")
-        console.print(f"  [bold]Overall: {avg['overall']}/10[/bold]")
+        lines += [
+            "\n[bold cyan]Average Scores:[/bold cyan]",
+            f"  Pitch:   {avg['pitch']}/10",
+            f"  Volume:  {avg['volume']}/10",
+            f"  Tempo:   {avg['tempo']}/10",
+            f"  Rhythm:  {avg['rhythm']}/10",
+            f"  Pauses:  {avg['pause']}/10",
+            f"  [bold]Overall: {avg['overall']}/10[/bold]",
+        ]
 
     # Trend
     if stats["recent_trend"] is not None:
         trend = stats["recent_trend"]
         if trend > 0:
-            console.print(f"\n[green]Trend: +{trend:.1f} (improving)[/green]")
+            lines.append(f"\n[green]Trend: +{trend:.1f} (improving)[/green]")
         elif trend < 0:
-            console.print(f"\n[red]Trend: {trend:.1f} (needs work)[/red]")
+            lines.append(f"\n[red]Trend: {trend:.1f} (needs work)[/red]")
         else:
-            console.print(f"\n[yellow]Trend: Steady[/yellow]")
+            lines.append(f"\n[yellow]Trend: Steady[/yellow]")
 
     # Best/worst components
-    bw = get_best_and_worst()
-    if bw["best"] and bw["worst"]:
-        console.print(f"\n[green]Strongest:[/green] {bw['best'][0].title()} ({bw['best'][1]}/10)")
-        console.print(f"[yellow]Focus on:[/yellow] {bw['worst'][0].title()} ({bw['worst'][1]}/10)")
+    if stats["best"] and stats["worst"]:
+        lines.append(f"\n[green]Strongest:[/green] {stats['best'][0].title()} ({stats['best'][1]}/10)")
+        lines.append(f"[yellow]Focus on:[/yellow] {stats['worst'][0].title()} ({stats['worst'][1]}/10)")
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 @app.callback(invoke_without_command=True)
@@ -1418,29 +1615,65 @@ def main(ctx: typer.Context):
     show_interactive_menu()
 
 
+# Interactive menus: static, so built once rather than on every loop iteration.
+# Markup is parsed here with console.render_str (the same call console.print
+# makes for a str), so redrawing a menu doesn't re-run the markup parser
+_MAIN_MENU = (
+    ("1", "Record and analyze your speech"),
+    ("2", "Practice with guided prompts"),
+    ("3", "Tailored training (based on your history)"),
+    ("4", "Rhythm training (stress-timed English)"),
+    ("5", "View your practice history"),
+    ("6", "View your progress stats"),
+    ("7", "Learn about prosody components"),
+    ("8", "Tips for Spanish speakers"),
+    ("q", "Exit"),
+)
+_MAIN_MENU_CHOICES = [key for key, _ in _MAIN_MENU]
+_MAIN_MENU_HEADER = Panel(
+    console.render_str("[bold]Prosody Coach[/bold]\n[dim]Improve your English speaking patterns[/dim]"),
+    border_style="blue",
+)
+# Items whose line never changes; 3 and 4 show live counts and levels
+_MAIN_MENU_STATIC_LINES = {
+    key: console.render_str(
+        f"  [dim]{key}[/dim]  [red]{desc}[/red]" if key == "q"
+        else f"  [bold cyan]{key}[/bold cyan]  {desc}"
+    )
+    for key, desc in _MAIN_MENU
+    if key not in ("3", "4")
+}
+
+_PRACTICE_MENU = (
+    ("1", "stress", "Stress - Word emphasis practice"),
+    ("2", "intonation", "Intonation - Pitch patterns"),
+    ("3", "rhythm", "Rhythm - Syllable timing"),
+    ("4", "reductions", "Reductions - Schwa and weak forms"),
+    ("5", "professional", "Professional - Business scenarios"),
+    ("6", "passages", "Passages - Longer readings"),
+    ("7", "random", "Random - Any category"),
+    ("b", "back", "Back to main menu"),
+)
+_PRACTICE_MENU_CATEGORIES = {key: cat for key, cat, _ in _PRACTICE_MENU}
+_PRACTICE_MENU_HEADER = Panel(
+    console.render_str("[bold]Practice Categories[/bold]\n[dim]Choose a focus area[/dim]"),
+    border_style="green",
+)
+_PRACTICE_MENU_ITEMS = console.render_str("\n".join(
+    f"  [dim]{key}[/dim]  [yellow]{desc}[/yellow]" if key == "b"
+    else f"  [bold cyan]{key}[/bold cyan]  {desc}"
+    for key, _, desc in _PRACTICE_MENU
+))
+
+
 def show_interactive_menu():
     """Display interactive menu for selecting actions."""
     from rich.prompt import Prompt
-    from storage import get_user_weaknesses, get_due_sounds, get_sound_stats, get_due_words, get_word_stats
-
-    menu_options = {
-        "1": ("analyze", "Record and analyze your speech"),
-        "2": ("practice", "Practice with guided prompts"),
-        "3": ("train", "Tailored training (based on your history)"),
-        "4": ("rhythm", "Rhythm training (stress-timed English)"),
-        "5": ("history", "View your practice history"),
-        "6": ("progress", "View your progress stats"),
-        "7": ("info", "Learn about prosody components"),
-        "8": ("tips", "Tips for Spanish speakers"),
-        "q": ("quit", "Exit"),
-    }
+    from storage import get_user_weaknesses, get_due_sounds, get_sound_stats, get_due_words, get_word_stats, get_rhythm_progress
 
     while True:
         console.print()
-        console.print(Panel(
-            "[bold]Prosody Coach[/bold]\n[dim]Improve your English speaking patterns[/dim]",
-            border_style="blue",
-        ))
+        console.print(_MAIN_MENU_HEADER)
 
         # Check for tailored training nudge
         weaknesses = get_user_weaknesses(limit=10)
@@ -1481,9 +1714,9 @@ def show_interactive_menu():
         rhythm_level = rhythm_progress.get("current_level", 1)
         rhythm_has_baseline = rhythm_progress.get("npvi_baseline") is not None
 
-        for key, (cmd, desc) in menu_options.items():
-            if key == "q":
-                console.print(f"  [dim]{key}[/dim]  [red]{desc}[/red]")
+        for key, desc in _MAIN_MENU:
+            if key in _MAIN_MENU_STATIC_LINES:
+                console.print(_MAIN_MENU_STATIC_LINES[key])
             elif key == "3":
                 # Highlight tailored training if data is available or sounds are due
                 if due_sounds:
@@ -1498,13 +1731,11 @@ def show_interactive_menu():
                     console.print(f"  [bold magenta]{key}[/bold magenta]  [magenta]{desc}[/magenta] L{rhythm_level}")
                 else:
                     console.print(f"  [bold cyan]{key}[/bold cyan]  {desc} [dim](new)[/dim]")
-            else:
-                console.print(f"  [bold cyan]{key}[/bold cyan]  {desc}")
 
         console.print()
         choice = Prompt.ask(
             "[bold]Select an option[/bold]",
-            choices=list(menu_options.keys()),
+            choices=_MAIN_MENU_CHOICES,
             default="1",
             show_choices=False,
         )
@@ -1515,7 +1746,10 @@ def show_interactive_menu():
         elif choice == "1":
             save = Prompt.ask("Save recording?", choices=["y", "n"], default="y") == "y"
             playback = Prompt.ask("Play back after?", choices=["y", "n"], default="y") == "y"
-            analyze(file=None, save=save, quick=False, coach=True, playback=playback)
+            try:
+                _run_analyze(None, save, quick=False, coach=True, playback=playback)
+            except typer.Exit:
+                pass  # Already reported; return to the menu
         elif choice == "2":
             show_practice_menu(Prompt)
         elif choice == "3":
@@ -1536,8 +1770,9 @@ def run_tailored_training(Prompt, weaknesses: dict):
     """Run tailored training session based on user's weaknesses."""
     from coach import generate_tailored_prompt, analyze_with_coach_practice, display_coaching
     from analyzer import analyze_prosody
-    from recorder import record_audio, play_audio, get_duration, save_recording, play_tts
-    from storage import save_session, get_due_sounds, update_sound_after_practice, get_due_words, update_word_after_practice
+    from recorder import record_audio, play_audio, save_recording, play_tts
+    from feedback import display_analysis
+    from storage import save_session, get_due_sounds, update_sound_after_practice, get_due_words, update_word_after_practice, normalize_sound_name
 
     if not weaknesses.get("sufficient_data"):
         console.print()
@@ -1636,7 +1871,7 @@ def run_tailored_training(Prompt, weaknesses: dict):
             console.print("\n[yellow]Recording cancelled.[/yellow]")
             break
 
-        duration = get_duration(audio_data, sample_rate)
+        duration = len(audio_data) / sample_rate
         console.print(f"[green]Done![/green] ({duration:.1f} seconds)\n")
 
         if duration < 1.0:
@@ -1758,7 +1993,7 @@ def run_tailored_training(Prompt, weaknesses: dict):
                 for issue in pronunciation_issues:
                     example = issue.get("example", "").lower()
                     # Extract word from example
-                    word_match = re.match(r'^([a-z]+)', example)
+                    word_match = _LEADING_WORD_RE.match(example)
                     if word_match:
                         flagged_words.add(word_match.group(1))
 
@@ -1790,34 +2025,15 @@ def run_tailored_training(Prompt, weaknesses: dict):
 
 def show_practice_menu(Prompt):
     """Display submenu for practice categories."""
-    categories = {
-        "1": ("stress", "Stress - Word emphasis practice"),
-        "2": ("intonation", "Intonation - Pitch patterns"),
-        "3": ("rhythm", "Rhythm - Syllable timing"),
-        "4": ("reductions", "Reductions - Schwa and weak forms"),
-        "5": ("professional", "Professional - Business scenarios"),
-        "6": ("passages", "Passages - Longer readings"),
-        "7": ("random", "Random - Any category"),
-        "b": ("back", "Back to main menu"),
-    }
-
     console.print()
-    console.print(Panel(
-        "[bold]Practice Categories[/bold]\n[dim]Choose a focus area[/dim]",
-        border_style="green",
-    ))
+    console.print(_PRACTICE_MENU_HEADER)
     console.print()
-
-    for key, (cat, desc) in categories.items():
-        if key == "b":
-            console.print(f"  [dim]{key}[/dim]  [yellow]{desc}[/yellow]")
-        else:
-            console.print(f"  [bold cyan]{key}[/bold cyan]  {desc}")
+    console.print(_PRACTICE_MENU_ITEMS)
 
     console.print()
     choice = Prompt.ask(
         "[bold]Select category[/bold]",
-        choices=list(categories.keys()),
+        choices=list(_PRACTICE_MENU_CATEGORIES),
         default="6",
         show_choices=False,
     )
@@ -1828,21 +2044,67 @@ def show_practice_menu(Prompt):
     save = Prompt.ask("Save recording?", choices=["y", "n"], default="y") == "y"
     playback = Prompt.ask("Play back after?", choices=["y", "n"], default="y") == "y"
 
-    cat_name = None if choice == "7" else categories[choice][0]
+    cat_name = None if choice == "7" else _PRACTICE_MENU_CATEGORIES[choice]
 
     # Practice loop - keep going until user quits
+    _practice_loop(cat_name, playback, save)
+
+
+# Markup for `practice --list`, built on first use; the catalog is static
+_PROMPT_LISTING: str | None = None
+
+
+def _prompt_listing() -> str:
+    """Return the practice prompt listing as one markup string."""
+    global _PROMPT_LISTING
+    if _PROMPT_LISTING is None:
+        from prompts import PRACTICE_PROMPTS
+
+        lines = []
+        for cat, prompts in PRACTICE_PROMPTS.items():
+            lines.append(f"[bold cyan]{cat.upper()}[/bold cyan]")
+            lines.extend(f"  [dim]{p['id']}:[/dim] {p['text'][:60]}..." for p in prompts)
+            lines.append("")
+        _PROMPT_LISTING = "\n".join(lines)
+    return _PROMPT_LISTING
+
+
+def _practice_loop(category: Optional[str], playback: bool, save: bool) -> None:
+    """
+    Run practice rounds back to back in this process until the user quits.
+
+    The analysis modules and the Gemini client are loaded once up front, so
+    every round after the first starts without import or connection setup.
+    """
+    import select
+    from rich.prompt import Prompt
+    from prompts import get_prompts_by_category, get_all_categories
+
+    # An unknown category would fail the same way every round
+    if category and not get_prompts_by_category(category):
+        console.print(f"[red]Category '{category}' not found. Options: {', '.join(get_all_categories())}[/red]")
+        raise typer.Exit(1)
+
+    # Warm up: imports, PortAudio initialization and the shared client
+    import analyzer, feedback, recorder  # noqa: F401
+    from coach import get_client
+    try:
+        get_client()
+    except ValueError:
+        pass  # No API key yet; each round reports it
+
     while True:
         try:
-            practice(category=cat_name, prompt_id=None, text=None, list_prompts=False, playback=playback, save=save)
-        except SystemExit:
-            pass  # Typer raises SystemExit on errors, ignore it
+            _run_practice(category, None, None, playback, save)
+        except typer.Exit as e:
+            if e.exit_code == 0:
+                return  # Ctrl-C: the round printed "Practice cancelled."; end the session
+            # Otherwise the round already reported its error; keep the session going
 
         console.print()
         console.print("[dim]─" * 40 + "[/dim]")
 
         # Drain any pending stdin (from orphaned input() in recording thread)
-        import sys
-        import select
         while select.select([sys.stdin], [], [], 0)[0]:
             sys.stdin.readline()
 
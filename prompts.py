@@ -148,13 +148,18 @@ PRACTICE_PROMPTS = {
 }
 
 
+# Lookup indexes over PRACTICE_PROMPTS, built once at import
+_PROMPTS_BY_ID = {
+    prompt["id"]: prompt
+    for prompts in PRACTICE_PROMPTS.values()
+    for prompt in prompts
+}
+_ALL_PROMPTS = list(_PROMPTS_BY_ID.values())
+
+
 def get_prompt_by_id(prompt_id: str) -> dict | None:
     """Get a specific prompt by its ID."""
-    for category, prompts in PRACTICE_PROMPTS.items():
-        for prompt in prompts:
-            if prompt["id"] == prompt_id:
-                return prompt
-    return None
+    return _PROMPTS_BY_ID.get(prompt_id)
 
 
 def get_prompts_by_category(category: str) -> list[dict]:
@@ -174,10 +179,7 @@ def get_random_prompt(category: str = None) -> dict:
     if category and category in PRACTICE_PROMPTS:
         prompts = PRACTICE_PROMPTS[category]
     else:
-        # Get all prompts
-        prompts = []
-        for cat_prompts in PRACTICE_PROMPTS.values():
-            prompts.extend(cat_prompts)
+        prompts = _ALL_PROMPTS
 
     return random.choice(prompts)
 
@@ -86,19 +86,21 @@ class RealtimeRhythmSession:
 
     def _get_system_instruction(self, drill: dict) -> str:
         """Build system instruction for Gemini Live with current drill context."""
+        # The prompt needs numeric targets, so an unknown level deliberately
+        # coaches against Level 1's
         level_config = RHYTHM_LEVEL_CONFIG.get(self.level, RHYTHM_LEVEL_CONFIG[1])
 
         return f"""You are a real-time English rhythm coach for a Spanish speaker. Provide IMMEDIATE, CONCISE feedback.
 
 CURRENT DRILL:
 Text: "{drill.get('text', '')}"
-Level: {self.level} - {level_config['name']}
+Level: {self.level} - {level_config.name}
 Focus: {drill.get('focus', '')}
 Technique: {drill.get('technique', '')}
 
 REQUIREMENTS:
-- nPVI Target: {level_config['npvi_target']}+
-- Min Rhythm Score: {level_config['min_rhythm_score']}/10
+- nPVI Target: {level_config.npvi_target}+
+- Min Rhythm Score: {level_config.min_rhythm_score}/10
 
 RESPONSE FORMAT (JSON only, no markdown):
 {{"transcript": "what they said", "rhythm_score": 7, "passed": true, "feedback": "Good stress on TODAY!", "word_issues": [], "encouragement": "Nice rhythm!"}}
@@ -404,15 +406,15 @@ async def run_realtime_rhythm_training(level: int, console: Console):
         return
 
     # Show intro
-    level_config = RHYTHM_LEVEL_CONFIG.get(level, {})
+    level_config = RHYTHM_LEVEL_CONFIG.get(level)  # None for an unknown level
     console.print()
     console.print(
         Panel(
             f"[bold yellow]EXPERIMENTAL - Real-Time Rhythm Training[/bold yellow]\n\n"
             f"[yellow]This feature is still in development and may not work correctly.[/yellow]\n"
             f"[dim]Use 'prosody rhythm' (without --realtime) for the stable version.[/dim]\n\n"
-            f"Level {level}: {level_config.get('name', '')}\n"
-            f"{level_config.get('description', '')}\n\n"
+            f"Level {level}: {level_config.name if level_config else ''}\n"
+            f"{level_config.description if level_config else ''}\n\n"
             f"[dim]- Speak naturally after seeing the prompt\n"
             f"- No Enter presses needed\n"
             f"- Say 'stop' or press 'q' to quit[/dim]",
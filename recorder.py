@@ -5,6 +5,7 @@ import numpy as np
 import sounddevice as sd
 import soundfile as sf
 import threading
+import queue
 import sys
 import io
 import tempfile
@@ -15,8 +16,7 @@ from typing import Optional, Tuple, AsyncGenerator
 from rich.live import Live
 from rich.text import Text
 
-from config import SAMPLE_RATE, CHANNELS, RECORDINGS_DIR, REALTIME_AUDIO_CHUNK_MS
-
+from config import SAMPLE_RATE, CHANNELS, DEFAULT_DURATION, RECORDINGS_DIR, REALTIME_AUDIO_CHUNK_MS
 
 def trim_silence(
     audio_data: np.ndarray,
@@ -47,19 +47,18 @@ def trim_silence(
     if window_size == 0:
         window_size = 1
 
-    # Pad audio to make it divisible by window size
-    pad_length = (window_size - len(audio_data) % window_size) % window_size
-    if pad_length > 0:
-        padded = np.pad(audio_data, (0, pad_length), mode='constant')
-    else:
-        padded = audio_data
-
-    # Reshape and calculate RMS per window
-    windows = padded.reshape(-1, window_size)
-    rms = np.sqrt(np.mean(windows ** 2, axis=1))
+    # Energy (sum of squares) per window in one pass over a reshaped view,
+    # without padding or squaring into a copy of the whole signal. A partial
+    # last window counts as zero-padded, as before.
+    n_full = len(audio_data) // window_size
+    windows = audio_data[:n_full * window_size].reshape(n_full, window_size)
+    energy = np.einsum('ij,ij->i', windows, windows)
+    tail = audio_data[n_full * window_size:]
+    if len(tail):
+        energy = np.append(energy, np.dot(tail, tail))
 
-    # Find windows above threshold
-    above_threshold = rms > threshold
+    # RMS above threshold, compared in the squared domain to skip the sqrt
+    above_threshold = energy > threshold ** 2 * window_size
 
     if not above_threshold.any():
         # All silence - return a small portion from the middle
@@ -115,9 +114,16 @@ def _record_until_enter() -> Tuple[np.ndarray, int]:
     SILENCE_THRESHOLD = 2.5  # Seconds of silence before auto-stop
     MIN_SPEECH_DURATION = 0.5  # Minimum speech before allowing auto-stop
 
-    audio_chunks = []
+    # Pre-sized int16 PCM buffer, doubled if a recording outgrows it.
+    # Capturing int16 halves buffer memory and feeds VAD without a cast;
+    # the result is promoted to float32 once when recording stops.
+    audio_buffer = np.zeros(DEFAULT_DURATION * SAMPLE_RATE, dtype=np.int16)
+    write_idx = 0
     recording = True
     stop_event = threading.Event()
+    # The stream callback only enqueues blocks; VAD and buffering run on a
+    # consumer thread so the audio thread never blocks on Python work
+    blocks: queue.Queue = queue.Queue()
 
     # VAD state
     vad = webrtcvad.Vad(2)  # Aggressiveness 0-3 (2 is balanced)
@@ -126,25 +132,34 @@ def _record_until_enter() -> Tuple[np.ndarray, int]:
     last_speech_time = None
 
     def callback(indata, frames, time, status):
-        nonlocal speech_detected, speech_start_time, last_speech_time
-
-        if not recording:
-            return
+        if recording:
+            blocks.put(indata.copy())
+
+    def consume_blocks():
+        """Buffer queued blocks and run VAD on them until the sentinel arrives."""
+        nonlocal audio_buffer, write_idx
+        while (block := blocks.get()) is not None:
+            samples = block[:, 0]
+            end = write_idx + len(samples)
+            if end > len(audio_buffer):
+                audio_buffer = np.concatenate(
+                    (audio_buffer, np.zeros(max(len(audio_buffer), len(samples)), dtype=np.int16))
+                )
+            audio_buffer[write_idx:end] = samples
+            write_idx = end
+            detect_speech(block)
 
-        audio_chunks.append(indata.copy())
+    def detect_speech(block):
+        nonlocal speech_detected, speech_start_time, last_speech_time
 
-        # Convert to 16-bit PCM for VAD
-        audio_float = indata.flatten()
+        # Blocks are already 16-bit PCM, as VAD expects
+        audio_16bit = block[:, 0]
 
         # Resample to VAD_SAMPLE_RATE using scipy
         if SAMPLE_RATE != VAD_SAMPLE_RATE:
             from scipy import signal
-            num_samples = int(len(audio_float) * VAD_SAMPLE_RATE / SAMPLE_RATE)
-            audio_resampled = signal.resample(audio_float, num_samples)
-        else:
-            audio_resampled = audio_float
-
-        audio_16bit = (audio_resampled * 32767).astype(np.int16)
+            num_samples = int(len(audio_16bit) * VAD_SAMPLE_RATE / SAMPLE_RATE)
+            audio_16bit = signal.resample(audio_16bit, num_samples).astype(np.int16)
 
         # Check VAD on 30ms frames
         if len(audio_16bit) >= VAD_FRAME_SIZE:
@@ -184,11 +199,14 @@ def _record_until_enter() -> Tuple[np.ndarray, int]:
     with sd.InputStream(
         samplerate=SAMPLE_RATE,
         channels=CHANNELS,
-        dtype=np.float32,
+        dtype=np.int16,
         callback=callback,
         blocksize=1024
     ):
         # Start threads
+        consumer_thread = threading.Thread(target=consume_blocks, daemon=True)
+        consumer_thread.start()
+
         enter_thread = threading.Thread(target=wait_for_enter, daemon=True)
         enter_thread.start()
 
@@ -200,7 +218,7 @@ def _record_until_enter() -> Tuple[np.ndarray, int]:
         with Live(refresh_per_second=4, transient=True) as live:
             while not stop_event.is_set():
                 indicator = anim_frames[frame_idx % len(anim_frames)]
-                elapsed = len(audio_chunks) * 1024 / SAMPLE_RATE
+                elapsed = write_idx / SAMPLE_RATE
 
                 text = Text()
                 text.append(f"  {indicator} ", style="bold red")
@@ -219,9 +237,15 @@ def _record_until_enter() -> Tuple[np.ndarray, int]:
 
         recording = False
 
-    if audio_chunks:
-        audio_data = np.concatenate(audio_chunks, axis=0)
-        return audio_data.flatten(), SAMPLE_RATE
+    # Drain whatever the callback queued before the stream closed
+    blocks.put(None)
+    consumer_thread.join()
+
+    if write_idx:
+        # Scale in place so only one float32 copy of the take is ever allocated
+        audio = audio_buffer[:write_idx].astype(np.float32)
+        audio *= 1.0 / 32768
+        return audio, SAMPLE_RATE
     else:
         return np.array([]), SAMPLE_RATE
 
@@ -236,7 +260,7 @@ def _record_fixed_duration(duration: float) -> Tuple[np.ndarray, int]:
         dtype=np.float32
     )
     sd.wait()
-    return audio_data.flatten(), SAMPLE_RATE
+    return audio_data.ravel(), SAMPLE_RATE  # (frames, 1) is contiguous: a view, not a copy
 
 
 def save_recording(
@@ -292,18 +316,45 @@ def get_duration(audio_data: np.ndarray, sample_rate: int) -> float:
     return len(audio_data) / sample_rate
 
 
-def play_audio(audio_data: np.ndarray, sample_rate: int) -> None:
+def play_audio(audio_data: np.ndarray | Path, sample_rate: Optional[int] = None) -> None:
     """
     Play audio through the default output device.
 
     Args:
-        audio_data: Audio samples as numpy array
-        sample_rate: Sample rate in Hz
+        audio_data: Audio samples as numpy array, or a path to an audio file
+            to stream from disk without loading it into memory
+        sample_rate: Sample rate in Hz (ignored for files)
     """
+    if isinstance(audio_data, (str, Path)):
+        _play_file(Path(audio_data))
+        return
+
     sd.play(audio_data, sample_rate)
     sd.wait()  # Wait until playback is finished
 
 
+def _play_file(filepath: Path) -> None:
+    """Stream a file to the output device block by block."""
+    finished = threading.Event()
+
+    with sf.SoundFile(filepath) as f:
+        def callback(outdata, frames, time, status):
+            data = f.read(frames, dtype='float32', always_2d=True)
+            outdata[:len(data)] = data
+            if len(data) < frames:
+                outdata[len(data):] = 0
+                raise sd.CallbackStop
+
+        with sd.OutputStream(
+            samplerate=f.samplerate,
+            channels=f.channels,
+            dtype=np.float32,
+            callback=callback,
+            finished_callback=finished.set,
+        ):
+            finished.wait()
+
+
 def play_tts(text: str, slow: bool = False) -> bool:
     """
     Generate and play text-to-speech audio.
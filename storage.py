@@ -1,13 +1,18 @@
 """SQLite storage for tracking progress over time."""
 
+import atexit
 import sqlite3
 import json
 import re
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import Iterator, Optional
 from config import DB_PATH, RHYTHM_LEVEL_CONFIG
 
 
+# Leading list marker: optional dash/bullet, then optional "1." or "1)"
+_LIST_MARKER_RE = re.compile(r'^(?:[-•]\s*)?(?:\d+[.)]\s*)?')
+
+
 def normalize_sound_name(sound: str) -> str:
     """
     Normalize a sound name by removing markdown formatting.
@@ -18,25 +23,40 @@ def normalize_sound_name(sound: str) -> str:
         '- SOUND: /θ/' -> 'sound: /θ/'
     """
     s = sound.strip()
-    # Remove leading dash/bullet and space
-    s = re.sub(r'^[-•]\s*', '', s)
-    # Remove leading numbers with dot or parenthesis
-    s = re.sub(r'^\d+[.)]\s*', '', s)
-    # Remove markdown bold markers
-    s = s.replace('**', '')
-    # Convert to lowercase and strip
-    return s.lower().strip()
+    # Plain names (the common case) have nothing to strip
+    if '**' not in s and s[:1] not in ('-', '•') and not s[:1].isdigit():
+        return s.lower()
+    # Remove the leading bullet and/or list number, then bold markers
+    s = _LIST_MARKER_RE.sub('', s, count=1)
+    return s.replace('**', '').lower().strip()
+
+
+# One connection per process, opened on first use; `with get_db() as db:`
+# still commits or rolls back each block as before
+_conn: Optional[sqlite3.Connection] = None
+_schema_ready = False
 
 
 def get_db() -> sqlite3.Connection:
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get the shared database connection (WAL mode, row factory)."""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _conn.row_factory = sqlite3.Row
+        # WAL lets menu reads proceed while a session is being written;
+        # NORMAL sync is durable across app crashes, fsyncs at checkpoints
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        atexit.register(_conn.close)
+    return _conn
 
 
 def init_db():
-    """Initialize database schema."""
+    """Initialize database schema (once per process)."""
+    global _schema_ready
+    if _schema_ready:
+        return
+
     with get_db() as db:
         db.execute("""
             CREATE TABLE IF NOT EXISTS sessions (
@@ -74,6 +94,10 @@ def init_db():
             CREATE INDEX IF NOT EXISTS idx_sessions_created_at
             ON sessions(created_at)
         """)
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_mode_created_at
+            ON sessions(mode, created_at)
+        """)
 
         # Migrate existing databases - add new columns if missing
         new_columns = [
@@ -187,6 +211,10 @@ def init_db():
             CREATE INDEX IF NOT EXISTS idx_rhythm_drills_level
             ON rhythm_drills(level)
         """)
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rhythm_drills_level_next_review
+            ON rhythm_drills(level, next_review)
+        """)
 
         # Rhythm issues tracking - specific problems identified by AI
         db.execute("""
@@ -230,6 +258,12 @@ def init_db():
                 rhythm_score_avg REAL
             )
         """)
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rhythm_mastery_evaluations_level_date
+            ON rhythm_mastery_evaluations(level, evaluation_date)
+        """)
+
+    _schema_ready = True
 
 
 def save_session(
@@ -398,6 +432,54 @@ def get_history(limit: int = 10, mode: Optional[str] = None) -> list[dict]:
         return [dict(row) for row in rows]
 
 
+# Columns shown in the history listing; transcripts and feedback text stay on
+# disk, and SQLite formats the timestamp so rows arrive ready to render
+_HISTORY_COLUMNS = (
+    "id, strftime('%m/%d %H:%M', created_at) AS date_str, mode, duration, "
+    "pitch_score, volume_score, tempo_score, rhythm_score, pause_score, overall_score"
+)
+
+
+def iter_history(limit: int = 10, mode: Optional[str] = None) -> Iterator[sqlite3.Row]:
+    """
+    Stream recent sessions for the history listing.
+
+    Filtering and limiting happen in SQLite, and only the listing columns
+    are read, so rows can be rendered as they come off the cursor.
+
+    Args:
+        limit: Maximum number of sessions to yield
+        mode: Filter by mode ('analyze' or 'practice')
+
+    Yields:
+        Session rows, newest first, with `date_str` as "MM/DD HH:MM"
+    """
+    init_db()
+
+    with get_db() as db:
+        if mode:
+            cursor = db.execute(
+                f"""
+                SELECT {_HISTORY_COLUMNS} FROM sessions
+                WHERE mode = ?
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (mode, limit),
+            )
+        else:
+            cursor = db.execute(
+                f"""
+                SELECT {_HISTORY_COLUMNS} FROM sessions
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+
+        yield from cursor
+
+
 def get_stats(days: int = 30) -> dict:
     """
     Get aggregate statistics for progress tracking.
@@ -408,75 +490,81 @@ def get_stats(days: int = 30) -> dict:
     Returns:
         Dictionary with stats
     """
-    init_db()
+    stats = get_progress_summary(days)
+    del stats["best"], stats["worst"]
+    return stats
 
-    with get_db() as db:
-        # Total sessions
-        total = db.execute(
-            "SELECT COUNT(*) as count FROM sessions"
-        ).fetchone()["count"]
 
-        if total == 0:
-            return {
-                "total_sessions": 0,
-                "total_practice_time": 0,
-                "averages": None,
-                "recent_trend": None,
-            }
+def get_progress_summary(days: int = 30) -> dict:
+    """
+    Get stats plus best and worst components in a single pass over sessions.
+
+    Args:
+        days: Number of days counted as recent for the trend
+
+    Returns:
+        Dictionary with get_stats() keys plus 'best' and 'worst'
+    """
+    init_db()
 
-        # Average scores (all time)
-        averages = db.execute(
+    with get_db() as db:
+        row = db.execute(
             """
             SELECT
+                COUNT(*) as total,
                 AVG(pitch_score) as pitch,
                 AVG(volume_score) as volume,
                 AVG(tempo_score) as tempo,
                 AVG(rhythm_score) as rhythm,
                 AVG(pause_score) as pause,
                 AVG(overall_score) as overall,
-                SUM(duration) as total_duration
+                SUM(duration) as total_duration,
+                AVG(CASE WHEN created_at >= datetime('now', :since)
+                    THEN overall_score END) as recent_avg,
+                AVG(CASE WHEN created_at < datetime('now', :since)
+                    THEN overall_score END) as older_avg
             FROM sessions
-            """
-        ).fetchone()
-
-        # Recent sessions (last N days) vs older
-        recent = db.execute(
-            """
-            SELECT AVG(overall_score) as avg_score
-            FROM sessions
-            WHERE created_at >= datetime('now', ?)
             """,
-            (f"-{days} days",),
+            {"since": f"-{days} days"},
         ).fetchone()
 
-        older = db.execute(
-            """
-            SELECT AVG(overall_score) as avg_score
-            FROM sessions
-            WHERE created_at < datetime('now', ?)
-            """,
-            (f"-{days} days",),
-        ).fetchone()
-
-        # Calculate trend
-        trend = None
-        if recent["avg_score"] and older["avg_score"]:
-            trend = recent["avg_score"] - older["avg_score"]
-
+    if row["total"] == 0:
         return {
-            "total_sessions": total,
-            "total_practice_time": round(averages["total_duration"] / 60, 1),  # minutes
-            "averages": {
-                "pitch": round(averages["pitch"], 1),
-                "volume": round(averages["volume"], 1),
-                "tempo": round(averages["tempo"], 1),
-                "rhythm": round(averages["rhythm"], 1),
-                "pause": round(averages["pause"], 1),
-                "overall": round(averages["overall"], 1),
-            },
-            "recent_trend": round(trend, 2) if trend else None,
+            "total_sessions": 0,
+            "total_practice_time": 0,
+            "averages": None,
+            "recent_trend": None,
+            "best": None,
+            "worst": None,
         }
 
+    # Calculate trend
+    trend = None
+    if row["recent_avg"] and row["older_avg"]:
+        trend = row["recent_avg"] - row["older_avg"]
+
+    scores = {
+        "pitch": row["pitch"],
+        "volume": row["volume"],
+        "tempo": row["tempo"],
+        "rhythm": row["rhythm"],
+        "pause": row["pause"],
+    }
+    best = max(scores, key=scores.get)
+    worst = min(scores, key=scores.get)
+
+    return {
+        "total_sessions": row["total"],
+        "total_practice_time": round(row["total_duration"] / 60, 1),  # minutes
+        "averages": {
+            **{name: round(score, 1) for name, score in scores.items()},
+            "overall": round(row["overall"], 1),
+        },
+        "recent_trend": round(trend, 2) if trend else None,
+        "best": (best, round(scores[best], 1)),
+        "worst": (worst, round(scores[worst], 1)),
+    }
+
 
 def get_session(session_id: int) -> Optional[dict]:
     """Get a single session by ID."""
@@ -501,43 +589,6 @@ def get_session(session_id: int) -> Optional[dict]:
         return None
 
 
-def get_best_and_worst() -> dict:
-    """Get best and worst performing components."""
-    init_db()
-
-    with get_db() as db:
-        row = db.execute(
-            """
-            SELECT
-                AVG(pitch_score) as pitch,
-                AVG(volume_score) as volume,
-                AVG(tempo_score) as tempo,
-                AVG(rhythm_score) as rhythm,
-                AVG(pause_score) as pause
-            FROM sessions
-            """
-        ).fetchone()
-
-        if not row or row["pitch"] is None:
-            return {"best": None, "worst": None}
-
-        scores = {
-            "pitch": row["pitch"],
-            "volume": row["volume"],
-            "tempo": row["tempo"],
-            "rhythm": row["rhythm"],
-            "pause": row["pause"],
-        }
-
-        best = max(scores, key=scores.get)
-        worst = min(scores, key=scores.get)
-
-        return {
-            "best": (best, round(scores[best], 1)),
-            "worst": (worst, round(scores[worst], 1)),
-        }
-
-
 def get_user_weaknesses(limit: int = 10) -> dict:
     """
     Analyze recent sessions to identify user's weak areas for tailored training.
@@ -1252,7 +1303,7 @@ def update_rhythm_progress(level: int, npvi: float, rhythm_score: int, passed: b
 
         # Check for level mastery
         level_config = RHYTHM_LEVEL_CONFIG[level]
-        required_passes = level_config["consecutive_passes"]
+        required_passes = level_config.consecutive_passes
         level_mastered = new_consecutive >= required_passes
 
         # Update database
@@ -1313,7 +1364,7 @@ def check_level_mastery(level: int) -> bool:
     if not level_data:
         return False
 
-    required = RHYTHM_LEVEL_CONFIG[level]["consecutive_passes"]
+    required = RHYTHM_LEVEL_CONFIG[level].consecutive_passes
     return level_data["consecutive_passes"] >= required
 
 
@@ -1819,9 +1870,9 @@ def get_level_mastery_data(level: int) -> dict:
             "resolved_issues_count": resolved_issues,
             "avg_npvi": round(avg_npvi, 1),
             "avg_rhythm_score": round(avg_rhythm, 1),
-            "npvi_target": RHYTHM_LEVEL_CONFIG[level]["npvi_target"],
-            "min_rhythm_score": RHYTHM_LEVEL_CONFIG[level]["min_rhythm_score"],
-            "min_unique_drills": RHYTHM_LEVEL_CONFIG[level].get("min_unique_drills", 3),
+            "npvi_target": RHYTHM_LEVEL_CONFIG[level].npvi_target,
+            "min_rhythm_score": RHYTHM_LEVEL_CONFIG[level].min_rhythm_score,
+            "min_unique_drills": RHYTHM_LEVEL_CONFIG[level].min_unique_drills,
         }
 
 
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Check that optimized analysis helpers match the loops they replaced."""
+
+import re
+
+import numpy as np
+import parselmouth
+from parselmouth.praat import call
+
+from analyzer import CONTOUR_TIME_STEP, compute_npvi, find_pauses, sample_intensity, to_intensity
+from storage import normalize_sound_name
+
+
+def _npvi_loop(intervals):
+    """The per-pair nPVI loop compute_npvi replaced."""
+    pvi_sum = 0
+    for i in range(len(intervals) - 1):
+        d1, d2 = intervals[i], intervals[i+1]
+        pvi_sum += abs(d1 - d2) / ((d1 + d2) / 2)
+    return (pvi_sum / (len(intervals) - 1)) * 100 if len(intervals) > 1 else 0
+
+
+def test_compute_npvi():
+    """compute_npvi on known intervals and against the old loop."""
+    assert compute_npvi([]) == 0.0
+    assert compute_npvi([0.2]) == 0.0
+    assert compute_npvi([0.2, 0.2, 0.2]) == 0.0
+    # |0.1 - 0.3| / 0.2 = 1.0 for the single pair
+    assert abs(compute_npvi([0.1, 0.3]) - 100.0) < 1e-9
+    # Pairs (0.1, 0.3) and (0.3, 0.3): (1.0 + 0.0) / 2
+    assert abs(compute_npvi([0.1, 0.3, 0.3]) - 50.0) < 1e-9
+
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        intervals = rng.uniform(0.05, 1.0, rng.integers(2, 40))
+        assert abs(compute_npvi(intervals) - _npvi_loop(list(intervals))) < 1e-9
+
+
+def _pauses_loop(times, intensity_values, threshold, min_pause):
+    """The per-frame pause loop find_pauses replaced."""
+    pauses = []
+    in_pause = False
+    pause_start = 0
+
+    for t, val in zip(times, intensity_values):
+        if val < threshold:
+            if not in_pause:
+                in_pause = True
+                pause_start = t
+        else:
+            if in_pause:
+                if t - pause_start >= min_pause:
+                    pauses.append((pause_start, t))
+                in_pause = False
+
+    # Handle pause at end
+    if in_pause and times[-1] - pause_start >= min_pause:
+        pauses.append((pause_start, times[-1]))
+    return pauses
+
+
+def test_find_pauses():
+    """find_pauses against the old loop, including pauses at either end."""
+    times = np.arange(10) * 0.1
+    # Quiet at the start, a short dip, and a pause running to the end
+    values = np.array([30, 30, 30, 60, 30, 60, 60, 30, 30, 30], dtype=float)
+    pauses = find_pauses(times, values, 40, 0.15)
+    assert pauses == _pauses_loop(times, values, 40, 0.15)
+    assert [(round(a, 6), round(b, 6)) for a, b in pauses] == [(0.0, 0.3), (0.7, 0.9)]
+    # Entirely quiet: one pause spanning the clip
+    assert find_pauses(times, np.zeros(10), 40, 0.15) == [(0.0, 0.9)]
+
+    rng = np.random.default_rng(0)
+    for _ in range(1000):
+        n = int(rng.integers(10, 300))
+        times = np.arange(n) * 0.01
+        values = rng.uniform(20.0, 80.0, n)
+        threshold = np.percentile(values, 25)
+        assert find_pauses(times, values, threshold, 0.03) == _pauses_loop(times, values, threshold, 0.03)
+
+
+def _sample_intensity_loop(intensity, time_step):
+    """The Praat-command sampling loop sample_intensity replaced."""
+    start_time = call(intensity, "Get start time")
+    end_time = call(intensity, "Get end time")
+
+    intensity_values = []
+    times = []
+    t = start_time
+    while t <= end_time:
+        value = call(intensity, "Get value at time", t, "cubic")
+        if value is not None and not np.isnan(value):
+            intensity_values.append(value)
+            times.append(t)
+        t += time_step
+    return np.array(times), np.array(intensity_values)
+
+
+def test_sample_intensity():
+    """sample_intensity against the old loop, at both sampling steps."""
+    sr = 16000
+    rng = np.random.default_rng(0)
+    for seconds in (0.3, 2.0):
+        n = int(seconds * sr)
+        t = np.arange(n) / sr
+        # Syllable-like bursts over low noise
+        envelope = (np.sin(2 * np.pi * 4 * t) > 0).astype(float)
+        audio = 0.5 * envelope * np.sin(2 * np.pi * 180 * t) + 0.01 * rng.standard_normal(n)
+        intensity = to_intensity(parselmouth.Sound(audio, sampling_frequency=sr))
+
+        for step in (call(intensity, "Get time step"), CONTOUR_TIME_STEP):
+            contour = sample_intensity(intensity, step)
+            times, values = _sample_intensity_loop(intensity, step)
+            assert len(values) > 0
+            assert np.array_equal(contour.times, times)
+            assert np.array_equal(contour.values, values)
+
+
+def _normalize_sound_name_re(sound):
+    """The two-pass re.sub version normalize_sound_name replaced."""
+    s = sound.strip()
+    s = re.sub(r'^[-•]\s*', '', s)
+    s = re.sub(r'^\d+[.)]\s*', '', s)
+    s = s.replace('**', '')
+    return s.lower().strip()
+
+
+def test_normalize_sound_name():
+    """normalize_sound_name on bullet, number and bold inputs, and against the old passes."""
+    assert normalize_sound_name("TH sound") == "th sound"
+    assert normalize_sound_name("- **TH**: /θ/") == "th: /θ/"
+    assert normalize_sound_name("• schwa") == "schwa"
+    assert normalize_sound_name("1. **V** vs B") == "v vs b"
+    assert normalize_sound_name("2) r ") == "r"
+    assert normalize_sound_name("- 3. **Z**") == "z"
+
+    pieces = ["", " ", "-", "•", "- ", "1", "12", ".", ")", "**", "TH", "/θ/", "a", "\t"]
+    rng = np.random.default_rng(0)
+    for _ in range(20000):
+        sound = "".join(rng.choice(pieces, int(rng.integers(0, 7))))
+        assert normalize_sound_name(sound) == _normalize_sound_name_re(sound), repr(sound)
+
+
+def main():
+    """Run all checks."""
+    test_compute_npvi()
+    test_find_pauses()
+    test_sample_intensity()
+    test_normalize_sound_name()
+    print("EQUIVALENCE CHECKS PASSED")
+
+
+if __name__ == "__main__":
+    main()